@@ -0,0 +1,296 @@
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+# The root of the repository, whose toy_gaussian and time_series packages are benchmarked.
+repository_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+
+
+def environment():
+    """
+    The environment of a benchmark process, which imports toy_gaussian and time_series from this repository rather \
+    than any installed copies.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [
+            repository_path,
+            os.path.join(repository_path, "time_series"),
+            env.get("PYTHONPATH", ""),
+        ]
+    )
+    return env
+
+
+def add_repository_to_path():
+    """
+    Import toy_gaussian and time_series from this repository in the benchmark's own process.
+    """
+    for path in (repository_path, os.path.join(repository_path, "time_series")):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def seconds_per_call(func, repeats=5):
+    """
+    The time of one call to a function, as the fastest of *repeats* timings of enough calls to take at least 0.2 \
+    seconds (see *timeit.Timer.autorange*).
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+
+def bytes_per_call(func):
+    """
+    The peak memory allocated by Python during one call to a function, measured with *tracemalloc*.
+    """
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def timings_from_process(code, python_options=()):
+    """
+    Run a benchmark in a new Python process and return the timings it prints, as a dictionary of names and seconds.
+
+    The benchmark's code must print its timings as a JSON dictionary on its last line of output.
+    """
+    output = subprocess.run(
+        [sys.executable, *python_options, "-c", code],
+        env=environment(),
+        cwd=repository_path,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    return json.loads(output.stdout.decode().strip().splitlines()[-1])
+
+
+def load_baseline(file_path):
+
+    try:
+        with open(file_path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def output_baseline(results, file_path):
+
+    with open(file_path, "w") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+
+
+def git_commit():
+
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=repository_path,
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(file_path):
+    """
+    The entries of a benchmark history file, which has one JSON entry per line.
+    """
+    try:
+        with open(file_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def append_history(results, file_path):
+    """
+    Append the results of a run of a benchmark suite to its history file, with the time, git commit, Python version \
+    and machine of the run.
+    """
+    entry = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "results": results,
+    }
+
+    with open(file_path, "a") as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+
+
+def baseline_from_history(history, window, machine=None):
+    """
+    The baseline of every benchmark in a history, which is its median over the last *window* runs (on *machine*, if \
+    input, since times on different machines are not comparable).
+    """
+    if machine is not None:
+        history = [entry for entry in history if entry.get("machine") == machine]
+
+    values = {}
+
+    for entry in history[-window:]:
+        for name, seconds in entry["results"].items():
+            values.setdefault(name, []).append(seconds)
+
+    return {name: median(seconds) for name, seconds in values.items()}
+
+
+def regressions_from(results, baseline, tolerance, minimum_seconds):
+    """
+    The benchmarks which are slower than their baseline, as a list of (name, baseline seconds, seconds).
+
+    A benchmark has regressed if it is more than *tolerance* (a fraction, e.g. 0.2 for 20%) slower than its baseline \
+    and more than *minimum_seconds* slower, so noise in very fast benchmarks is not reported. Benchmarks which are not \
+    in the baseline are ignored.
+    """
+    regressions = []
+
+    for name, seconds in sorted(results.items()):
+
+        if name not in baseline:
+            continue
+
+        baseline_seconds = baseline[name]
+
+        if (
+            seconds > baseline_seconds * (1.0 + tolerance)
+            and seconds - baseline_seconds > minimum_seconds
+        ):
+            regressions.append((name, baseline_seconds, seconds))
+
+    return regressions
+
+
+def median(values):
+    return statistics.median(values) if values else float("nan")
+
+
+def seconds_string(seconds):
+
+    if seconds < 1.0e-3:
+        return "{:.2f}us".format(seconds * 1.0e6)
+    if seconds < 1.0:
+        return "{:.3f}ms".format(seconds * 1.0e3)
+    return "{:.3f}s".format(seconds)
+
+
+def summary_lines(results, baseline=None):
+
+    lines = []
+
+    for name, seconds in sorted(results.items()):
+
+        line = "{:<60} {:>12}".format(name, seconds_string(seconds))
+
+        if baseline is not None and name in baseline:
+            line += "  (baseline {}, {:+.1f}%)".format(
+                seconds_string(baseline[name]),
+                100.0 * (seconds / baseline[name] - 1.0),
+            )
+
+        lines.append(line)
+
+    return lines
+
+
+def compare(results, baseline, tolerance, minimum_seconds):
+    """
+    Print the results of a benchmark suite next to its baseline and every regression, returning the exit code of \
+    the suite, which is 1 if any benchmark has regressed.
+    """
+    print("\n".join(summary_lines(results=results, baseline=baseline)))
+
+    regressions = regressions_from(
+        results=results,
+        baseline=baseline,
+        tolerance=tolerance,
+        minimum_seconds=minimum_seconds,
+    )
+
+    for name, baseline_seconds, seconds in regressions:
+        print(
+            "REGRESSION {}: {} -> {}".format(
+                name, seconds_string(baseline_seconds), seconds_string(seconds)
+            )
+        )
+
+    return 1 if regressions else 0
+
+
+def report(results, baseline_path, save_baseline, tolerance, minimum_seconds):
+    """
+    Compare the results of a benchmark suite with the baseline stored in a JSON file, returning the exit code of the \
+    suite. If *save_baseline* is *True* the results are written as the new baseline instead.
+    """
+    if save_baseline:
+        output_baseline(results=results, file_path=baseline_path)
+        print("\n".join(summary_lines(results=results)))
+        print("Baseline written to {}".format(baseline_path))
+        return 0
+
+    baseline = load_baseline(file_path=baseline_path)
+
+    if baseline is None:
+        print("\n".join(summary_lines(results=results)))
+        print(
+            "No baseline at {}, run with --save-baseline to store one.".format(
+                baseline_path
+            )
+        )
+        return 0
+
+    return compare(
+        results=results,
+        baseline=baseline,
+        tolerance=tolerance,
+        minimum_seconds=minimum_seconds,
+    )
+
+
+def report_with_history(
+    results, history_path, window, tolerance, minimum_seconds, record
+):
+    """
+    Compare the results of a benchmark suite with the median of its last *window* runs on this machine in its \
+    history file, returning the exit code of the suite. If *record* is *True* the results are appended to the history.
+    """
+    baseline = baseline_from_history(
+        history=load_history(file_path=history_path),
+        window=window,
+        machine=platform.node(),
+    )
+
+    exit_code = compare(
+        results=results,
+        baseline=baseline,
+        tolerance=tolerance,
+        minimum_seconds=minimum_seconds,
+    )
+
+    if record:
+        append_history(results=results, file_path=history_path)
+        print("Results appended to {}".format(history_path))
+
+    return exit_code
@@ -0,0 +1,244 @@
+"""
+Micro-benchmarks of the functions evaluated for every likelihood of a Gaussian model fit, which measure the effect of \
+every optimization of the profile code.
+
+The benchmarks time:
+
+- profile_image_from_grid, grid_to_elliptical_radii, transform_grid_to_reference_frame and \
+  move_grid_to_radial_minimum of a Gaussian, and the profile image of its FastGaussian;
+- a full Analysis.fit of a model instance of one or more Gaussians.
+
+Every benchmark is run for every grid shape (--shapes), sub-grid size (--sub-sizes) and kind of Gaussian (spherical \
+or elliptical, --kinds), and the fit also for every number of Gaussians (--totals). Each time is that of one call, the \
+fastest of several timings (see harness.seconds_per_call).
+
+Every run is appended to the machine-readable history 'likelihood_history.jsonl', one JSON entry per line holding \
+the time, git commit, Python version, machine and results of the run. The results of a run are compared with the \
+median of the last --window runs on the same machine, and the script exits with 1 if any benchmark is more than \
+--tolerance (a fraction) and --minimum-seconds slower.
+
+    python benchmarks/likelihood.py
+    python benchmarks/likelihood.py --shapes 50 --sub-sizes 1 --filter fit --no-record
+"""
+
+import argparse
+import functools
+import itertools
+import os
+import sys
+import tempfile
+
+import harness
+
+harness.add_repository_to_path()
+
+import autofit as af
+import autoarray as aa
+import toy_gaussian as toy
+from toy_gaussian.src.model import fast_gaussians, geometry_profiles
+
+pixel_scales = 0.1
+
+
+@geometry_profiles.move_grid_to_radial_minimum
+def grid_moved_to_radial_minimum(profile, grid):
+    return grid
+
+
+def configure():
+
+    af.conf.instance = af.conf.Config(
+        config_path=os.path.join(
+            harness.repository_path, "toy_gaussian", "workspace", "config"
+        ),
+        output_path=tempfile.mkdtemp(),
+    )
+
+
+def gaussians_from(kind, total):
+    """
+    A list of *total* spherical or elliptical Gaussians, spread over the centre of the grid.
+    """
+    gaussians = []
+
+    for index in range(total):
+
+        centre = (0.1 * index, -0.1 * index)
+
+        if kind == "spherical":
+            gaussians.append(
+                toy.SphericalGaussian(centre=centre, intensity=1.0, sigma=0.5)
+            )
+        else:
+            gaussians.append(
+                toy.EllipticalGaussian(
+                    centre=centre,
+                    axis_ratio=0.7,
+                    phi=30.0 + 10.0 * index,
+                    intensity=1.0,
+                    sigma=0.5,
+                )
+            )
+
+    return gaussians
+
+
+def profile_benchmarks(shapes, sub_sizes, kinds):
+    """
+    The profile function benchmarks, as a dictionary of their names and the function they time.
+    """
+    benchmarks = {}
+
+    for shape, sub_size, kind in itertools.product(shapes, sub_sizes, kinds):
+
+        grid = aa.grid.uniform(
+            shape_2d=(shape, shape), pixel_scales=pixel_scales, sub_size=sub_size
+        )
+
+        gaussian = gaussians_from(kind=kind, total=1)[0]
+        fast_gaussian = fast_gaussians.FastGaussian.from_gaussian(gaussian=gaussian)
+        transformed_grid = gaussian.transform_grid_to_reference_frame(grid)
+
+        label = "[{},shape={},sub={}]".format(kind, shape, sub_size)
+
+        benchmarks.update(
+            {
+                "profile_image_from_grid"
+                + label: functools.partial(gaussian.profile_image_from_grid, grid),
+                "fast_profile_image_from_grid"
+                + label: functools.partial(fast_gaussian.profile_image_from_grid, grid),
+                "grid_to_elliptical_radii"
+                + label: functools.partial(
+                    gaussian.grid_to_elliptical_radii, transformed_grid
+                ),
+                "transform_grid_to_reference_frame"
+                + label: functools.partial(
+                    gaussian.transform_grid_to_reference_frame, grid
+                ),
+                "move_grid_to_radial_minimum"
+                + label: functools.partial(
+                    grid_moved_to_radial_minimum, gaussian, transformed_grid
+                ),
+            }
+        )
+
+    return benchmarks
+
+
+def analysis_from(shape, sub_size):
+    """
+    The analysis of a phase fitting simulated imaging of a Gaussian, within a circular mask filling the grid.
+    """
+    grid = aa.grid.uniform(
+        shape_2d=(shape, shape), pixel_scales=pixel_scales, sub_size=1
+    )
+
+    imaging = aa.imaging.simulate(
+        image=toy.SphericalGaussian(intensity=10.0, sigma=0.5)
+        .profile_image_from_grid(grid=grid)
+        .in_1d_binned,
+        exposure_time=300.0,
+        background_level=1.0,
+        add_noise=True,
+    )
+
+    mask = aa.mask.circular(
+        shape_2d=(shape, shape),
+        pixel_scales=pixel_scales,
+        sub_size=sub_size,
+        radius=0.45 * shape * pixel_scales,
+    )
+
+    phase = toy.PhaseImaging(
+        phase_name="phase_likelihood_benchmark",
+        gaussians=af.CollectionPriorModel(gaussian_0=toy.SphericalGaussian),
+        optimizer_class=af.MultiNest,
+        sub_size=sub_size,
+    )
+
+    return phase.make_analysis(dataset=imaging, mask=mask)
+
+
+def fit_benchmarks(shapes, sub_sizes, totals, kinds):
+    """
+    The Analysis.fit benchmarks, as a dictionary of their names and the function they time.
+    """
+    benchmarks = {}
+
+    for shape, sub_size in itertools.product(shapes, sub_sizes):
+
+        analysis = analysis_from(shape=shape, sub_size=sub_size)
+
+        for total, kind in itertools.product(totals, kinds):
+
+            instance = af.ModelInstance()
+            instance.gaussians = gaussians_from(kind=kind, total=total)
+
+            name = "analysis_fit[{},shape={},sub={},gaussians={}]".format(
+                kind, shape, sub_size, total
+            )
+
+            benchmarks[name] = functools.partial(analysis.fit, instance=instance)
+
+    return benchmarks
+
+
+def integers_from(string):
+    return [int(value) for value in string.split(",")]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shapes", type=integers_from, default=[50, 150])
+    parser.add_argument("--sub-sizes", type=integers_from, default=[1, 2, 4])
+    parser.add_argument("--totals", type=integers_from, default=[1, 5])
+    parser.add_argument(
+        "--kinds",
+        type=lambda string: string.split(","),
+        default=["spherical", "elliptical"],
+    )
+    parser.add_argument("--filter", default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--window", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--minimum-seconds", type=float, default=1.0e-6)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument(
+        "--history",
+        default=os.path.join(harness.benchmarks_path, "likelihood_history.jsonl"),
+    )
+    args = parser.parse_args()
+
+    configure()
+
+    benchmarks = profile_benchmarks(
+        shapes=args.shapes, sub_sizes=args.sub_sizes, kinds=args.kinds
+    )
+    benchmarks.update(
+        fit_benchmarks(
+            shapes=args.shapes,
+            sub_sizes=args.sub_sizes,
+            totals=args.totals,
+            kinds=args.kinds,
+        )
+    )
+
+    results = {
+        name: harness.seconds_per_call(func=func, repeats=args.repeats)
+        for name, func in sorted(benchmarks.items())
+        if args.filter is None or args.filter in name
+    }
+
+    return harness.report_with_history(
+        results=results,
+        history_path=args.history,
+        window=args.window,
+        tolerance=args.tolerance,
+        minimum_seconds=args.minimum_seconds,
+        record=not args.no_record,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Benchmarks of the startup cost of toy_gaussian and time_series, which is paid by every process that uses them (e.g. \
+every worker of a parallel grid search).
+
+Every benchmark runs in new Python processes, so nothing is already imported or cached in memory:
+
+- import_toy_gaussian: 'import toy_gaussian'.
+- import_toy_gaussian_phase: 'import toy_gaussian' and its PhaseImaging (which imports the pipeline stack).
+- import_time_series: 'import time_series'.
+- phase_imaging: the first and second construction of a PhaseImaging in a process.
+- analysis_fit: making the analysis of a phase, and its first and second fit (the first fit reads the configs and \
+  compiles any Numba functions).
+
+Each benchmark is run in --repeats processes. Its 'cold' time is that of the first process (when e.g. the operating \
+system's file cache may not hold the modules) and its 'warm' time the median of the other processes. The import time \
+of every top-level package imported by toy_gaussian's pipeline is also broken down using 'python -X importtime', \
+taking the median over the same warm processes so it is compared with the baseline as reliably as the other times.
+
+The warm times are compared with the baseline in 'startup_baseline.json', and the script exits with 1 if any has \
+regressed. Run with --save-baseline to store the current times as the baseline.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --repeats 10 --save-baseline
+"""
+
+import argparse
+import collections
+import os
+import subprocess
+import sys
+
+import harness
+
+header = """
+import json
+import time
+timings = {}
+"""
+
+footer = """
+print(json.dumps(timings))
+"""
+
+config = """
+import tempfile
+import autofit as af
+af.conf.instance = af.conf.Config(
+    config_path="{}/toy_gaussian/workspace/config".format(os.getcwd()),
+    output_path=tempfile.mkdtemp(),
+)
+"""
+
+benchmarks = {
+    "import_toy_gaussian": """
+start = time.perf_counter()
+import toy_gaussian
+timings["import"] = time.perf_counter() - start
+""",
+    "import_toy_gaussian_phase": """
+start = time.perf_counter()
+import toy_gaussian
+toy_gaussian.PhaseImaging
+timings["import"] = time.perf_counter() - start
+""",
+    "import_time_series": """
+start = time.perf_counter()
+import time_series
+timings["import"] = time.perf_counter() - start
+""",
+    "phase_imaging": """
+import os
+start = time.perf_counter()
+import toy_gaussian as toy
+{config}
+timings["import"] = time.perf_counter() - start
+for name in ("first", "second"):
+    start = time.perf_counter()
+    toy.PhaseImaging(
+        phase_name="phase_startup_benchmark",
+        gaussians=af.CollectionPriorModel(gaussian_0=toy.SphericalGaussian),
+        optimizer_class=af.MultiNest,
+    )
+    timings[name] = time.perf_counter() - start
+""".format(
+        config=config
+    ),
+    "analysis_fit": """
+import os
+import autoarray as aa
+import toy_gaussian as toy
+{config}
+grid = aa.grid.uniform(shape_2d=(25, 25), pixel_scales=0.1, sub_size=1)
+imaging = aa.imaging.simulate(
+    image=toy.SphericalGaussian(intensity=10.0, sigma=0.5)
+    .profile_image_from_grid(grid=grid)
+    .in_1d_binned,
+    exposure_time=300.0,
+    background_level=1.0,
+    add_noise=True,
+)
+mask = aa.mask.circular(shape_2d=(25, 25), pixel_scales=0.1, sub_size=1, radius=1.0)
+phase = toy.PhaseImaging(
+    phase_name="phase_startup_benchmark",
+    gaussians=af.CollectionPriorModel(gaussian_0=toy.SphericalGaussian),
+    optimizer_class=af.MultiNest,
+    sub_size=1,
+)
+start = time.perf_counter()
+analysis = phase.make_analysis(dataset=imaging, mask=mask)
+timings["make_analysis"] = time.perf_counter() - start
+instance = phase.model.instance_from_unit_vector([0.5] * phase.model.prior_count)
+for name in ("first_fit", "second_fit"):
+    start = time.perf_counter()
+    analysis.fit(instance=instance)
+    timings[name] = time.perf_counter() - start
+""".format(
+        config=config
+    ),
+}
+
+
+def run_benchmark(code, repeats):
+    """
+    Run a benchmark in *repeats* new processes, returning its cold and warm time of every timing it prints.
+    """
+    runs = [
+        harness.timings_from_process(code=header + code + footer)
+        for _ in range(repeats)
+    ]
+
+    results = {}
+
+    for name in runs[0]:
+        results["{}.cold".format(name)] = runs[0][name]
+        results["{}.warm".format(name)] = harness.median(
+            [run[name] for run in runs[1:]]
+        )
+
+    return results
+
+
+def import_times_by_package(code):
+    """
+    The self import time of every top-level package imported by a snippet of code, in seconds, read from the output \
+    of 'python -X importtime'.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=harness.environment(),
+        cwd=harness.repository_path,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    times = collections.defaultdict(float)
+
+    for line in output.stderr.decode().splitlines():
+
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:") :].split("|")
+
+        try:
+            self_time = int(fields[0])
+        except ValueError:
+            continue
+
+        package = fields[2].strip().split(".")[0]
+        times[package] += self_time * 1.0e-6
+
+    return times
+
+
+def median_import_times_by_package(code, repeats):
+    """
+    The median self import time of every top-level package imported by a snippet of code over *repeats* processes, \
+    where the first process is discarded as cold like the first run of every benchmark (see *run_benchmark*). A \
+    package not imported by a process counts as 0 seconds in that process.
+    """
+    runs = [import_times_by_package(code=code) for _ in range(repeats)][1:]
+
+    packages = set(package for run in runs for package in run)
+
+    return {
+        package: harness.median([run.get(package, 0.0) for run in runs])
+        for package in packages
+    }
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--minimum-seconds", type=float, default=0.05)
+    parser.add_argument("--top-packages", type=int, default=10)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--baseline",
+        default=os.path.join(harness.benchmarks_path, "startup_baseline.json"),
+    )
+    args = parser.parse_args()
+
+    results = {}
+
+    for name, code in benchmarks.items():
+        for timing, seconds in run_benchmark(
+            code=code, repeats=max(2, args.repeats)
+        ).items():
+            results["{}.{}".format(name, timing)] = seconds
+
+    package_times = median_import_times_by_package(
+        code="import toy_gaussian; toy_gaussian.PhaseImaging",
+        repeats=max(2, args.repeats),
+    )
+
+    for package, seconds in sorted(
+        package_times.items(), key=lambda item: item[1], reverse=True
+    )[: args.top_packages]:
+        results["import_by_package.{}".format(package)] = seconds
+
+    cold_results = {
+        name: seconds for name, seconds in results.items() if name.endswith(".cold")
+    }
+    warm_results = {
+        name: seconds for name, seconds in results.items() if not name.endswith(".cold")
+    }
+
+    print("\n".join(harness.summary_lines(results=cold_results)))
+    print()
+
+    return harness.report(
+        results=warm_results,
+        baseline_path=args.baseline,
+        save_baseline=args.save_baseline,
+        tolerance=args.tolerance,
+        minimum_seconds=args.minimum_seconds,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
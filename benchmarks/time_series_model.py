@@ -0,0 +1,339 @@
+"""
+Benchmarks of the time_series model, which show how the cost of its fits scales with the size of the model.
+
+The benchmarks time:
+
+- LotkaVolteraModel.step, for a number of species;
+- CompoundObservable.pdf, for a number of species and points in the PDF;
+- SingleTimeAnalysis.fit, for a number of species, observables and points in the PDF;
+- TimeSeriesAnalysis.fit, for a number of species, observables and the span of timesteps fitted;
+- MatrixPriorModel.instance_for_arguments, for a number of species whose interactions are all free parameters.
+
+Every benchmark is run at a default size (--species, --observables, --span and --points) and then for every value of \
+one size at a time (e.g. --species-values), giving the complexity curve of the benchmark in that size. For every \
+point the calls per second and the peak memory allocated by one call are reported, and for every curve its \
+empirical exponent (the slope of log time against log size, e.g. 2 for a cost growing as the square of the number of \
+species).
+
+The times are appended to the history 'time_series_history.jsonl' and compared with the median of the last --window \
+runs on the same machine, as for benchmarks/likelihood.py. The curves are written to --curves as JSON, if input.
+
+    python benchmarks/time_series_model.py
+    python benchmarks/time_series_model.py --species-values 2,8,32,128 --no-record
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+
+import harness
+
+harness.add_repository_to_path()
+
+import autofit as af
+import time_series as ts
+from time_series import data as ts_data
+from time_series.lotka_voltera import LotkaVolteraModel
+
+sizes = ("species", "observables", "span", "points")
+
+
+def observable_from(rng):
+    return ts.Observable(mean=rng.uniform(0.0, 3.0), deviation=rng.uniform(0.5, 2.0))
+
+
+def species_list_from(rng, species, observables):
+    """
+    A list of species which each have a growth rate, observables named '0', '1', ... and interactions with every \
+    other species.
+    """
+    species_list = [
+        ts.Species(
+            growth_rate=rng.uniform(0.5, 1.5),
+            observables={
+                str(index): observable_from(rng=rng) for index in range(observables)
+            },
+        )
+        for _ in range(species)
+    ]
+
+    for species_a in species_list:
+        for species_b in species_list:
+            species_a[species_b] = rng.uniform(0.0, 0.1)
+
+    return species_list
+
+
+def data_from(rng, species, observables):
+
+    return ts.Data(
+        **{
+            str(index): ts.CompoundObservable(
+                abundances=[rng.uniform(0.0, 1.0) for _ in range(species)],
+                observables=[observable_from(rng=rng) for _ in range(species)],
+            )
+            for index in range(observables)
+        }
+    )
+
+
+def with_points(func, points):
+    """
+    Call a function with the PDFs of the data and models evaluated at *points* points.
+    """
+    number_of_points = ts_data.NUMBER_OF_POINTS
+    ts_data.NUMBER_OF_POINTS = points
+
+    try:
+        return func()
+    finally:
+        ts_data.NUMBER_OF_POINTS = number_of_points
+
+
+def lotka_voltera_step(rng, species, observables, span, points):
+
+    model = LotkaVolteraModel(
+        species_collection=ts.SpeciesCollection(
+            species_list_from(rng=rng, species=species, observables=0)
+        )
+    )
+    population = [rng.uniform(0.0, 1.0) for _ in range(species)]
+
+    return functools.partial(model.step, population)
+
+
+def compound_observable_pdf(rng, species, observables, span, points):
+
+    compound_observable = ts.CompoundObservable(
+        abundances=[rng.uniform(0.0, 1.0) for _ in range(species)],
+        observables=[observable_from(rng=rng) for _ in range(species)],
+    )
+
+    return functools.partial(
+        compound_observable.pdf,
+        ts_data.LOWER_LIMIT,
+        ts_data.UPPER_LIMIT,
+        points,
+    )
+
+
+def single_time_analysis_fit(rng, species, observables, span, points):
+
+    analysis = ts.SingleTimeAnalysis(
+        data_from(rng=rng, species=species, observables=observables)
+    )
+
+    instance = af.ModelInstance()
+    instance.abundances = [rng.uniform(0.0, 1.0) for _ in range(species)]
+    instance.species = species_list_from(
+        rng=rng, species=species, observables=observables
+    )
+
+    return functools.partial(
+        with_points, functools.partial(analysis.fit, instance), points
+    )
+
+
+def time_series_analysis_fit(rng, species, observables, span, points):
+
+    dataset = ts.TimeSeriesData(
+        {
+            timestep: data_from(rng=rng, species=species, observables=observables)
+            for timestep in sorted({max(1, span // 3), max(1, 2 * span // 3), span})
+        }
+    )
+
+    analysis = ts.TimeSeriesAnalysis(dataset)
+
+    instance = af.ModelInstance()
+    instance.abundances = [rng.uniform(0.0, 0.1) for _ in range(species)]
+    instance.species_collection = ts.SpeciesCollection(
+        species_list_from(rng=rng, species=species, observables=observables)
+    )
+
+    return functools.partial(
+        with_points, functools.partial(analysis.fit, instance), points
+    )
+
+
+def matrix_prior_model_instance_for_arguments(rng, species, observables, span, points):
+
+    model = ts.MatrixPriorModel(
+        ts.SpeciesCollection,
+        [ts.SpeciesPriorModel(ts.Species) for _ in range(species)],
+    )
+
+    for index_a in range(species):
+        for index_b in range(species):
+            model[index_a, index_b] = af.UniformPrior(lower_limit=0.0, upper_limit=0.1)
+
+    arguments = {
+        prior: prior.value_for(rng.uniform(0.0, 1.0)) for prior in model.priors
+    }
+
+    return lambda: model.instance_for_arguments(dict(arguments))
+
+
+# The benchmarks and the sizes each depends on, whose curves are measured.
+benchmarks = {
+    "lotka_voltera_step": (lotka_voltera_step, ("species",)),
+    "compound_observable_pdf": (compound_observable_pdf, ("species", "points")),
+    "single_time_analysis_fit": (
+        single_time_analysis_fit,
+        ("species", "observables", "points"),
+    ),
+    "time_series_analysis_fit": (
+        time_series_analysis_fit,
+        ("species", "observables", "span"),
+    ),
+    "matrix_prior_model_instance_for_arguments": (
+        matrix_prior_model_instance_for_arguments,
+        ("species",),
+    ),
+}
+
+
+def exponent_from(curve):
+    """
+    The empirical exponent of a complexity curve, as the least squares slope of log time against log size.
+    """
+    points = [
+        (math.log(size), math.log(seconds))
+        for size, seconds, _ in curve
+        if size > 0 and seconds > 0
+    ]
+
+    if len(points) < 2:
+        return float("nan")
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    if variance == 0.0:
+        return float("nan")
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def integers_from(string):
+    return [int(value) for value in string.split(",")]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--species", type=int, default=4)
+    parser.add_argument("--observables", type=int, default=2)
+    parser.add_argument("--span", type=int, default=100)
+    parser.add_argument("--points", type=int, default=40)
+    parser.add_argument(
+        "--species-values", type=integers_from, default=[2, 4, 8, 16, 32]
+    )
+    parser.add_argument(
+        "--observables-values", type=integers_from, default=[1, 2, 4, 8]
+    )
+    parser.add_argument("--span-values", type=integers_from, default=[10, 100, 1000])
+    parser.add_argument("--points-values", type=integers_from, default=[40, 400, 4000])
+    parser.add_argument("--filter", default=None)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--window", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--minimum-seconds", type=float, default=1.0e-6)
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--curves", default=None)
+    parser.add_argument(
+        "--history",
+        default=os.path.join(harness.benchmarks_path, "time_series_history.jsonl"),
+    )
+    args = parser.parse_args()
+
+    af.conf.instance = af.conf.Config(
+        config_path=os.path.join(
+            harness.repository_path, "time_series", "workspace", "config"
+        ),
+        output_path=tempfile.mkdtemp(),
+    )
+
+    defaults = {size: getattr(args, size) for size in sizes}
+
+    results = {}
+    curves = {}
+
+    for name, (benchmark, benchmark_sizes) in benchmarks.items():
+
+        if args.filter is not None and args.filter not in name:
+            continue
+
+        for size in benchmark_sizes:
+
+            curve = []
+
+            for value in getattr(args, "{}_values".format(size)):
+
+                func = benchmark(
+                    rng=random.Random(args.seed), **{**defaults, size: value}
+                )
+
+                seconds = harness.seconds_per_call(func=func, repeats=args.repeats)
+                memory = harness.bytes_per_call(func=func)
+
+                curve.append((value, seconds, memory))
+                results["{}[{}={}]".format(name, size, value)] = seconds
+
+            curves["{}[{}]".format(name, size)] = curve
+
+    for name, curve in sorted(curves.items()):
+
+        print("{} (exponent {:.2f})".format(name, exponent_from(curve=curve)))
+
+        for value, seconds, memory in curve:
+            print(
+                "    {:>8} {:>12} {:>14.1f} calls/s {:>12} bytes/call".format(
+                    value, harness.seconds_string(seconds), 1.0 / seconds, memory
+                )
+            )
+
+    print()
+
+    if args.curves is not None:
+        with open(args.curves, "w") as f:
+            json.dump(
+                {
+                    name: {
+                        "exponent": exponent_from(curve=curve),
+                        "points": [
+                            {
+                                "size": value,
+                                "seconds": seconds,
+                                "calls_per_second": 1.0 / seconds,
+                                "bytes_per_call": memory,
+                            }
+                            for value, seconds, memory in curve
+                        ],
+                    }
+                    for name, curve in curves.items()
+                },
+                f,
+                indent=4,
+            )
+
+    return harness.report_with_history(
+        results=results,
+        history_path=args.history,
+        window=args.window,
+        tolerance=args.tolerance,
+        minimum_seconds=args.minimum_seconds,
+        record=not args.no_record,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+import autofit as af
+from time_series.telemetry import Telemetry, TelemetryAnalysis
+
+
+class MockAnalysis(af.Analysis):
+    def __init__(self, data):
+        self.data = data
+
+    def fit(self, instance):
+        return 1.0
+
+    def visualize(self, instance, during_analysis):
+        pass
+
+
+@pytest.fixture(name="file_path")
+def make_file_path(tmpdir):
+    return f"{tmpdir}/telemetry.jsonl"
+
+
+@pytest.fixture(name="analysis")
+def make_analysis(file_path):
+    return TelemetryAnalysis(
+        MockAnalysis(0),
+        Telemetry(
+            file_path,
+            output_interval=1.0e8
+        )
+    )
+
+
+def test_attributes(analysis):
+    assert analysis.data == 0
+
+
+def test_fit(analysis, file_path):
+    assert analysis.fit(None) == 1.0
+    analysis.visualize(None, True)
+    analysis.telemetry.output(final=True)
+
+    with open(file_path) as f:
+        record, = [json.loads(line) for line in f]
+
+    assert record["final"] is True
+    assert record["evaluations"] == 1
+    assert set(record["fractions"]) == {
+        "likelihood",
+        "visualization",
+        "sampler"
+    }
@@ -1,4 +1,5 @@
 import autofit as af
+from time_series.telemetry import TelemetryAnalysis, telemetry_from
 
 
 class SingleTimePhase(af.Phase):
@@ -22,6 +23,23 @@ class SingleTimePhase(af.Phase):
         )
 
     def make_analysis(self, dataset):
-        return self.analysis_class(
+        analysis = self.analysis_class(
             dataset[self.data_index]
         )
+        telemetry = telemetry_from(
+            self.optimizer.paths.phase_output_path
+        )
+        if telemetry is None:
+            return analysis
+        return TelemetryAnalysis(
+            analysis,
+            telemetry
+        )
+
+    def run_analysis(self, analysis):
+        if not isinstance(analysis, TelemetryAnalysis):
+            return super().run_analysis(analysis)
+        analysis.telemetry.restart()
+        result = super().run_analysis(analysis)
+        analysis.telemetry.output(final=True)
+        return result
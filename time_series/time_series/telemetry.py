@@ -0,0 +1,190 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+
+import autofit as af
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    The peak resident set size of this process in bytes, or None where it
+    cannot be read (e.g. on Windows).
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(
+        resource.RUSAGE_SELF
+    ).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    if sys.platform == "darwin":
+        return peak_rss
+    return peak_rss * 1024
+
+
+class Telemetry:
+    def __init__(
+            self,
+            file_path: str,
+            output_interval: float = 30.0
+    ):
+        """
+        The throughput of a phase's non-linear search, written as a stream of
+        JSON-lines records every output_interval seconds and when the phase
+        finishes.
+
+        Each record holds the likelihood evaluations per second, the fraction
+        of the elapsed time spent in the likelihood, visualisation and the
+        non-linear search itself (the remainder) and the peak RSS of the
+        process.
+
+        Parameters
+        ----------
+        file_path
+            The JSON-lines file records are appended to.
+        output_interval
+            The number of seconds between records.
+        """
+        self.file_path = file_path
+        self.output_interval = output_interval
+        self.restart()
+
+    def restart(self):
+        """
+        Restart the telemetry when the non-linear search starts.
+        """
+        self.likelihood_seconds = 0.0
+        self.visualization_seconds = 0.0
+        self.evaluations = 0
+        self.start = time.perf_counter()
+        self.last_output = self.start
+        self.last_evaluations = 0
+
+    def add_likelihood(self, seconds: float):
+        self.likelihood_seconds += seconds
+        self.evaluations += 1
+        if time.perf_counter() - self.last_output >= self.output_interval:
+            self.output()
+
+    def add_visualization(self, seconds: float):
+        self.visualization_seconds += seconds
+
+    def record(self, final: bool = False) -> dict:
+        now = time.perf_counter()
+        elapsed_seconds = now - self.start
+        interval_seconds = now - self.last_output
+
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "final": final,
+            "elapsed_seconds": elapsed_seconds,
+            "evaluations": self.evaluations,
+            "evaluations_per_second": None,
+            "interval_evaluations_per_second": None,
+            "fractions": {},
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+        if interval_seconds > 0.0:
+            record["interval_evaluations_per_second"] = (
+                    self.evaluations - self.last_evaluations
+            ) / interval_seconds
+        if elapsed_seconds > 0.0:
+            record["evaluations_per_second"] = self.evaluations / elapsed_seconds
+            record["fractions"] = {
+                "likelihood": self.likelihood_seconds / elapsed_seconds,
+                "visualization": self.visualization_seconds / elapsed_seconds,
+                "sampler": max(
+                    0.0,
+                    1.0 - (
+                            self.likelihood_seconds + self.visualization_seconds
+                    ) / elapsed_seconds
+                ),
+            }
+        return record
+
+    def output(self, final: bool = False):
+        """
+        Append a record to the telemetry file.
+        """
+        record = self.record(final=final)
+        with open(self.file_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        self.last_output = time.perf_counter()
+        self.last_evaluations = self.evaluations
+
+
+class TelemetryAnalysis(af.Analysis):
+    def __init__(
+            self,
+            analysis: af.Analysis,
+            telemetry: Telemetry
+    ):
+        """
+        Wraps an analysis, timing each call to its fit and visualize methods.
+
+        Any other attribute is taken from the wrapped analysis.
+
+        Parameters
+        ----------
+        analysis
+            The analysis of a phase
+        telemetry
+            Records the time spent in the analysis
+        """
+        self.analysis = analysis
+        self.telemetry = telemetry
+
+    def __getattr__(self, item):
+        if item in ("analysis", "telemetry"):
+            raise AttributeError(item)
+        return getattr(self.analysis, item)
+
+    def fit(self, instance: af.ModelInstance) -> float:
+        start = time.perf_counter()
+        try:
+            return self.analysis.fit(instance)
+        finally:
+            self.telemetry.add_likelihood(
+                time.perf_counter() - start
+            )
+
+    def visualize(self, instance, during_analysis):
+        start = time.perf_counter()
+        try:
+            return self.analysis.visualize(
+                instance,
+                during_analysis
+            )
+        finally:
+            self.telemetry.add_visualization(
+                time.perf_counter() - start
+            )
+
+
+def telemetry_from(phase_output_path: str) -> Optional[Telemetry]:
+    """
+    The telemetry of a phase if the telemetry general config option is on.
+
+    Records are written to telemetry.jsonl in the folder of the phase's
+    output.log (the log_file general config option).
+    """
+    if not af.conf.instance.general.get("output", "telemetry", bool):
+        return None
+    log_file = af.conf.instance.general.get(
+        "output", "log_file", str
+    ).replace(" ", "")
+    log_path = os.path.dirname(f"{phase_output_path}/{log_file}")
+    os.makedirs(log_path, exist_ok=True)
+    return Telemetry(
+        f"{log_path}/telemetry.jsonl",
+        output_interval=af.conf.instance.general.get(
+            "output", "telemetry_interval", float
+        )
+    )
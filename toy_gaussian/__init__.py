@@ -1,34 +1,70 @@
-from autoarray import conf
-from autoarray import plot
-from autoarray.mask.mask import Mask as mask
-from autoarray.structures.arrays import Array as array
-from autoarray.structures.grids import (
-    Grid as grid,
-    GridIrregular as grid_irregular,
-    GridRectangular as grid_rectangular,
-    GridVoronoi as grid_voronoi,
-    Coordinates as positions,
-)
-from autoarray.structures.kernel import Kernel as kernel
-from autoarray.structures.visibilities import Visibilities as visibilities
-from autoarray.dataset.imaging import Imaging as imaging
-from autoarray.dataset.interferometer import Interferometer as interferometer
-from autoarray.dataset import data_converter
-from autoarray.operators.convolver import Convolver as convolver
-from autoarray.operators.transformer import Transformer as transformer
-from autoarray.operators.inversion.mappers import mapper
-from autoarray.operators.inversion.inversions import inversion
-from autoarray.operators.inversion import pixelizations as pix, regularization as reg
-from autoarray import plot
-
-from toy_gaussian.src import dimensions as dim
-from toy_gaussian.src import plot
-from toy_gaussian.src.model.gaussians import SphericalGaussian, EllipticalGaussian
-
-from toy_gaussian.src.pipeline.phase.abstract.phase import AbstractPhase
-from toy_gaussian.src.pipeline.phase.dataset.phase import PhaseDataset
-from toy_gaussian.src.pipeline.phase.imaging.phase import PhaseImaging
-
-from toy_gaussian.src.pipeline.pipeline import PipelineDataset, PipelineSettings
-from toy_gaussian.src.pipeline.pipeline_settings import PipelineGeneralSettings
-from toy_gaussian.src.pipeline import phase_tagging
+import importlib
+
+# The attributes of the package, as the module each is imported from and the name of the attribute in that module (or
+# None for the module itself). An attribute is only imported the first time it is used, so importing toy_gaussian
+# costs only what is used, e.g. a worker process which only evaluates Gaussians never imports the plotting modules
+# (and matplotlib) or the inversion modules.
+lazy_attributes = {
+    "conf": ("autoarray", "conf"),
+    "mask": ("autoarray.mask.mask", "Mask"),
+    "array": ("autoarray.structures.arrays", "Array"),
+    "grid": ("autoarray.structures.grids", "Grid"),
+    "grid_irregular": ("autoarray.structures.grids", "GridIrregular"),
+    "grid_rectangular": ("autoarray.structures.grids", "GridRectangular"),
+    "grid_voronoi": ("autoarray.structures.grids", "GridVoronoi"),
+    "positions": ("autoarray.structures.grids", "Coordinates"),
+    "kernel": ("autoarray.structures.kernel", "Kernel"),
+    "visibilities": ("autoarray.structures.visibilities", "Visibilities"),
+    "imaging": ("autoarray.dataset.imaging", "Imaging"),
+    "interferometer": ("autoarray.dataset.interferometer", "Interferometer"),
+    "data_converter": ("autoarray.dataset.data_converter", None),
+    "convolver": ("autoarray.operators.convolver", "Convolver"),
+    "transformer": ("autoarray.operators.transformer", "Transformer"),
+    "mapper": ("autoarray.operators.inversion.mappers", "mapper"),
+    "inversion": ("autoarray.operators.inversion.inversions", "inversion"),
+    "pix": ("autoarray.operators.inversion.pixelizations", None),
+    "reg": ("autoarray.operators.inversion.regularization", None),
+    "dim": ("toy_gaussian.src.dimensions", None),
+    "plot": ("toy_gaussian.src.plot", None),
+    "aggregator": ("toy_gaussian.src.aggregator", None),
+    "SphericalGaussian": ("toy_gaussian.src.model.gaussians", "SphericalGaussian"),
+    "EllipticalGaussian": ("toy_gaussian.src.model.gaussians", "EllipticalGaussian"),
+    "AbstractPhase": (
+        "toy_gaussian.src.pipeline.phase.abstract.phase",
+        "AbstractPhase",
+    ),
+    "PhaseDataset": ("toy_gaussian.src.pipeline.phase.dataset.phase", "PhaseDataset"),
+    "PhaseImaging": ("toy_gaussian.src.pipeline.phase.imaging.phase", "PhaseImaging"),
+    "as_grid_search": ("toy_gaussian.src.pipeline.grid_search", "as_grid_search"),
+    "SuccessiveHalving": ("toy_gaussian.src.pipeline.grid_search", "SuccessiveHalving"),
+    "PipelineDataset": ("toy_gaussian.src.pipeline.pipeline", "PipelineDataset"),
+    "PipelineSettings": ("toy_gaussian.src.pipeline.pipeline", "PipelineSettings"),
+    "PipelineGeneralSettings": (
+        "toy_gaussian.src.pipeline.pipeline_settings",
+        "PipelineGeneralSettings",
+    ),
+    "phase_tagging": ("toy_gaussian.src.pipeline.phase_tagging", None),
+}
+
+__all__ = list(lazy_attributes)
+
+
+def __getattr__(name):
+
+    try:
+        module_name, attribute_name = lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(
+            "module {} has no attribute {}".format(__name__, name)
+        ) from None
+
+    module = importlib.import_module(module_name)
+    value = module if attribute_name is None else getattr(module, attribute_name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(lazy_attributes))
@@ -0,0 +1,4 @@
+from .thumbnails import output_thumbnails
+from .results_store import ResultsStore
+from . import stream
+from . import posterior
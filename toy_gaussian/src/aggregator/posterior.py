@@ -0,0 +1,156 @@
+import multiprocessing
+import os
+
+import numpy as np
+
+from toy_gaussian.src.pipeline.grid_search import available_cores
+
+
+def optimizer_path_from_phase_output(phase_output):
+    """
+    The directory of a phase output which contains the MultiNest samples and parameter names.
+    """
+    return "{}/optimizer".format(phase_output.directory)
+
+
+def param_names_from_optimizer_path(optimizer_path):
+    """
+    The names of the parameters of a MultiNest fit, read from its 'multinest.paramnames' file.
+    """
+    with open("{}/multinest.paramnames".format(optimizer_path)) as f:
+        return [line.split()[0] for line in f if line.strip()]
+
+
+def memory_mapped_samples_from_optimizer_path(optimizer_path):
+    """
+    The MultiNest samples of a fit as a memory-mapped array of shape (total_samples, 2 + total_parameters), whose \
+    columns are the weight, -2 times the log likelihood and the parameters of every sample.
+
+    The samples are read from MultiNest's text file 'multinest.txt' once and stored in the binary file \
+    'multinest_samples.npy', which is memory-mapped by every later read and made again if the text file is newer.
+    """
+    text_path = "{}/multinest.txt".format(optimizer_path)
+    binary_path = "{}/multinest_samples.npy".format(optimizer_path)
+
+    if not os.path.exists(binary_path) or os.path.getmtime(
+        binary_path
+    ) < os.path.getmtime(text_path):
+        samples = np.atleast_2d(np.loadtxt(text_path))
+        temporary_path = "{}.{}.tmp.npy".format(binary_path, os.getpid())
+        np.save(temporary_path, samples)
+        os.replace(temporary_path, binary_path)
+
+    return np.load(binary_path, mmap_mode="r")
+
+
+def weighted_quantiles(values, weights, quantiles):
+    """
+    The weighted quantiles of every column of a 2D array of samples, where each sample's weight is centred on its \
+    value in the cumulative distribution (such that the median of equally weighted samples is their middle value).
+
+    Parameters
+    ----------
+    values : ndarray
+        The samples, of shape (total_samples, total_parameters).
+    weights : ndarray
+        The weight of every sample.
+    quantiles : [float]
+        The quantiles computed, e.g. [0.16, 0.5, 0.84] for the median and 1 sigma credible interval.
+
+    Returns
+    -------
+    ndarray
+        The quantiles of every parameter, of shape (total_parameters, total_quantiles).
+    """
+    values = np.asarray(values, dtype="float64")
+    weights = np.asarray(weights, dtype="float64")
+
+    order = np.argsort(values, axis=0)
+    sorted_values = np.take_along_axis(values, order, axis=0)
+
+    sorted_weights = weights[order]
+
+    cumulative_weights = np.cumsum(sorted_weights, axis=0) - 0.5 * sorted_weights
+    cumulative_weights /= np.sum(weights)
+
+    return np.array(
+        [
+            np.interp(quantiles, cumulative_weights[:, index], sorted_values[:, index])
+            for index in range(values.shape[1])
+        ]
+    )
+
+
+def summary_from_optimizer_path(optimizer_path, quantiles):
+    """
+    The parameter names and weighted quantiles of every parameter of one MultiNest fit, computed in a worker process.
+    """
+    samples = memory_mapped_samples_from_optimizer_path(optimizer_path=optimizer_path)
+
+    return (
+        param_names_from_optimizer_path(optimizer_path=optimizer_path),
+        weighted_quantiles(
+            values=samples[:, 2:], weights=samples[:, 0], quantiles=quantiles
+        ),
+    )
+
+
+def summary_from_job(job):
+
+    optimizer_path, quantiles = job
+
+    return summary_from_optimizer_path(
+        optimizer_path=optimizer_path, quantiles=quantiles
+    )
+
+
+def posterior_summaries(phase_outputs, credible_interval=0.6827, number_of_cores=1):
+    """
+    The median and credible interval of every parameter across a population of MultiNest fits, e.g. every phase \
+    output of an aggregator, computed in parallel worker processes from memory-mapped samples.
+
+    A parameter which is not in the model of a fit (e.g. fits with different numbers of Gaussians) is NaN for that \
+    fit.
+
+    Parameters
+    ----------
+    phase_outputs : [af.PhaseOutput]
+        The phase outputs whose samples are summarized.
+    credible_interval : float
+        The probability contained in each parameter's credible interval (e.g. 0.6827 for 1 sigma).
+    number_of_cores : int
+        The number of worker processes which summarize the fits, which is reduced if the machine is already loaded.
+
+    Returns
+    -------
+    {str: ndarray}
+        For every parameter, an array of shape (total_fits, 3) giving the lower limit of its credible interval, its \
+        median and the upper limit of its credible interval in every fit.
+    """
+    tail = (1.0 - credible_interval) / 2.0
+    quantiles = (tail, 0.5, 1.0 - tail)
+
+    jobs = [
+        (optimizer_path_from_phase_output(phase_output=phase_output), quantiles)
+        for phase_output in phase_outputs
+    ]
+
+    processes = available_cores(number_of_cores=number_of_cores)
+
+    if processes > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(processes=processes) as pool:
+            summaries = pool.map(summary_from_job, jobs)
+    else:
+        summaries = list(map(summary_from_job, jobs))
+
+    parameters = {}
+
+    for index, (param_names, fit_quantiles) in enumerate(summaries):
+        for param_name, param_quantiles in zip(param_names, fit_quantiles):
+
+            if param_name not in parameters:
+                parameters[param_name] = np.full((len(summaries), 3), np.nan)
+
+            parameters[param_name][index] = param_quantiles
+
+    return parameters
@@ -0,0 +1,321 @@
+import json
+import os
+
+import numpy as np
+
+from toy_gaussian.src import dimensions as dim
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def columns_from_gaussians(gaussians):
+    """
+    The best-fit parameter columns of a list of Gaussians, named by the Gaussian's index and parameter (and the \
+    index of an element of a tuple parameter), e.g. 'gaussians_0_centre_1', 'gaussians_0_intensity'.
+    """
+    columns = {}
+
+    for gaussian_index, gaussian in enumerate(gaussians):
+        for name, value in sorted(gaussian.__dict__.items()):
+
+            column = "gaussians_{}_{}".format(gaussian_index, name)
+
+            if isinstance(value, tuple):
+                if all(isinstance(item, (int, float)) for item in value):
+                    for item_index, item in enumerate(value):
+                        columns["{}_{}".format(column, item_index)] = float(item)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                columns[column] = float(value)
+
+    return columns
+
+
+def column_dimensions_from_gaussians(gaussians):
+    """
+    The dimension (e.g. 'Length') and unit of every dimensioned parameter column of a list of Gaussians, named as by \
+    *columns_from_gaussians*, which is used to convert the columns' units with *dim.columns_with_units_converted*.
+    """
+    column_dimensions = {}
+
+    for gaussian_index, gaussian in enumerate(gaussians):
+        for name, value in sorted(gaussian.__dict__.items()):
+
+            column = "gaussians_{}_{}".format(gaussian_index, name)
+            values = value if isinstance(value, tuple) else (value,)
+
+            for item_index, item in enumerate(values):
+
+                dimension = dim.dimension_of(item)
+
+                if dimension[0] is None:
+                    continue
+
+                if isinstance(value, tuple):
+                    column_dimensions["{}_{}".format(column, item_index)] = dimension
+                else:
+                    column_dimensions[column] = dimension
+
+    return column_dimensions
+
+
+def evidence_from_optimizer(optimizer):
+    """
+    The Bayesian evidence of a non-linear search's output, or *None* if the search does not estimate it (e.g. it is \
+    not a nested sampler) or its output cannot be read.
+    """
+    try:
+        evidence = optimizer.output.evidence
+    except (AttributeError, IOError, ValueError, IndexError):
+        return None
+
+    return None if evidence is None else float(evidence)
+
+
+def table_from_rows(rows):
+    """
+    A NumPy structured array of a list of rows, whose fields are the union of the rows' columns.
+
+    Columns with str values are stored as fixed width unicode strings sized to their longest value and all other \
+    columns as float64s. A row missing a column has an empty string or NaN in that column.
+    """
+    names = []
+
+    for row in rows:
+        for name in row:
+            if name not in names:
+                names.append(name)
+
+    dtype = []
+
+    for name in names:
+
+        values = [row[name] for row in rows if name in row]
+
+        if any(isinstance(value, str) for value in values):
+            dtype.append(
+                (name, "U{}".format(max(1, max(len(str(value)) for value in values))))
+            )
+        else:
+            dtype.append((name, "f8"))
+
+    table = np.zeros(len(rows), dtype=dtype)
+
+    for name, kind in dtype:
+        table[name] = "" if kind.startswith("U") else np.nan
+
+    for index, row in enumerate(rows):
+        for name, value in row.items():
+            if value is not None:
+                table[name][index] = value
+
+    return table
+
+
+def rows_from_table(table):
+
+    return [
+        {
+            name: (
+                str(table[name][index])
+                if table.dtype[name].kind == "U"
+                else float(table[name][index])
+            )
+            for name in table.dtype.names
+        }
+        for index in range(len(table))
+    ]
+
+
+def concatenate_tables(tables):
+    """
+    Concatenate structured arrays whose fields may differ, column by column, into one structured array whose fields \
+    are the union of the tables' fields.
+
+    A column with str values in any table is stored as a fixed width unicode string sized to its widest table, and \
+    all other columns as float64s. A table missing a column has an empty string or NaN in that column.
+    """
+    names = []
+    widths = {}
+
+    for table in tables:
+        for name in table.dtype.names:
+
+            if name not in names:
+                names.append(name)
+
+            if table.dtype[name].kind == "U":
+                widths[name] = max(
+                    widths.get(name, 1), table.dtype[name].itemsize // 4
+                )
+
+    dtype = [
+        (name, "U{}".format(widths[name]) if name in widths else "f8")
+        for name in names
+    ]
+
+    merged = np.zeros(sum(len(table) for table in tables), dtype=dtype)
+
+    for name in names:
+        merged[name] = "" if name in widths else np.nan
+
+    start = 0
+
+    for table in tables:
+
+        end = start + len(table)
+
+        for name in table.dtype.names:
+            merged[name][start:end] = table[name]
+
+        start = end
+
+    return merged
+
+
+class ResultsStore(object):
+    def __init__(self, path):
+        """
+        A columnar table of the results of every phase run with the results_store general config option on.
+
+        Every phase adds its row when it finishes, which holds its pipeline name, phase name, phase tag, output \
+        directory, figure of merit, evidence, run time, settings (e.g. sub_size) and the parameters of its most \
+        likely Gaussians. A phase which is rerun replaces its row.
+
+        Rows are appended as JSON records to a log ('{path}/results_store.jsonl'), such that adding a row never \
+        reads or rewrites the rows already in the store. When the store is loaded, the records appended since it was \
+        last loaded are compacted into a NumPy structured array saved as '{path}/results_store.npy', keeping the last \
+        record of every output directory. The table is memory-mapped, so a query scans the columns it filters on \
+        instead of parsing every record or unpickling the outputs of every phase directory.
+
+        Parameters
+        ----------
+        path : str
+            The directory the store is written to, which is typically the output path.
+        """
+        self.path = path
+        self.file_path = "{}/results_store.jsonl".format(path)
+        self.table_path = "{}/results_store.npy".format(path)
+        self.offset_path = "{}/results_store.offset".format(path)
+
+    def load_table(self):
+        """
+        The compacted table, memory-mapped, and the offset in the log of the first record not yet compacted into it.
+        """
+        try:
+            with open(self.offset_path) as f:
+                offset = int(f.read())
+            table = np.load(self.table_path, mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            return np.zeros(0, dtype=[("directory", "U1")]), 0
+
+        return table, offset
+
+    def compact(self):
+        """
+        Compact the records appended to the log since the table was last compacted into the table, replacing the row \
+        of every output directory with a new record.
+
+        Only complete records are compacted, so an incomplete final record (e.g. from a crash mid-write) is left in \
+        the log, and a record which cannot be read is skipped. The log is locked whilst the store is compacted, so \
+        no row is appended between reading the log and replacing the table.
+        """
+        try:
+            f = open(self.file_path, "rb")
+        except FileNotFoundError:
+            return
+
+        with f:
+
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+
+            table, offset = self.load_table()
+
+            f.seek(offset)
+            records = f.read()
+
+            end = records.rfind(b"\n") + 1
+
+            if end == 0:
+                return
+
+            rows = {}
+
+            for line in records[:end].splitlines():
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                rows.pop(row["directory"], None)
+                rows[row["directory"]] = row
+
+            if len(rows) > 0:
+
+                new_table = table_from_rows(rows=list(rows.values()))
+
+                table = concatenate_tables(
+                    tables=[
+                        table[~np.isin(table["directory"], new_table["directory"])],
+                        new_table,
+                    ]
+                )
+
+                temporary_path = "{}.{}.tmp.npy".format(self.table_path, os.getpid())
+                np.save(temporary_path, table)
+                os.replace(temporary_path, self.table_path)
+
+            temporary_path = "{}.{}.tmp".format(self.offset_path, os.getpid())
+
+            with open(temporary_path, "w") as offset_file:
+                offset_file.write(str(offset + end))
+
+            os.replace(temporary_path, self.offset_path)
+
+    def load(self):
+        """
+        The table of every phase's results, as a memory-mapped NumPy structured array, which is empty if no phase has \
+        been added to the store.
+        """
+        self.compact()
+
+        return self.load_table()[0]
+
+    def add_row(self, row):
+        """
+        Add the results of a phase to the store, replacing any row with the same output directory when the store is \
+        next compacted.
+
+        The log is locked while the record is appended, so phases running at the same time on one output path (e.g. \
+        pipelines run by separate processes) never interleave their records.
+        """
+        os.makedirs(self.path, exist_ok=True)
+
+        record = json.dumps(row) + "\n"
+
+        with open(self.file_path, "a") as f:
+
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+
+            f.write(record)
+            f.flush()
+
+    def filter(self, **columns):
+        """
+        The rows of the table whose columns equal every value input, e.g. filter(pipeline=pipeline_name, \
+        phase=phase_name). No rows are returned if a column is not in the table (e.g. a setting no phase has).
+        """
+        table = self.load()
+
+        if any(name not in table.dtype.names for name in columns):
+            return table[:0]
+
+        selection = np.ones(len(table), dtype="bool")
+
+        for name, value in columns.items():
+            selection &= table[name] == value
+
+        return table[selection]
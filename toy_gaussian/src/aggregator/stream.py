@@ -0,0 +1,128 @@
+import collections
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+from toy_gaussian.src.model import serialization
+
+# The attributes an af.PhaseOutput caches its unpickled optimizer and model in.
+cached_attributes = ("_PhaseOutput__optimizer", "_PhaseOutput__model")
+
+
+def stream(phase_outputs, load, prefetch=4):
+    """
+    Iterate over the phase outputs of an aggregator one at a time, yielding what *load* reads from each phase's \
+    output (e.g. its non-linear output or most likely model instance) in the order of the phase outputs.
+
+    Loading is done by a pool of *prefetch* threads, which read the outputs of the next *prefetch* phases from the \
+    hard-disk while the current phase is being used. No more than *prefetch* + 1 loaded phases (the current phase \
+    and the *prefetch* phases loaded ahead of it) are held in memory at once, so memory use does not grow with the \
+    size of the output tree and the first phase is available as soon as it is loaded. If *prefetch* is 0 every phase \
+    is loaded when it is yielded, without a thread pool.
+
+    The optimizer and model a phase output unpickles when it is loaded are not cached on the phase output (which \
+    the aggregator holds for every phase), so they are freed once the value yielded is no longer used.
+
+    Parameters
+    ----------
+    phase_outputs : iterable of af.PhaseOutput
+        The phase outputs to iterate over, e.g. aggregator.filter(pipeline=pipeline_name, phase=phase_name).
+    load : func
+        The function which loads the value of a phase output that is yielded.
+    prefetch : int
+        The number of phase outputs loaded ahead of the one being yielded.
+    """
+    load = uncached(load=load)
+
+    if prefetch < 1:
+        for phase_output in phase_outputs:
+            yield load(phase_output)
+        return
+
+    phase_outputs = iter(phase_outputs)
+    pending = collections.deque()
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+
+    try:
+
+        for phase_output in itertools.islice(phase_outputs, prefetch):
+            pending.append(executor.submit(load, phase_output))
+
+        while pending:
+
+            value = pending.popleft().result()
+
+            for phase_output in itertools.islice(phase_outputs, 1):
+                pending.append(executor.submit(load, phase_output))
+
+            yield value
+
+    finally:
+
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=True)
+
+
+def uncached(load):
+    """
+    Wrap a function loading a value of a phase output such that the optimizer and model the phase output unpickles \
+    to load it are cleared from the phase output afterwards.
+    """
+
+    def load_uncached(phase_output):
+        try:
+            return load(phase_output)
+        finally:
+            for name in cached_attributes:
+                if name in phase_output.__dict__:
+                    phase_output.__dict__[name] = None
+
+    return load_uncached
+
+
+def outputs(phase_outputs, prefetch=4):
+    """
+    Stream the non-linear outputs of phase outputs, see *stream*.
+    """
+    return stream(
+        phase_outputs=phase_outputs,
+        load=lambda phase_output: phase_output.output,
+        prefetch=prefetch,
+    )
+
+
+def most_likely_model_instances(phase_outputs, prefetch=4):
+    """
+    Stream the most likely model instances of phase outputs, see *stream*, which are loaded without unpickling if \
+    the phases wrote them as JSON (see *serialization.most_likely_model_instance_from_phase_output*).
+    """
+    return stream(
+        phase_outputs=phase_outputs,
+        load=serialization.most_likely_model_instance_from_phase_output,
+        prefetch=prefetch,
+    )
+
+
+def gaussian_models(phase_outputs, prefetch=4):
+    """
+    Stream the Gaussian models of phase outputs, see *stream*, which are loaded without unpickling if the phases \
+    wrote them as JSON (see *serialization.gaussian_models_from_phase_output*).
+    """
+    return stream(
+        phase_outputs=phase_outputs,
+        load=serialization.gaussian_models_from_phase_output,
+        prefetch=prefetch,
+    )
+
+
+def model_results(phase_outputs, prefetch=4):
+    """
+    Stream the model results of phase outputs, see *stream*.
+    """
+    return stream(
+        phase_outputs=phase_outputs,
+        load=lambda phase_output: phase_output.model_results,
+        prefetch=prefetch,
+    )
@@ -0,0 +1,228 @@
+import csv
+import multiprocessing
+import os
+import pickle
+
+import numpy as np
+
+from autoarray.fit.fit import fit_masked_dataset
+from toy_gaussian.src.model import serialization
+from toy_gaussian.src.pipeline.grid_search import available_cores
+from toy_gaussian.src.plot import raster
+
+
+class ThumbnailJob(object):
+    def __init__(self, index, phase_output, thumbnail_path, scale=4, cmap="jet"):
+        """
+        The thumbnails of one phase output of an aggregator, which are rendered by a worker process.
+
+        Parameters
+        ----------
+        index : int
+            The position of the phase output's tile on the contact sheet.
+        phase_output : af.PhaseOutput
+            The phase output loaded by the aggregator, whose dataset, mask and most likely model are rendered.
+        thumbnail_path : str
+            The directory the thumbnails of every phase output are written to.
+        scale : int
+            The number of thumbnail pixels each image pixel is enlarged to along each axis.
+        cmap : str
+            The matplotlib colormap the thumbnails are colored using.
+        """
+        self.index = index
+        self.phase_output = phase_output
+        self.thumbnail_path = thumbnail_path
+        self.scale = scale
+        self.cmap = cmap
+
+    @property
+    def name(self):
+        return "{:05d}".format(self.index)
+
+
+def masked_imaging_from_phase_output(phase_output):
+    """
+    The masked imaging a phase fitted, made from its dataset using the mask and meta imaging fit (its sub_size, \
+    signal_to_noise_limit and bin_up_factor) pickled to its output path by *PhaseImaging.make_analysis*.
+    """
+    with open("{}/mask.pickle".format(phase_output.directory), "rb") as f:
+        mask = pickle.load(f)
+
+    with open("{}/meta_imaging_fit.pickle".format(phase_output.directory), "rb") as f:
+        meta_imaging_fit = pickle.load(f)
+
+    imaging = phase_output.dataset
+
+    return meta_imaging_fit.masked_dataset_from(
+        dataset=imaging, mask=mask, results=None, modified_image=imaging.image
+    )
+
+
+def fit_from_phase_output(phase_output):
+    """
+    The fit of the most likely model of a phase output to the masked imaging it fitted, which is computed the same \
+    way as the fits of the phase's analysis.
+    """
+    masked_imaging = masked_imaging_from_phase_output(phase_output=phase_output)
+    instance = serialization.most_likely_model_instance_from_phase_output(
+        phase_output=phase_output
+    )
+
+    model_image = sum(
+        map(
+            lambda gaussian: gaussian.profile_image_from_grid(
+                grid=masked_imaging.grid
+            ),
+            instance.gaussians,
+        )
+    ).in_1d_binned
+
+    return fit_masked_dataset(masked_dataset=masked_imaging, model_data=model_image)
+
+
+def thumbnails_from_job(job):
+    """
+    Render the image, most likely model image and residual map of a phase output as png thumbnails, directly from \
+    their arrays via the raster backend.
+
+    Returns
+    -------
+    (int, str, ndarray, float)
+        The index of the job, the phase output's directory, the RGB tile of its three thumbnails side by side for \
+        the contact sheet and the chi-squared of its most likely fit.
+    """
+    fit = fit_from_phase_output(phase_output=job.phase_output)
+
+    image = np.asarray(fit.data.in_2d)
+    model_image = np.asarray(fit.model_data.in_2d)
+    residual_map = np.asarray(fit.residual_map.in_2d)
+
+    residual_max = np.max(np.abs(residual_map))
+
+    rgbs = [
+        raster.rgb_from_array_2d(
+            array_2d=array_2d,
+            cmap=job.cmap,
+            norm_min=norm_min,
+            norm_max=norm_max,
+            scale=job.scale,
+        )
+        for array_2d, norm_min, norm_max in (
+            (image, np.min(image), np.max(image)),
+            (model_image, np.min(image), np.max(image)),
+            (residual_map, -residual_max, residual_max),
+        )
+    ]
+
+    for rgb, label in zip(rgbs, ("image", "model_image", "residual_map")):
+        with open(
+            "{}/{}_{}.png".format(job.thumbnail_path, job.name, label), "wb"
+        ) as f:
+            f.write(raster.png_from_rgb(rgb=rgb))
+
+    spacer = np.zeros((rgbs[0].shape[0], job.scale, 3), dtype="uint8")
+
+    tile = np.concatenate((rgbs[0], spacer, rgbs[1], spacer, rgbs[2]), axis=1)
+
+    return job.index, job.phase_output.directory, tile, float(fit.chi_squared)
+
+
+def contact_sheet_from_tiles(tiles, columns=8, padding=4):
+    """
+    Arrange the RGB tiles of many phase outputs row by row into one contact sheet, padding tiles of different sizes \
+    (e.g. from datasets of different shapes) to the size of the largest tile.
+
+    Returns
+    -------
+    (ndarray, [(int, int)])
+        The RGB contact sheet and the (row, column) of every tile on it.
+    """
+    tile_rows = max(tile.shape[0] for tile in tiles) + padding
+    tile_columns = max(tile.shape[1] for tile in tiles) + padding
+
+    columns = min(columns, len(tiles))
+    rows = -(-len(tiles) // columns)
+
+    contact_sheet = np.zeros(
+        (rows * tile_rows + padding, columns * tile_columns + padding, 3),
+        dtype="uint8",
+    )
+
+    positions = []
+
+    for index, tile in enumerate(tiles):
+
+        row, column = divmod(index, columns)
+
+        y0 = row * tile_rows + padding
+        x0 = column * tile_columns + padding
+
+        contact_sheet[y0 : y0 + tile.shape[0], x0 : x0 + tile.shape[1]] = tile
+
+        positions.append((row, column))
+
+    return contact_sheet, positions
+
+
+def output_thumbnails(
+    phase_outputs, output_path, number_of_cores=1, scale=4, columns=8, cmap="jet"
+):
+    """
+    Render thumbnails of the image, most likely model image and residual map of every phase output of an aggregator \
+    and combine them into a contact sheet, such that a whole batch of fits can be reviewed in one image.
+
+    The following files are written to *output_path*:
+
+    - thumbnails/{index}_image.png, {index}_model_image.png and {index}_residual_map.png for every phase output.
+    - contact_sheet.png: every phase output's thumbnails (image, model image, residual map) as one tile.
+    - index.csv: the row and column of every phase output's tile, its directory and its chi-squared.
+
+    Parameters
+    ----------
+    phase_outputs : [af.PhaseOutput]
+        The phase outputs of an aggregator, e.g. aggregator.filter(pipeline=pipeline_name, phase=phase_name).
+    output_path : str
+        The directory the thumbnails, contact sheet and index are written to.
+    number_of_cores : int
+        The number of worker processes which load and render the phase outputs, which is reduced if the machine is \
+        already loaded.
+    """
+    thumbnail_path = "{}/thumbnails".format(output_path)
+    os.makedirs(thumbnail_path, exist_ok=True)
+
+    jobs = [
+        ThumbnailJob(
+            index=index,
+            phase_output=phase_output,
+            thumbnail_path=thumbnail_path,
+            scale=scale,
+            cmap=cmap,
+        )
+        for index, phase_output in enumerate(phase_outputs)
+    ]
+
+    if len(jobs) == 0:
+        return
+
+    processes = available_cores(number_of_cores=number_of_cores)
+
+    if processes > 1:
+        with multiprocessing.Pool(processes=processes) as pool:
+            thumbnails = pool.map(thumbnails_from_job, jobs, chunksize=1)
+    else:
+        thumbnails = list(map(thumbnails_from_job, jobs))
+
+    contact_sheet, positions = contact_sheet_from_tiles(
+        tiles=[tile for _, _, tile, _ in thumbnails], columns=columns
+    )
+
+    with open("{}/contact_sheet.png".format(output_path), "wb") as f:
+        f.write(raster.png_from_rgb(rgb=contact_sheet))
+
+    with open("{}/index.csv".format(output_path), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["index", "row", "column", "chi_squared", "directory"])
+        for (index, directory, _, chi_squared), (row, column) in zip(
+            thumbnails, positions
+        ):
+            writer.writerow([index, row, column, chi_squared, directory])
@@ -2,14 +2,166 @@ import autofit as af
 import typing
 
 import inspect
+import numpy as np
 from toy_gaussian.src import exc
 
 
+class DimensionsMetadata(object):
+    def __init__(
+        self,
+        constructor_args,
+        length_attributes,
+        luminosity_attributes,
+        unannotated_args=(),
+    ):
+        """
+        The constructor arguments of a dimensions profile class and which of its attributes are dimensioned, which is \
+        inspected once per class (see *metadata_from_class*).
+
+        Constructor arguments without annotations (e.g. of a subclass overriding the constructor without them) are \
+        not known to be dimensioned or not from the class, so their values are inspected on every instance instead \
+        (see *DimensionsProfile.dimensions_metadata*).
+
+        Parameters
+        ----------
+        constructor_args : (str,)
+            The names of the constructor arguments of the class.
+        length_attributes : [(str, int or None)]
+            The name of every attribute which is a Length and, for a tuple (e.g. centre), the position of the Length \
+            in the tuple.
+        luminosity_attributes : [(str, int or None)]
+            The name and tuple position of every attribute which is a Luminosity.
+        unannotated_args : (str,)
+            The names of the constructor arguments which have no annotation.
+        """
+        self.constructor_args = constructor_args
+        self.length_attributes = length_attributes
+        self.luminosity_attributes = luminosity_attributes
+        self.unannotated_args = unannotated_args
+
+    @property
+    def dimensioned_attributes(self):
+        return set(
+            name for name, _ in self.length_attributes + self.luminosity_attributes
+        )
+
+
+# The metadata of every dimensions profile class which has been used, keyed by class.
+registry = {}
+
+
+def attributes_of_dimension_from_annotations(annotations, dimension):
+    """
+    The name and tuple position of every constructor argument annotated as the dimension (e.g. Length), including the \
+    elements of tuples annotated as that dimension (e.g. Position).
+    """
+    attributes = []
+
+    for name, annotation in annotations.items():
+
+        if isinstance(annotation, type) and issubclass(annotation, dimension):
+            attributes.append((name, None))
+        elif getattr(annotation, "__origin__", None) in (tuple, typing.Tuple):
+            for index, element in enumerate(getattr(annotation, "__args__", ())):
+                if isinstance(element, type) and issubclass(element, dimension):
+                    attributes.append((name, index))
+
+    return attributes
+
+
+def attributes_of_dimension_from_values(values, dimension):
+    """
+    The name and tuple position of every value which is of the dimension (e.g. Length), including the elements of \
+    tuples which are of that dimension, for attributes whose dimension is not known from annotations.
+
+    Parameters
+    ----------
+    values : [(str, object)]
+        The name and value of every attribute inspected.
+    dimension : type
+        The dimension type, Length or Luminosity.
+    """
+    attributes = []
+
+    for name, value in values:
+
+        if isinstance(value, dimension):
+            attributes.append((name, None))
+        elif isinstance(value, tuple):
+            for index, element in enumerate(value):
+                if isinstance(element, dimension):
+                    attributes.append((name, index))
+
+    return attributes
+
+
+def metadata_from_class(cls):
+    """
+    The dimensions metadata of a class, which is made from the constructor's arguments and annotations the first \
+    time the class is used. The constructor is inspected through the *af.map_types* decorator.
+    """
+    if cls not in registry:
+
+        annotations = {
+            name: annotation
+            for name, annotation in getattr(cls.__init__, "__annotations__", {}).items()
+            if name != "return"
+        }
+
+        parameters = inspect.signature(cls.__init__).parameters
+
+        registry[cls] = DimensionsMetadata(
+            constructor_args=tuple(parameters),
+            length_attributes=attributes_of_dimension_from_annotations(
+                annotations=annotations, dimension=Length
+            ),
+            luminosity_attributes=attributes_of_dimension_from_annotations(
+                annotations=annotations, dimension=Luminosity
+            ),
+            unannotated_args=tuple(
+                name
+                for name, parameter in parameters.items()
+                if name != "self"
+                and name not in annotations
+                and parameter.kind
+                not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+            ),
+        )
+
+    return registry[cls]
+
+
 class DimensionsProfile(object):
     def __init__(self):
 
         pass
 
+    @property
+    def dimensions_metadata(self):
+        """
+        The dimensions metadata of the object's class, where the values of constructor arguments without annotations \
+        are inspected to find which of them are dimensioned.
+        """
+        metadata = metadata_from_class(cls=self.__class__)
+
+        if not metadata.unannotated_args:
+            return metadata
+
+        values = [
+            (name, self.__dict__[name])
+            for name in metadata.unannotated_args
+            if name in self.__dict__
+        ]
+
+        return DimensionsMetadata(
+            constructor_args=metadata.constructor_args,
+            length_attributes=metadata.length_attributes
+            + attributes_of_dimension_from_values(values=values, dimension=Length),
+            luminosity_attributes=metadata.luminosity_attributes
+            + attributes_of_dimension_from_values(values=values, dimension=Luminosity),
+            unannotated_args=metadata.unannotated_args,
+        )
+
     def new_object_with_units_converted(
         self,
         unit_length=None,
@@ -18,72 +170,77 @@ class DimensionsProfile(object):
         exposure_time=None,
     ):
 
-        constructor_args = inspect.getfullargspec(self.__init__).args
+        metadata = self.dimensions_metadata
 
         def convert(value):
-            if unit_length is not None:
-                if isinstance(value, Length):
-                    return value.convert(unit_length, kpc_per_arcsec)
-                if isinstance(value, tuple):
-                    return tuple(convert(item) for item in value)
+            if unit_length is not None and isinstance(value, Length):
+                return value.convert(unit_length, kpc_per_arcsec)
             if unit_luminosity is not None and isinstance(value, Luminosity):
                 return value.convert(unit_luminosity, exposure_time)
             return value
 
-        return self.__class__(
-            **{
-                key: convert(value)
-                for key, value in self.__dict__.items()
-                if key in constructor_args
-            }
-        )
-
-    @property
-    def unit_length(self):
+        arguments = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key in metadata.constructor_args
+        }
 
-        unit_list = []
+        for name in metadata.dimensioned_attributes.intersection(arguments):
 
-        for attr, value in self.__dict__.items():
+            value = arguments[name]
 
             if isinstance(value, tuple):
-                for tuple_value in value:
-                    if hasattr(tuple_value, "unit_length"):
-                        unit_list.append(tuple_value.unit_length)
+                arguments[name] = tuple(convert(item) for item in value)
+            else:
+                arguments[name] = convert(value)
 
-            if isinstance(value, float):
-                if hasattr(value, "unit_length"):
-                    unit_list.append(value.unit_length)
+        return self.__class__(**arguments)
 
-        if len(unit_list) > 0:
-            if not all(unit == unit_list[0] for unit in unit_list):
-                raise exc.UnitsException(
-                    "This object has attributes with different units of length defined"
-                )
-        else:
-            return None
+    def unit_of_attributes(self, attributes, unit_name):
+        """
+        The unit of a list of attributes of a dimension (see *DimensionsMetadata*), which is *None* if none of them \
+        has a unit and raises an exception if they have different units.
+        """
+        unit_list = []
 
-        return unit_list[0]
+        for name, index in attributes:
 
-    @property
-    def unit_luminosity(self):
+            value = self.__dict__.get(name)
 
-        unit_list = []
+            if index is not None:
+                if not isinstance(value, tuple) or len(value) <= index:
+                    continue
+                value = value[index]
 
-        for attr, value in self.__dict__.items():
-            if isinstance(value, float):
-                if hasattr(value, "unit_luminosity"):
-                    unit_list.append(value.unit_luminosity)
+            if hasattr(value, unit_name):
+                unit_list.append(getattr(value, unit_name))
 
         if len(unit_list) > 0:
             if not all(unit == unit_list[0] for unit in unit_list):
                 raise exc.UnitsException(
-                    "This object has attributes with different unit_label of luminosity defined"
+                    "This object has attributes with different units of {} defined".format(
+                        unit_name.replace("unit_", "")
+                    )
                 )
         else:
             return None
 
         return unit_list[0]
 
+    @property
+    def unit_length(self):
+        return self.unit_of_attributes(
+            attributes=self.dimensions_metadata.length_attributes,
+            unit_name="unit_length",
+        )
+
+    @property
+    def unit_luminosity(self):
+        return self.unit_of_attributes(
+            attributes=self.dimensions_metadata.luminosity_attributes,
+            unit_name="unit_luminosity",
+        )
+
 
 class Length(af.DimensionType):
     def __init__(self, value, unit_length="arcsec"):
@@ -136,6 +293,18 @@ class Luminosity(af.DimensionType):
 Position = typing.Tuple[Length, Length]
 
 
+def dimension_of(value):
+    """
+    The dimension ('Length' or 'Luminosity') and unit of a dimensioned value, or (None, None) if it is not \
+    dimensioned.
+    """
+    if isinstance(value, Length):
+        return "Length", value.unit_length
+    if isinstance(value, Luminosity):
+        return "Luminosity", value.unit_luminosity
+    return None, None
+
+
 def convert_length(value, unit_current, unit_new, power, kpc_per_arcsec):
 
     if unit_current not in unit_new and kpc_per_arcsec is None:
@@ -175,3 +344,77 @@ def convert_luminosity(value, unit_current, unit_new, power, exposure_time):
             "The unit specified for the luminosity of a value was an invalid string, you "
             "must use (electrons per second | counts)"
         )
+
+
+def columns_with_units_converted(
+    columns,
+    column_dimensions,
+    unit_length=None,
+    unit_luminosity=None,
+    kpc_per_arcsec=None,
+    exposure_time=None,
+):
+    """
+    Convert the units of whole columns of profile parameters at once, e.g. the parameters of thousands of results in \
+    an aggregator's results store.
+
+    The units of every column are checked once, and each column is converted by one array operation using the \
+    *kpc_per_arcsec* and *exposure_time* of every row, instead of converting every profile with \
+    *new_object_with_units_converted*.
+
+    Parameters
+    ----------
+    columns : {str: ndarray} or ndarray
+        The columns of parameters, as a dictionary of column names and arrays or a NumPy structured array.
+    column_dimensions : {str: (str, str)}
+        The dimension ('Length' or 'Luminosity') and current unit of every column that is converted, e.g. \
+        {'gaussians_0_sigma': ('Length', 'arcsec')}. Columns not in this dictionary are returned unchanged.
+    unit_length : str
+        The unit of length the Length columns are converted to (arcsec | kpc).
+    unit_luminosity : str
+        The unit of luminosity the Luminosity columns are converted to (eps | counts).
+    kpc_per_arcsec : float or ndarray
+        The conversion factor from arcsec to kpc, either of every row or one value for all rows.
+    exposure_time : float or ndarray
+        The exposure time of every row, or one exposure time for all rows.
+
+    Returns
+    -------
+    {str: ndarray}
+        The converted columns.
+    """
+    names = columns.dtype.names if hasattr(columns, "dtype") else list(columns)
+
+    if kpc_per_arcsec is not None:
+        kpc_per_arcsec = np.asarray(kpc_per_arcsec, dtype="float64")
+
+    if exposure_time is not None:
+        exposure_time = np.asarray(exposure_time, dtype="float64")
+
+    converted_columns = {}
+
+    for name in names:
+
+        values = columns[name]
+        dimension, unit = column_dimensions.get(name, (None, None))
+
+        if dimension == "Length" and unit_length is not None:
+            values = convert_length(
+                value=np.asarray(values, dtype="float64"),
+                unit_current=unit,
+                unit_new=unit_length,
+                power=1.0,
+                kpc_per_arcsec=kpc_per_arcsec,
+            )
+        elif dimension == "Luminosity" and unit_luminosity is not None:
+            values = convert_luminosity(
+                value=np.asarray(values, dtype="float64"),
+                unit_current=unit,
+                unit_new=unit_luminosity,
+                power=1.0,
+                exposure_time=exposure_time,
+            )
+
+        converted_columns[name] = values
+
+    return converted_columns
@@ -8,3 +8,7 @@ class PhaseException(Exception):
 
 class UnitsException(Exception):
     pass
+
+
+class SerializationException(Exception):
+    pass
@@ -0,0 +1,154 @@
+import numpy as np
+
+from toy_gaussian.src.model import gaussians, geometry_profiles
+
+
+def grid_moved_to_radial_minimum(grid, grid_radial_minimum):
+    """
+    Move the coordinates of a grid in the reference frame of a profile which are radially within the radial minimum \
+    to the radial minimum, see *geometry_profiles.move_grid_to_radial_minimum*.
+    """
+    with np.errstate(all="ignore"):  # Division by zero fixed via isnan
+        grid_radii = np.sqrt(np.add(np.square(grid[:, 0]), np.square(grid[:, 1])))
+        grid_radial_scale = np.where(
+            grid_radii < grid_radial_minimum, grid_radial_minimum / grid_radii, 1.0
+        )
+        grid = np.multiply(grid, grid_radial_scale[:, None])
+    grid[np.isnan(grid)] = grid_radial_minimum
+    return grid
+
+
+class FastGaussian(object):
+
+    __slots__ = (
+        "centre",
+        "axis_ratio",
+        "phi_radians",
+        "intensity",
+        "sigma",
+        "is_spherical",
+        "grid_radial_minimum",
+    )
+
+    def __init__(
+        self,
+        centre,
+        axis_ratio,
+        phi_radians,
+        intensity,
+        sigma,
+        is_spherical,
+        grid_radial_minimum,
+    ):
+        """
+        A Gaussian light profile whose parameters are plain floats, which is used in place of an *EllipticalGaussian* \
+        or *SphericalGaussian* of a model instance when the instance's likelihood is evaluated.
+
+        The parameters of a Gaussian are dimensioned values (e.g. *dim.Length*), whose units are checked by the \
+        Gaussian's constructor. They are converted to floats once, as is its angle phi to radians and its radial \
+        minimum read from the config, so evaluating the Gaussian's image does no arithmetic on dimensioned values.
+
+        The image is computed with the same NumPy operations in the same order as *profile_image_from_grid* of the \
+        Gaussian it is made from, so both give identical images. The Gaussians of the model instance, with their \
+        units, are what is visualized and output as the results of a phase.
+        """
+        self.centre = centre
+        self.axis_ratio = axis_ratio
+        self.phi_radians = phi_radians
+        self.intensity = intensity
+        self.sigma = sigma
+        self.is_spherical = is_spherical
+        self.grid_radial_minimum = grid_radial_minimum
+
+    @classmethod
+    def from_gaussian(cls, gaussian):
+        """
+        The fast Gaussian of an *EllipticalGaussian* or *SphericalGaussian*, or *None* for any other class (including \
+        their subclasses, which may change how the image is computed).
+        """
+        if type(gaussian) not in (
+            gaussians.EllipticalGaussian,
+            gaussians.SphericalGaussian,
+        ):
+            return None
+
+        return FastGaussian(
+            centre=(float(gaussian.centre[0]), float(gaussian.centre[1])),
+            axis_ratio=float(gaussian.axis_ratio),
+            phi_radians=np.radians(float(gaussian.phi)),
+            intensity=float(gaussian.intensity),
+            sigma=float(gaussian.sigma),
+            is_spherical=type(gaussian).__name__.startswith("Spherical"),
+            grid_radial_minimum=geometry_profiles.radial_minimum_from_class_name(
+                class_name=type(gaussian).__name__
+            ),
+        )
+
+    def transform_grid_to_reference_frame(self, grid):
+
+        shifted_coordinates = np.subtract(grid, self.centre)
+
+        if self.is_spherical:
+            return shifted_coordinates
+
+        radius = np.sqrt(np.sum(shifted_coordinates ** 2.0, 1))
+        theta_coordinate_to_profile = (
+            np.arctan2(shifted_coordinates[:, 0], shifted_coordinates[:, 1])
+            - self.phi_radians
+        )
+        return np.vstack(
+            (
+                radius * np.sin(theta_coordinate_to_profile),
+                radius * np.cos(theta_coordinate_to_profile),
+            )
+        ).T
+
+    def profile_image_from_grid(self, grid):
+        """
+        Calculate the intensity of the Gaussian on a grid of Cartesian (y,x) coordinates, which is returned mapped \
+        to the grid's stored 1D array as for *EllipticalGaussian.profile_image_from_grid*.
+        """
+        transformed = self.transform_grid_to_reference_frame(grid=np.asarray(grid))
+
+        # The radial minimum is applied by both *profile_image_from_grid* and *grid_to_elliptical_radii* of a Gaussian.
+        transformed = grid_moved_to_radial_minimum(
+            grid=transformed, grid_radial_minimum=self.grid_radial_minimum
+        )
+        transformed = grid_moved_to_radial_minimum(
+            grid=transformed, grid_radial_minimum=self.grid_radial_minimum
+        )
+
+        grid_radii = np.sqrt(
+            np.add(
+                np.square(transformed[:, 1]),
+                np.square(np.divide(transformed[:, 0], self.axis_ratio)),
+            )
+        )
+
+        profile_image = np.multiply(
+            np.divide(self.intensity, self.sigma * np.sqrt(2.0 * np.pi)),
+            np.exp(-0.5 * np.square(np.divide(grid_radii, self.sigma))),
+        )
+
+        return grid.mapping.array_stored_1d_from_sub_array_1d(
+            sub_array_1d=profile_image
+        )
+
+
+def fast_gaussians_from_gaussians(gaussians):
+    """
+    The fast Gaussians of a list of Gaussians, or *None* if any Gaussian is of a class which has no fast Gaussian, in \
+    which case the Gaussians themselves are evaluated.
+    """
+    fast_gaussians = []
+
+    for gaussian in gaussians:
+
+        fast_gaussian = FastGaussian.from_gaussian(gaussian=gaussian)
+
+        if fast_gaussian is None:
+            return None
+
+        fast_gaussians.append(fast_gaussian)
+
+    return fast_gaussians
@@ -86,6 +86,28 @@ def cache(func):
     return wrapper
 
 
+# The radial minimum of every profile class, keyed by the config path it is read from and the class name, so the
+# radial minimum config is read once per class instead of every time a profile is evaluated.
+radial_minimums = {}
+
+
+def radial_minimum_from_class_name(class_name):
+    """
+    The radial minimum of a profile class, read from the radial_minimum config the first time it is used.
+    """
+    key = (af.conf.instance.config_path, class_name)
+
+    if key not in radial_minimums:
+        radial_minimum_config = af.conf.NamedConfig(
+            f"{af.conf.instance.config_path}/radial_minimum.ini"
+        )
+        radial_minimums[key] = radial_minimum_config.get(
+            "radial_minimum", class_name, float
+        )
+
+    return radial_minimums[key]
+
+
 def move_grid_to_radial_minimum(func):
     """ Checks whether any coordinates in the grid are radially near (0.0, 0.0), which can lead to numerical faults in \
     the evaluation of a light or mass profiles. If any coordinates are radially within the the radial minimum \
@@ -121,11 +143,8 @@ def move_grid_to_radial_minimum(func):
         -------
             A value or coordinate in the same coordinate system as those passed in.
         """
-        radial_minimum_config = af.conf.NamedConfig(
-            f"{af.conf.instance.config_path}/radial_minimum.ini"
-        )
-        grid_radial_minimum = radial_minimum_config.get(
-            "radial_minimum", profile.__class__.__name__, float
+        grid_radial_minimum = radial_minimum_from_class_name(
+            class_name=profile.__class__.__name__
         )
         with np.errstate(all="ignore"):  # Division by zero fixed via isnan
             grid_radii = profile.grid_to_grid_radii(grid=grid)
@@ -0,0 +1,376 @@
+import base64
+import inspect
+import json
+import os
+import pickle
+
+import autofit as af
+from toy_gaussian.src import dimensions as dim
+from toy_gaussian.src import exc
+from toy_gaussian.src.model import gaussians, geometry_profiles
+
+version = 1
+
+# The classes which are serialized by their schema, keyed by class name rather than module path so that serialized
+# models and instances still load if a class moves module.
+registry = {}
+
+
+def register(cls):
+    """
+    Register a profile class with the serializer, such that its instances and models are serialized as a schema of \
+    their constructor arguments and a flat parameter vector instead of being pickled.
+    """
+    registry[cls.__name__] = cls
+    return cls
+
+
+register(geometry_profiles.GeometryProfile)
+register(geometry_profiles.SphericalProfile)
+register(geometry_profiles.EllipticalProfile)
+register(gaussians.EllipticalGaussian)
+register(gaussians.SphericalGaussian)
+
+
+def constructor_arguments_from_class(cls):
+    """
+    The constructor arguments of a class and their defaults, read through the *af.map_types* decorator.
+    """
+    return [
+        (name, parameter.default)
+        for name, parameter in inspect.signature(cls.__init__).parameters.items()
+        if name != "self"
+    ]
+
+
+def check_version(serialized_dict):
+    """
+    Raise a *SerializationException* if a dictionary was serialized with a version of the schema other than the one \
+    this module reads, e.g. by a newer version of the code.
+    """
+    serialized_version = serialized_dict.get("version")
+
+    if serialized_version != version:
+        raise exc.SerializationException(
+            "The serialized version {} cannot be loaded, only version {} is supported".format(
+                serialized_version, version
+            )
+        )
+
+
+def pickled_entry_from(obj):
+
+    return {"pickle": base64.b64encode(pickle.dumps(obj)).decode()}
+
+
+def object_from_pickled_entry(entry):
+
+    return pickle.loads(base64.b64decode(entry["pickle"]))
+
+
+def value_with_dimension(value, dimension, unit):
+
+    if dimension == "Length":
+        return dim.Length(value, unit_length=unit)
+    if dimension == "Luminosity":
+        return dim.Luminosity(value, unit_luminosity=unit)
+    return value
+
+
+def entry_from_gaussian(gaussian, vector):
+    """
+    The schema entry of a Gaussian, whose parameters are appended to the flat parameter *vector*.
+
+    Every argument of the entry gives its name, the number of elements it has in the vector (*None* for a scalar) \
+    and the dimension (e.g. Length) and unit of every element, such that the Gaussian can be remade with the same \
+    dimensioned parameters.
+    """
+    cls = registry.get(type(gaussian).__name__)
+
+    if cls is not type(gaussian):
+        return pickled_entry_from(gaussian)
+
+    arguments = []
+
+    for name, _ in constructor_arguments_from_class(cls):
+
+        value = getattr(gaussian, name)
+        values = value if isinstance(value, tuple) else (value,)
+
+        if not all(isinstance(item, (int, float)) for item in values):
+            return pickled_entry_from(gaussian)
+
+        arguments.append(
+            {
+                "name": name,
+                "size": len(values) if isinstance(value, tuple) else None,
+                "dimensions": [dim.dimension_of(item) for item in values],
+            }
+        )
+        vector.extend(float(item) for item in values)
+
+    return {"class": cls.__name__, "arguments": arguments}
+
+
+def gaussian_from_entry(entry, vector, index):
+    """
+    Make a Gaussian from its schema entry and the flat parameter vector, starting at *index*.
+
+    Returns
+    -------
+    (object, int)
+        The Gaussian and the index in the vector of the next Gaussian's parameters.
+    """
+    if "pickle" in entry:
+        return object_from_pickled_entry(entry=entry), index
+
+    arguments = {}
+
+    for argument in entry["arguments"]:
+
+        values = []
+
+        for dimension, unit in argument["dimensions"]:
+            values.append(value_with_dimension(vector[index], dimension, unit))
+            index += 1
+
+        arguments[argument["name"]] = (
+            values[0] if argument["size"] is None else tuple(values)
+        )
+
+    return registry[entry["class"]](**arguments), index
+
+
+def dict_from_instance(instance):
+    """
+    A JSON serializable dictionary of a model instance's Gaussians, consisting of a schema of every Gaussian's \
+    class and constructor arguments and a flat vector of their parameters.
+
+    Gaussians of classes which are not registered (see *register*) are pickled instead.
+    """
+    vector = []
+
+    schema = [
+        entry_from_gaussian(gaussian=gaussian, vector=vector)
+        for gaussian in instance.gaussians
+    ]
+
+    return {"version": version, "gaussians": schema, "vector": vector}
+
+
+def instance_from_dict(instance_dict):
+    """
+    Make a model instance from a dictionary output by *dict_from_instance*.
+    """
+    check_version(serialized_dict=instance_dict)
+
+    vector = instance_dict["vector"]
+    index = 0
+
+    instance_gaussians = []
+
+    for entry in instance_dict["gaussians"]:
+        gaussian, index = gaussian_from_entry(entry=entry, vector=vector, index=index)
+        instance_gaussians.append(gaussian)
+
+    instance = af.ModelInstance()
+    instance.gaussians = instance_gaussians
+
+    return instance
+
+
+def is_prior(value):
+
+    return hasattr(value, "value_for") and not isinstance(value, (int, float))
+
+
+def dict_from_prior(prior):
+    """
+    A JSON serializable dictionary of a prior, holding its type (e.g. UniformPrior) and the values of its \
+    constructor arguments (e.g. lower_limit, upper_limit).
+    """
+    arguments = inspect.signature(type(prior).__init__).parameters
+
+    return {
+        "type": type(prior).__name__,
+        **{
+            name: float(getattr(prior, name))
+            for name in ("mean", "sigma", "lower_limit", "upper_limit")
+            if name in arguments and hasattr(prior, name)
+        },
+    }
+
+
+def prior_from_dict(prior_dict):
+
+    prior_dict = dict(prior_dict)
+    return getattr(af, prior_dict.pop("type"))(**prior_dict)
+
+
+def entry_from_gaussian_model(gaussian_model, priors):
+    """
+    The schema entry of a Gaussian model, whose priors are appended to *priors*.
+
+    Every argument of the entry gives, for each of its elements, either the index of its prior in *priors* or its \
+    constant value. A prior shared by more than one parameter (e.g. two Gaussians with the same centre) is stored \
+    once, so the parameters are still linked when the model is loaded.
+    """
+    cls = getattr(gaussian_model, "cls", None)
+
+    if (
+        not isinstance(gaussian_model, af.PriorModel)
+        or registry.get(getattr(cls, "__name__", None)) is not cls
+    ):
+        return pickled_entry_from(gaussian_model)
+
+    prior_ids = [id(prior) for prior in priors]
+
+    def element_from(value):
+
+        if is_prior(value):
+            if id(value) not in prior_ids:
+                priors.append(value)
+                prior_ids.append(id(value))
+            return {"prior": prior_ids.index(id(value))}
+
+        if isinstance(value, (int, float)):
+            return {"constant": float(value)}
+
+        raise TypeError
+
+    arguments = []
+
+    try:
+        for name, default in constructor_arguments_from_class(cls):
+
+            value = getattr(gaussian_model, name)
+
+            if isinstance(default, tuple):
+                if not isinstance(value, tuple):
+                    value = tuple(
+                        getattr(value, "{}_{}".format(name, element_index))
+                        for element_index in range(len(default))
+                    )
+                elements = list(map(element_from, value))
+                arguments.append({"name": name, "elements": elements})
+            else:
+                arguments.append({"name": name, "element": element_from(value)})
+    except (AttributeError, TypeError):
+        return pickled_entry_from(gaussian_model)
+
+    return {"class": cls.__name__, "arguments": arguments}
+
+
+def gaussian_model_from_entry(entry, priors):
+
+    if "pickle" in entry:
+        return object_from_pickled_entry(entry=entry)
+
+    gaussian_model = af.PriorModel(registry[entry["class"]])
+
+    def value_from(element):
+
+        if "prior" in element:
+            return priors[element["prior"]]
+        return element["constant"]
+
+    for argument in entry["arguments"]:
+
+        if "element" in argument:
+            setattr(gaussian_model, argument["name"], value_from(argument["element"]))
+        else:
+            tuple_prior = getattr(gaussian_model, argument["name"])
+            for element_index, element in enumerate(argument["elements"]):
+                setattr(
+                    tuple_prior,
+                    "{}_{}".format(argument["name"], element_index),
+                    value_from(element),
+                )
+
+    return gaussian_model
+
+
+def dict_from_gaussian_models(gaussian_models):
+    """
+    A JSON serializable dictionary of the Gaussian models of a phase, consisting of a schema of every model's class \
+    and constructor arguments and the list of their priors.
+
+    Models which are not a *PriorModel* of a registered class are pickled instead.
+    """
+    priors = []
+
+    schema = [
+        entry_from_gaussian_model(gaussian_model=gaussian_model, priors=priors)
+        for gaussian_model in gaussian_models
+    ]
+
+    return {
+        "version": version,
+        "gaussians": schema,
+        "priors": list(map(dict_from_prior, priors)),
+    }
+
+
+def gaussian_models_from_dict(models_dict):
+    """
+    Make the list of Gaussian models from a dictionary output by *dict_from_gaussian_models*.
+    """
+    check_version(serialized_dict=models_dict)
+
+    priors = list(map(prior_from_dict, models_dict["priors"]))
+
+    return [
+        gaussian_model_from_entry(entry=entry, priors=priors)
+        for entry in models_dict["gaussians"]
+    ]
+
+
+def output_instance(instance, file_path):
+
+    with open(file_path, "w") as f:
+        json.dump(dict_from_instance(instance=instance), f)
+
+
+def load_instance(file_path):
+
+    with open(file_path) as f:
+        return instance_from_dict(instance_dict=json.load(f))
+
+
+def output_gaussian_models(gaussian_models, file_path):
+
+    with open(file_path, "w") as f:
+        json.dump(dict_from_gaussian_models(gaussian_models=gaussian_models), f)
+
+
+def load_gaussian_models(file_path):
+
+    with open(file_path) as f:
+        return gaussian_models_from_dict(models_dict=json.load(f))
+
+
+def most_likely_model_instance_from_phase_output(phase_output):
+    """
+    The most likely model instance of an aggregator's phase output, which is loaded from the phase's 'instance.json' \
+    (see the model_and_instance_json general config option) without unpickling its optimizer or model, or from its \
+    pickled non-linear output if the phase did not write one.
+    """
+    file_path = "{}/instance.json".format(phase_output.directory)
+
+    if os.path.exists(file_path):
+        return load_instance(file_path=file_path)
+
+    return phase_output.output.most_likely_model_instance
+
+
+def gaussian_models_from_phase_output(phase_output):
+    """
+    The Gaussian models of an aggregator's phase output, which are loaded from the phase's 'model.json' without \
+    unpickling its model, or from its pickled model if the phase did not write one.
+    """
+    file_path = "{}/model.json".format(phase_output.directory)
+
+    if os.path.exists(file_path):
+        return load_gaussian_models(file_path=file_path)
+
+    return list(phase_output.model.gaussians)
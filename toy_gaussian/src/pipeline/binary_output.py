@@ -0,0 +1,242 @@
+import json
+import os
+import struct
+
+import numpy as np
+
+chunk_header = struct.Struct("<4sII")
+
+evaluated_kind = b"EVAL"
+posterior_kind = b"POST"
+
+
+def output_header(path, header):
+    """
+    Write the JSON header of a binary output, replacing any existing header atomically.
+    """
+    temporary_path = "{}/header.json.{}.tmp".format(path, os.getpid())
+
+    with open(temporary_path, "w") as f:
+        json.dump(header, f, indent=4)
+
+    os.replace(temporary_path, "{}/header.json".format(path))
+
+
+def chunks_from_data(data):
+    """
+    The complete chunks of the data of a samples file, as tuples of their kind, number of rows, number of columns \
+    and start and end offsets in the data (including their header). An incomplete final chunk is ignored.
+    """
+    offset = 0
+
+    while offset + chunk_header.size <= len(data):
+
+        kind, rows, columns = chunk_header.unpack_from(data, offset)
+
+        end = offset + chunk_header.size + rows * columns * 8
+
+        if end > len(data):
+            break
+
+        yield kind, rows, columns, offset, end
+
+        offset = end
+
+
+def load(path):
+    """
+    Load a binary output, without unpickling any classes.
+
+    Only the last posterior chunk of the samples file is loaded, which is the posterior of the phase's latest run.
+
+    Returns
+    -------
+    (dict, {str: ndarray})
+        The header of the output, and the evaluated and posterior samples as 2D arrays whose columns are given by the \
+        header's 'evaluated_columns' and 'posterior_columns'.
+    """
+    with open("{}/header.json".format(path)) as f:
+        header = json.load(f)
+
+    chunks = {evaluated_kind: [], posterior_kind: []}
+
+    try:
+        with open("{}/samples.bin".format(path), "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        data = b""
+
+    for kind, rows, columns, start, end in chunks_from_data(data=data):
+        array = np.frombuffer(
+            data, dtype="<f8", count=rows * columns, offset=start + chunk_header.size
+        ).reshape(rows, columns)
+
+        if kind == posterior_kind:
+            chunks[kind] = [array]
+        else:
+            chunks.setdefault(kind, []).append(array)
+
+    return (
+        header,
+        {
+            kind.decode(): np.concatenate(arrays) if arrays else np.zeros((0, 0))
+            for kind, arrays in chunks.items()
+        },
+    )
+
+
+class BinaryOutput(object):
+    def __init__(self, path, header, flush_interval=10):
+        """
+        A compact binary output of a phase, which stores the phase's metadata in one small JSON header and its \
+        samples in one chunked binary array file.
+
+        The file 'samples.bin' is a sequence of chunks, each of which is a 12 byte header (a 4 byte kind, the number \
+        of rows and the number of columns) followed by the rows as little-endian float64s:
+
+        - 'EVAL' chunks hold every model evaluated by the non-linear search (including models whose likelihood is \
+          loaded from the likelihood memo), whose columns are its log likelihood and parameters.
+        - One 'POST' chunk holds the weighted posterior samples of the non-linear search when the phase finishes, \
+          whose columns are their weight, log likelihood and parameters, and is replaced if the phase is rerun.
+
+        Evaluated samples are buffered and appended to the file every *flush_interval* samples (the backup_interval \
+        of the general config), after which the file is fsync'd. An incomplete final chunk (e.g. from a crash) is \
+        ignored when the output is loaded by *binary_output.load*. A phase which is resumed appends to its existing \
+        samples file, which is first truncated to the end of its last complete chunk so the chunks appended after a \
+        crash are not lost behind an incomplete one.
+
+        Parameters
+        ----------
+        path : str
+            The directory the header and samples are written to.
+        header : dict
+            The metadata of the phase, e.g. its pipeline name, phase name and settings, which must be JSON \
+            serializable.
+        flush_interval : int
+            The number of evaluated samples buffered before they are appended to the samples file.
+        """
+        self.path = path
+        self.header = header
+        self.flush_interval = flush_interval
+        self.pending = []
+
+        os.makedirs(path, exist_ok=True)
+
+        try:
+            with open("{}/header.json".format(path)) as f:
+                previous_header = json.load(f)
+        except FileNotFoundError:
+            previous_header = {}
+
+        for name in ("evaluated_columns", "posterior_columns"):
+            if name in previous_header:
+                self.header.setdefault(name, previous_header[name])
+
+        output_header(path=path, header=self.header)
+
+        self.truncate_incomplete_chunk()
+
+    @property
+    def samples_path(self):
+        return "{}/samples.bin".format(self.path)
+
+    def truncate_incomplete_chunk(self):
+        """
+        Remove an incomplete final chunk from the samples file (e.g. one being written when a phase crashed), by \
+        truncating the file to the end of its last complete chunk.
+        """
+        try:
+            with open(self.samples_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        end = 0
+
+        for _, _, _, _, end in chunks_from_data(data=data):
+            pass
+
+        if end < len(data):
+            os.truncate(self.samples_path, end)
+
+    def add_sample(self, log_likelihood, columns):
+        """
+        Add an evaluated model, whose parameters are given as a dictionary of column names and values (e.g. \
+        from *results_store.columns_from_gaussians*).
+
+        The column names of the first sample are written to the header and define the order of the parameters of \
+        every later sample.
+        """
+        if "evaluated_columns" not in self.header:
+            self.header["evaluated_columns"] = ["log_likelihood"] + list(columns)
+            output_header(path=self.path, header=self.header)
+
+        self.pending.append(
+            [log_likelihood]
+            + [
+                columns.get(name, np.nan)
+                for name in self.header["evaluated_columns"][1:]
+            ]
+        )
+
+        if len(self.pending) >= self.flush_interval:
+            self.flush()
+
+    def add_chunk(self, kind, array):
+
+        array = np.ascontiguousarray(array, dtype="<f8")
+
+        with open(self.samples_path, "ab") as f:
+            f.write(chunk_header.pack(kind, array.shape[0], array.shape[1]))
+            f.write(array.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def flush(self):
+
+        if not self.pending:
+            return
+
+        self.add_chunk(kind=evaluated_kind, array=np.array(self.pending))
+        self.pending = []
+
+    def add_posterior(self, weights, log_likelihoods, parameters, param_names):
+        """
+        Add the weighted posterior samples of the non-linear search, e.g. when the phase finishes.
+
+        The output holds one posterior, so if the samples file already has a posterior chunk (e.g. because a finished \
+        phase is rerun) it is replaced, by rewriting the file without it and replacing the file atomically.
+        """
+        self.header["posterior_columns"] = ["weight", "log_likelihood"] + list(
+            param_names
+        )
+        output_header(path=self.path, header=self.header)
+
+        array = np.column_stack((weights, log_likelihoods, parameters))
+
+        try:
+            with open(self.samples_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+
+        chunks = list(chunks_from_data(data=data))
+
+        if all(kind != posterior_kind for kind, _, _, _, _ in chunks):
+            self.add_chunk(kind=posterior_kind, array=array)
+            return
+
+        array = np.ascontiguousarray(array, dtype="<f8")
+
+        temporary_path = "{}.{}.tmp".format(self.samples_path, os.getpid())
+
+        with open(temporary_path, "wb") as f:
+            for kind, _, _, start, end in chunks:
+                if kind != posterior_kind:
+                    f.write(data[start:end])
+            f.write(chunk_header.pack(posterior_kind, array.shape[0], array.shape[1]))
+            f.write(array.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temporary_path, self.samples_path)
@@ -0,0 +1,708 @@
+import io
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import statistics
+import time
+from multiprocessing import shared_memory
+
+import autofit as af
+import numpy as np
+from autofit.exc import FitException
+from autofit.optimize import grid_search as af_grid_search
+from toy_gaussian.src import exc
+
+logger = logging.getLogger(__name__)
+
+# The analysis of a grid search, loaded once per worker process from shared memory by initialize_worker.
+_analysis = None
+
+# The shared memory block of the analysis loaded by a worker process, which its arrays are views of.
+_shared_memory = None
+
+# The alignment in bytes of every array in the shared memory block of a *SharedAnalysis*.
+alignment = 64
+
+
+class SharedArrayPickler(pickle.Pickler):
+    def __init__(self, file):
+        """
+        Pickles an object with the data of every numpy array it contains (e.g. the image, noise-map and grids of a \
+        *MaskedImaging*) left out of the pickle, such that the data can be placed in shared memory.
+
+        Every array is pickled as a reference to its data in the list *arrays*, with its class, shape, dtype and \
+        attributes (e.g. the mask of an *aa.Array*).
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.arrays = []
+        self.offsets = {}
+        self.size = 0
+
+    def persistent_id(self, obj):
+
+        if not isinstance(obj, np.ndarray) or obj.dtype.hasobject:
+            return None
+
+        if id(obj) not in self.offsets:
+
+            self.offsets[id(obj)] = self.size
+            self.arrays.append(obj)
+            self.size += -(-obj.nbytes // alignment) * alignment
+
+        return (
+            type(obj),
+            self.offsets[id(obj)],
+            obj.shape,
+            obj.dtype.str,
+            getattr(obj, "__dict__", {}),
+        )
+
+
+class SharedArrayUnpickler(pickle.Unpickler):
+    def __init__(self, file, buffer):
+        """
+        Unpickles an object pickled by a *SharedArrayPickler*, rebuilding every array as a read-only view of its \
+        data in *buffer*, the shared memory block, rather than a copy.
+        """
+        super().__init__(file)
+
+        self.buffer = buffer
+
+    def persistent_load(self, pid):
+
+        cls, offset, shape, dtype, attributes = pid
+
+        array = np.ndarray(
+            shape=shape, dtype=np.dtype(dtype), buffer=self.buffer, offset=offset
+        )
+        array.flags.writeable = False
+
+        if cls is not np.ndarray:
+            array = array.view(cls)
+            array.__dict__.update(attributes)
+
+        return array
+
+
+class SharedAnalysis(object):
+    def __init__(self, analysis):
+        """
+        Places an analysis, and therefore its masked dataset, in a block of shared memory which every worker process \
+        of a grid search pool loads it from.
+
+        The data of every numpy array of the analysis (e.g. the image, noise-map and grids of its *MaskedImaging*) is \
+        copied into the block once, and every worker's copy of an array is a read-only view of it, such that the \
+        workers share one copy of the data rather than each holding their own. The rest of the analysis is pickled \
+        into the end of the block and unpickled once by every worker.
+
+        Parameters
+        ----------
+        analysis : af.Analysis
+            The analysis (e.g. containing the *MaskedImaging*) every cell of the grid search fits.
+        """
+        data = io.BytesIO()
+
+        pickler = SharedArrayPickler(file=data)
+        pickler.dump(analysis)
+
+        data = data.getvalue()
+
+        self.offset = pickler.size
+        self.size = len(data)
+        self.shared_memory = shared_memory.SharedMemory(
+            create=True, size=self.offset + self.size
+        )
+
+        for array in pickler.arrays:
+            offset = pickler.offsets[id(array)]
+            self.shared_memory.buf[offset : offset + array.nbytes] = (
+                np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+            )
+
+        self.shared_memory.buf[self.offset : self.offset + self.size] = data
+
+    @property
+    def name(self):
+        return self.shared_memory.name
+
+    def close(self):
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def analysis_from_shared_memory(block, offset, size):
+    """
+    Load the analysis placed in a block of shared memory by a *SharedAnalysis*, whose arrays are views of the block.
+    """
+    return SharedArrayUnpickler(
+        file=io.BytesIO(bytes(block.buf[offset : offset + size])), buffer=block.buf
+    ).load()
+
+
+def initialize_worker(name, offset, size):
+    """
+    Pool initializer which loads the grid search analysis from shared memory into this worker process.
+
+    The block stays open for the life of the worker, as the arrays of the analysis are views of it.
+    """
+    global _analysis, _shared_memory
+
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    _analysis = analysis_from_shared_memory(
+        block=_shared_memory, offset=offset, size=size
+    )
+
+
+def perform_cell(cell):
+    """
+    Fit one cell of a grid search in a worker process, using the analysis loaded by *initialize_worker*.
+
+    Returns
+    -------
+    (int, af.Result, float)
+        The index of the cell, the result of its non-linear search and the time it took in seconds.
+    """
+    start = time.time()
+    result = cell.perform(analysis=_analysis)
+    return cell.index, result, time.time() - start
+
+
+def estimate_cell(cell):
+    """
+    Estimate the time of a cell of a grid search in a worker process, as the time of one fit of the instance at the \
+    median of its priors (see *timings_with_estimates*).
+
+    Returns
+    -------
+    (str, float)
+        The label of the cell and its estimated time in seconds.
+    """
+    start = time.time()
+
+    try:
+        _analysis.fit(instance=cell.model.instance_from_prior_medians())
+    except FitException:
+        pass
+
+    return cell.label, time.time() - start
+
+
+class Cell(object):
+    def __init__(self, index, label, values, model, optimizer):
+        """
+        A single cell of a grid search, which fits the model with the grid priors restricted to the cell's range.
+
+        Parameters
+        ----------
+        index : int
+            The index of the cell in the grid search's list of cells.
+        label : str
+            A label naming the cell, unique to its grid prior ranges, which is used for its output folder.
+        values : [float]
+            The lower limits of the cell in unit values.
+        model : af.ModelMapper
+            The model fitted in the cell, with its grid priors replaced by the cell's *UniformPrior*'s.
+        optimizer : af.NonLinearOptimizer
+            The non-linear optimizer used to fit the cell.
+        """
+        self.index = index
+        self.label = label
+        self.values = values
+        self.model = model
+        self.optimizer = optimizer
+
+    def perform(self, analysis):
+        return self.optimizer.fit(analysis=analysis, model=self.model)
+
+
+def cell_order_from_timings(cells, timings):
+    """
+    Order the cells of a grid search such that the slowest cells, as timed by a previous run of the same grid search, \
+    are performed first. Cells without a timing keep their original order but are performed after timed cells.
+
+    Performing the longest cells first (longest-processing-time scheduling) stops a slow cell starting last and \
+    leaving every other worker idle whilst it finishes.
+
+    Parameters
+    ----------
+    cells : [Cell]
+        The cells of the grid search.
+    timings : {str: float}
+        The time in seconds each cell took on a previous run, keyed by its label.
+    """
+    return sorted(
+        cells,
+        key=lambda cell: (cell.label not in timings, -timings.get(cell.label, 0.0)),
+    )
+
+
+def timings_with_estimates(cells, timings, estimates):
+    """
+    The timings of a grid search's cells, where a cell without a timing from a previous run is given an estimate, \
+    such that the first run of a grid search also performs its slowest cells first.
+
+    A cell's estimate is the time of one fit at the median of its priors (see *estimate_cell*), which is scaled to \
+    the time of a whole cell by the median ratio of the timing and estimate of the cells which have both, if any.
+
+    Parameters
+    ----------
+    cells : [Cell]
+        The cells of the grid search.
+    timings : {str: float}
+        The time in seconds each cell took on a previous run, keyed by its label.
+    estimates : {str: float}
+        The time in seconds of a fit at the median of every cell's priors, keyed by its label.
+    """
+    ratios = [
+        timings[cell.label] / estimates[cell.label]
+        for cell in cells
+        if cell.label in timings and estimates.get(cell.label, 0.0) > 0.0
+    ]
+
+    scale = statistics.median(ratios) if ratios else 1.0
+
+    estimated_timings = {
+        cell.label: scale * estimates[cell.label]
+        for cell in cells
+        if cell.label in estimates
+    }
+    estimated_timings.update(timings)
+
+    return estimated_timings
+
+
+class SuccessiveHalving(object):
+    def __init__(self, initial_max_iter=100, reduction_factor=2, number_of_survivors=1):
+        """
+        Settings of a grid search which prunes its cells by successive halving.
+
+        Every cell is first fitted with a short budget of *initial_max_iter* non-linear search iterations. The cells \
+        are ranked by figure of merit, the worst are pruned such that only 1 / *reduction_factor* of them survive, and \
+        the survivors continue with a budget *reduction_factor* times larger. Once *number_of_survivors* or fewer cells \
+        remain they are fitted to full convergence.
+
+        The budget is set via the optimizer's max_iter attribute, such that a surviving cell's MultiNest search resumes \
+        from its previous round rather than starting again.
+
+        Parameters
+        ----------
+        initial_max_iter : int
+            The number of iterations every cell is fitted for in the first round.
+        reduction_factor : int
+            The factor by which the number of cells is reduced and the budget of the survivors is increased each round.
+        number_of_survivors : int
+            The number of best cells which are fitted to full convergence.
+        """
+        if reduction_factor < 2:
+            raise exc.PhaseException(
+                "The reduction_factor of a SuccessiveHalving grid search must be 2 or above"
+            )
+
+        self.initial_max_iter = initial_max_iter
+        self.reduction_factor = reduction_factor
+        self.number_of_survivors = max(1, number_of_survivors)
+
+    def number_kept(self, number_of_cells):
+        return max(self.number_of_survivors, number_of_cells // self.reduction_factor)
+
+
+def available_cores(number_of_cores):
+    """
+    The number of worker processes a grid search uses, which is the number of cores requested less the load already \
+    on the machine, such that a grid search does not oversubscribe a node shared with other runs.
+    """
+    try:
+        load = int(os.getloadavg()[0])
+    except (AttributeError, OSError):
+        load = 0
+
+    return max(1, min(number_of_cores, multiprocessing.cpu_count() - load))
+
+
+class GridSearch(af_grid_search.GridSearch):
+    def __init__(
+        self,
+        paths,
+        number_of_steps=4,
+        optimizer_class=af.MultiNest,
+        parallel=False,
+        number_of_cores=None,
+        pruning=None,
+    ):
+        """
+        A grid search which, if run in parallel, fits its cells on a local pool of worker processes.
+
+        The analysis is shared with the workers via shared memory, cells are handed to workers as they become free \
+        and the cells which were slowest on a previous run of the grid search, or are estimated to be slowest if it \
+        has not been run before, are performed first.
+
+        Parameters
+        ----------
+        number_of_cores : int or None
+            The maximum number of worker processes, which defaults to the *GridSearch* number_of_cores config \
+            value.
+        pruning : SuccessiveHalving or None
+            If input, cells are given short budgets and the worst are pruned, such that only the best cells are \
+            fitted to full convergence.
+        """
+        super().__init__(
+            paths=paths,
+            number_of_steps=number_of_steps,
+            optimizer_class=optimizer_class,
+            parallel=parallel,
+        )
+
+        if number_of_cores is not None:
+            self.number_of_cores = number_of_cores
+
+        self.pruning = pruning
+
+    @property
+    def timings_path(self):
+        return "{}/grid_search_timings.json".format(self.paths.phase_output_path)
+
+    def load_timings(self):
+        try:
+            with open(self.timings_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_timings(self, timings):
+        with open(self.timings_path, "w") as f:
+            json.dump(timings, f, indent=4)
+
+    def optimizer_for_cell(self, name_path):
+        """
+        Create the optimizer of a cell, copying every setting customized on the grid search (e.g. n_live_points) to it.
+        """
+        optimizer = self.optimizer_class(
+            paths=af.Paths(
+                phase_name=name_path,
+                phase_tag="",
+                phase_folders=self.paths.phase_folders,
+            )
+        )
+
+        for key, value in self.__dict__.items():
+            if key not in (
+                "model",
+                "instance",
+                "paths",
+                "number_of_cores",
+                "parallel",
+                "pruning",
+            ):
+                try:
+                    setattr(optimizer, key, value)
+                except (AttributeError, TypeError):
+                    pass
+
+        return optimizer
+
+    def cells_from(self, model, grid_priors):
+
+        cells = []
+
+        for index, values in enumerate(self.make_lists(grid_priors)):
+
+            arguments = self.make_arguments(values=values, grid_priors=grid_priors)
+            cell_model = model.mapper_from_partial_prior_arguments(arguments)
+
+            label = "_".join(
+                "{}_{:.2f}_{:.2f}".format(
+                    cell_model.name_for_prior(prior),
+                    prior.lower_limit,
+                    prior.upper_limit,
+                )
+                for prior in sorted(arguments.values(), key=lambda prior: prior.id)
+            )
+
+            name_path = "{}/{}/{}".format(
+                self.paths.phase_name, self.paths.phase_tag, label
+            )
+
+            cells.append(
+                Cell(
+                    index=index,
+                    label=label,
+                    values=values,
+                    model=cell_model,
+                    optimizer=self.optimizer_for_cell(name_path=name_path),
+                )
+            )
+
+        return cells
+
+    def perform_cells(self, cells, analysis, timings, previous_timings=None):
+        """
+        Fit a list of cells, on a pool of worker processes if the grid search is parallel, returning a dictionary \
+        mapping the index of every cell to its result.
+
+        The time of every cell performed is added to its entry in *timings*. A parallel grid search performs the \
+        slowest cells first, according to *previous_timings* (the timings of a previous run) and, for cells without \
+        a previous timing, an estimate (see *timings_with_estimates*).
+        """
+        if not self.parallel:
+            return self.perform_cells_sequential(
+                cells=cells, analysis=analysis, timings=timings
+            )
+
+        previous_timings = previous_timings or {}
+
+        processes = available_cores(number_of_cores=min(self.number_of_cores, len(cells)))
+
+        logger.info(
+            "Performing {} grid search cells on {} processes".format(
+                len(cells), processes
+            )
+        )
+
+        results = {}
+
+        with SharedAnalysis(analysis=analysis) as shared_analysis:
+            with multiprocessing.Pool(
+                processes=processes,
+                initializer=initialize_worker,
+                initargs=(
+                    shared_analysis.name,
+                    shared_analysis.offset,
+                    shared_analysis.size,
+                ),
+            ) as pool:
+
+                if any(cell.label not in previous_timings for cell in cells):
+                    previous_timings = timings_with_estimates(
+                        cells=cells,
+                        timings=previous_timings,
+                        estimates=dict(pool.map(estimate_cell, cells, chunksize=1)),
+                    )
+
+                cells = cell_order_from_timings(cells=cells, timings=previous_timings)
+                labels = {cell.index: cell.label for cell in cells}
+
+                for index, result, elapsed in pool.imap_unordered(
+                    perform_cell, cells, chunksize=1
+                ):
+                    results[index] = result
+                    timings[labels[index]] = timings.get(labels[index], 0.0) + elapsed
+
+        return results
+
+    @staticmethod
+    def perform_cells_sequential(cells, analysis, timings):
+
+        results = {}
+
+        for cell in cells:
+            start = time.time()
+            results[cell.index] = cell.perform(analysis=analysis)
+            timings[cell.label] = timings.get(cell.label, 0.0) + time.time() - start
+
+        return results
+
+    def write_results_table(self, model, grid_priors, cells, results):
+
+        results_list = [
+            list(map(model.name_for_prior, grid_priors))
+            + ["figure_of_merit", "pruned"]
+        ]
+
+        for cell, result in zip(cells, results):
+            results_list.append(
+                [
+                    prior.lower_limit + value * prior.width
+                    for value, prior in zip(cell.values, grid_priors)
+                ]
+                + [result.figure_of_merit, getattr(result, "pruned", False)]
+            )
+
+        with open("{}/results".format(self.paths.phase_output_path), "w") as f:
+            f.write(
+                "\n".join(
+                    ", ".join(
+                        "{:.2f}".format(value) if isinstance(value, float) else str(value)
+                        for value in row
+                    )
+                    for row in results_list
+                )
+            )
+
+    def fit(self, analysis, model, grid_priors):
+
+        if self.pruning is not None:
+            return self.fit_pruned(analysis=analysis, model=model, grid_priors=grid_priors)
+
+        return super().fit(analysis, model, grid_priors)
+
+    def fit_parallel(self, analysis, model, grid_priors):
+
+        grid_priors = list(set(grid_priors))
+
+        cells = self.cells_from(model=model, grid_priors=grid_priors)
+
+        timings = {}
+        results = self.perform_cells(
+            cells=cells,
+            analysis=analysis,
+            timings=timings,
+            previous_timings=self.load_timings(),
+        )
+        self.save_timings(timings=timings)
+
+        return self.grid_search_result_from(
+            model=model, grid_priors=grid_priors, cells=cells, results=results
+        )
+
+    def fit_pruned(self, analysis, model, grid_priors):
+        """
+        Fit the grid search by successive halving (see *SuccessiveHalving*).
+
+        Every cell has a result in the returned *GridSearchResult*. The result of a pruned cell is that of the last \
+        round it was fitted in and has its pruned attribute set to *True*.
+        """
+        grid_priors = list(set(grid_priors))
+
+        cells = self.cells_from(model=model, grid_priors=grid_priors)
+
+        previous_timings = self.load_timings()
+        timings = {}
+        results = {}
+        pruned = set()
+
+        surviving = cells
+        max_iter = self.pruning.initial_max_iter
+
+        while len(surviving) > self.pruning.number_of_survivors:
+
+            for cell in surviving:
+                cell.optimizer.max_iter = max_iter
+
+            results.update(
+                self.perform_cells(
+                    cells=surviving,
+                    analysis=analysis,
+                    timings=timings,
+                    previous_timings=previous_timings,
+                )
+            )
+
+            ranked = sorted(
+                surviving,
+                key=lambda cell: results[cell.index].figure_of_merit,
+                reverse=True,
+            )
+
+            number_kept = self.pruning.number_kept(number_of_cells=len(ranked))
+
+            pruned.update(cell.index for cell in ranked[number_kept:])
+            surviving = ranked[:number_kept]
+
+            logger.info(
+                "Grid search pruned {} cells, {} remain".format(
+                    len(ranked) - number_kept, number_kept
+                )
+            )
+
+            max_iter *= self.pruning.reduction_factor
+
+        for cell in surviving:
+            cell.optimizer.max_iter = 0
+
+        results.update(
+            self.perform_cells(
+                cells=surviving,
+                analysis=analysis,
+                timings=timings,
+                previous_timings=previous_timings,
+            )
+        )
+
+        self.save_timings(timings=timings)
+
+        for index, result in results.items():
+            result.pruned = index in pruned
+
+        return self.grid_search_result_from(
+            model=model, grid_priors=grid_priors, cells=cells, results=results
+        )
+
+    def grid_search_result_from(self, model, grid_priors, cells, results):
+
+        results = [results[cell.index] for cell in cells]
+
+        self.write_results_table(
+            model=model, grid_priors=grid_priors, cells=cells, results=results
+        )
+
+        grid_search_result = af_grid_search.GridSearchResult(
+            results=results, lists=[cell.values for cell in cells]
+        )
+
+        grid_search_result.physical_lower_limits_lists = [
+            [
+                prior.lower_limit + value * prior.width
+                for value, prior in zip(cell.values, grid_priors)
+            ]
+            for cell in cells
+        ]
+        grid_search_result.pruned = [
+            getattr(result, "pruned", False) for result in results
+        ]
+
+        return grid_search_result
+
+
+def as_grid_search(phase_class, parallel=False, number_of_cores=None, pruning=None):
+    """
+    Extend a phase class (e.g. *PhaseImaging*) into a grid search phase, in the same way as *af.as_grid_search*, but \
+    where the cells of a parallel grid search are fitted on a local pool of worker processes (see *GridSearch*).
+
+    Parameters
+    ----------
+    phase_class : type
+        The phase class which is extended.
+    parallel : bool
+        If *True* the cells of the grid search are fitted in parallel.
+    number_of_cores : int or None
+        The maximum number of worker processes, which defaults to the *GridSearch* number_of_cores config value.
+    pruning : SuccessiveHalving or None
+        If input, the grid search prunes its worst cells by successive halving.
+    """
+
+    class GridSearchExtension(af.as_grid_search(phase_class=phase_class, parallel=parallel)):
+        @af.convert_paths
+        def __init__(
+            self,
+            paths,
+            *,
+            number_of_steps=4,
+            optimizer_class=af.MultiNest,
+            **kwargs
+        ):
+            super().__init__(
+                paths,
+                number_of_steps=number_of_steps,
+                optimizer_class=optimizer_class,
+                **kwargs
+            )
+
+            self.optimizer = GridSearch(
+                paths=self.paths,
+                number_of_steps=number_of_steps,
+                optimizer_class=optimizer_class,
+                parallel=parallel,
+                number_of_cores=number_of_cores,
+                pruning=pruning,
+            )
+
+    return GridSearchExtension
@@ -1,5 +1,9 @@
+import time
+
 import autofit as af
 from autofit.tools.phase import Dataset
+from toy_gaussian.src.aggregator import results_store
+from toy_gaussian.src.model import serialization
 from toy_gaussian.src.pipeline.phase import abstract
 from toy_gaussian.src.pipeline.phase.dataset.result import Result
 
@@ -51,9 +55,65 @@ class PhaseDataset(abstract.AbstractPhase):
         self.customize_priors(results)
         self.assert_and_save_pickle()
 
+        start = time.time()
+
         result = self.run_analysis(analysis)
 
-        return self.make_result(result=result, analysis=analysis)
+        result = self.make_result(result=result, analysis=analysis)
+
+        if af.conf.instance.general.get("output", "model_and_instance_json", bool):
+            self.output_model_and_instance(instance=result.instance)
+
+        if af.conf.instance.general.get("output", "results_store", bool):
+            results_store.ResultsStore(path=af.conf.instance.output_path).add_row(
+                row=self.results_store_row(
+                    result=result, elapsed_time=time.time() - start
+                )
+            )
+
+        return result
+
+    def output_model_and_instance(self, instance):
+        """
+        Output the phase's Gaussian models and most likely instance to 'model.json' and 'instance.json' in its \
+        output path, which are loaded by *serialization.load_gaussian_models* and *serialization.load_instance* \
+        without unpickling the phase.
+        """
+        serialization.output_gaussian_models(
+            gaussian_models=self.model.gaussians,
+            file_path="{}/model.json".format(self.paths.phase_output_path),
+        )
+        serialization.output_instance(
+            instance=instance,
+            file_path="{}/instance.json".format(self.paths.phase_output_path),
+        )
+
+    def settings_columns(self):
+        """
+        The settings of the phase (e.g. its sub-grid size) which are columns of its row in the results store.
+        """
+        return {}
+
+    def results_store_row(self, result, elapsed_time):
+        """
+        The row of the phase in the results store, see *aggregator.results_store.ResultsStore*.
+        """
+        row = {
+            "pipeline": self.paths.pipeline_name,
+            "phase": self.paths.phase_name,
+            "phase_tag": self.paths.phase_tag,
+            "directory": self.paths.phase_output_path,
+            "figure_of_merit": result.figure_of_merit,
+            "evidence": results_store.evidence_from_optimizer(optimizer=self.optimizer),
+            "elapsed_time": elapsed_time,
+        }
+
+        row.update(self.settings_columns())
+        row.update(
+            results_store.columns_from_gaussians(gaussians=result.instance.gaussians)
+        )
+
+        return row
 
     def make_analysis(self, dataset, results=None, mask=None):
         """
@@ -2,12 +2,48 @@ from toy_gaussian.src.pipeline.phase.abstract import result
 
 
 class Result(result.Result):
+    def __init__(
+        self,
+        instance,
+        figure_of_merit,
+        previous_model,
+        gaussian_tuples,
+        analysis,
+        optimizer,
+    ):
+        """
+        The result of a dataset phase, whose most likely fit is computed on first access and cached.
+
+        A pipeline holding many results can release the memory of their fits using *drop_fit*, after which a fit is \
+        recomputed if it is accessed again.
+        """
+        super().__init__(
+            instance=instance,
+            figure_of_merit=figure_of_merit,
+            previous_model=previous_model,
+            gaussian_tuples=gaussian_tuples,
+            analysis=analysis,
+            optimizer=optimizer,
+        )
+
+        self._most_likely_fit = None
+
+    def fit_from_instance(self, instance):
+        raise NotImplementedError()
+
     @property
     def most_likely_fit(self):
 
-        return self.analysis.masked_imaging_fit_for_tracer(
-            tracer=self.most_likely_tracer
-        )
+        if self._most_likely_fit is None:
+            self._most_likely_fit = self.fit_from_instance(instance=self.instance)
+
+        return self._most_likely_fit
+
+    def drop_fit(self):
+        """
+        Release the cached most likely fit and its arrays (e.g. residual and chi-squared maps).
+        """
+        self._most_likely_fit = None
 
     @property
     def mask(self):
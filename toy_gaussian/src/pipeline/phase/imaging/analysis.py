@@ -2,17 +2,55 @@ import autofit as af
 from autoarray.exc import InversionException
 from autofit.exc import FitException
 from autoarray.fit.fit import fit_masked_dataset
-from toy_gaussian.src.pipeline import visualizer
+from toy_gaussian.src.model import fast_gaussians
+from toy_gaussian.src.pipeline import profiling, visualizer, visualizer_worker
+from toy_gaussian.src.aggregator import results_store
+from toy_gaussian.src.pipeline.phase.imaging import likelihood_cache as lc
 
 
 class Analysis(af.Analysis):
-    def __init__(self, masked_imaging, image_path=None, results=None):
+    def __init__(
+        self,
+        masked_imaging,
+        image_path=None,
+        results=None,
+        likelihood_cache=None,
+        binary_output=None,
+        profiler=None,
+        telemetry=None,
+    ):
 
         self.visualizer = visualizer.PhaseImagingVisualizer(
             masked_dataset=masked_imaging, image_path=image_path
         )
 
         self.masked_imaging = masked_imaging
+        self.likelihood_cache = likelihood_cache
+        self.binary_output = binary_output
+        self.profiler = profiler
+        self.telemetry = telemetry
+
+        self.visualizer_worker = visualizer_worker.visualizer_worker_from(
+            analysis=self
+        )
+
+    def __getstate__(self):
+        """
+        The visualizer worker's process and queue cannot be pickled, so a copy of an analysis (e.g. in a visualizer \
+        worker or parallel grid search process) visualizes synchronously. A copy is not profiled and has no telemetry, as \
+        its totals would not reach the phase's output.
+
+        A copy also has no likelihood memo or binary output, as the processes of a parallel grid search would append \
+        to the same memo and samples files, interleaving their chunks, and the rows a process had not yet flushed \
+        would be lost when it exits.
+        """
+        state = self.__dict__.copy()
+        state["visualizer_worker"] = None
+        state["profiler"] = None
+        state["telemetry"] = None
+        state["likelihood_cache"] = None
+        state["binary_output"] = None
+        return state
 
     def fit(self, instance):
         """
@@ -29,31 +67,127 @@ class Analysis(af.Analysis):
             A fractional value indicating how well this model fit and the model masked_imaging itself
         """
 
+        with profiling.stage(profiler=self.telemetry, name="likelihood"):
+
+            if self.profiler is None:
+                return self.figure_of_merit_from_instance(instance=instance)
+
+            with self.profiler.fit():
+                return self.figure_of_merit_from_instance(instance=instance)
+
+    def figure_of_merit_from_instance(self, instance):
+        """
+        The figure of merit of an instance, which is loaded from the likelihood cache if the instance has already \
+        been fitted. Every instance is added to the binary output as an evaluated sample, including those loaded from \
+        the cache, so the binary output holds every model the non-linear search evaluated.
+        """
+        if self.likelihood_cache is not None:
+            key = lc.parameter_key_from_instance(instance=instance)
+            figure_of_merit = self.likelihood_cache.figure_of_merit_for_key(key=key)
+            if figure_of_merit is not None:
+                with profiling.stage(profiler=self.telemetry, name="io"):
+                    self.add_sample_to_binary_output(
+                        instance=instance, figure_of_merit=figure_of_merit
+                    )
+                return figure_of_merit
+
         try:
-            fit = self.masked_imaging_fit_from_instance(instance=instance)
-            return fit.figure_of_merit
+            fit = self.masked_imaging_fit_from_instance(
+                instance=instance, profiler=self.profiler
+            )
+
+            with profiling.stage(profiler=self.profiler, name="figure_of_merit"):
+                figure_of_merit = fit.figure_of_merit
         except InversionException as e:
             raise FitException from e
 
-    def masked_imaging_fit_from_instance(self, instance):
+        with profiling.stage(profiler=self.telemetry, name="io"):
 
-        gaussian_image = sum(
-            list(
-                map(
-                    lambda gaussian: gaussian.profile_image_from_grid(
-                        self.masked_imaging.grid
-                    ),
-                    instance.gaussians,
-                )
+            if self.likelihood_cache is not None:
+                self.likelihood_cache.add(key=key, figure_of_merit=figure_of_merit)
+
+            self.add_sample_to_binary_output(
+                instance=instance, figure_of_merit=figure_of_merit
+            )
+
+        return figure_of_merit
+
+    def add_sample_to_binary_output(self, instance, figure_of_merit):
+
+        if self.binary_output is not None:
+            self.binary_output.add_sample(
+                log_likelihood=figure_of_merit,
+                columns=results_store.columns_from_gaussians(
+                    gaussians=instance.gaussians
+                ),
             )
-        ).in_1d_binned
 
-        return fit_masked_dataset(
-            masked_dataset=self.masked_imaging, model_data=gaussian_image
+    def model_image_from_instance(self, instance, profiler=None):
+        """
+        The model image of an instance's Gaussians, which are evaluated as fast Gaussians with plain float parameters \
+        if every Gaussian is of a class with a fast Gaussian (see *fast_gaussians.FastGaussian*).
+
+        If a profiler is input the image of every Gaussian and the binning up of their sum are timed as stages of the \
+        fit (see *profiling.Profiler*).
+        """
+        gaussians = fast_gaussians.fast_gaussians_from_gaussians(
+            gaussians=instance.gaussians
+        )
+
+        if gaussians is None:
+            gaussians = instance.gaussians
+
+        if profiler is None:
+            return sum(
+                list(
+                    map(
+                        lambda gaussian: gaussian.profile_image_from_grid(
+                            self.masked_imaging.grid
+                        ),
+                        gaussians,
+                    )
+                )
+            ).in_1d_binned
+
+        profile_images = []
+
+        for index, gaussian in enumerate(gaussians):
+            with profiling.stage(
+                profiler=profiler, name="profile_image", index=index
+            ):
+                profile_images.append(
+                    gaussian.profile_image_from_grid(self.masked_imaging.grid)
+                )
+
+        with profiling.stage(profiler=profiler, name="in_1d_binned"):
+            return sum(profile_images).in_1d_binned
+
+    def masked_imaging_fit_from_instance(self, instance, profiler=None):
+
+        model_data = self.model_image_from_instance(
+            instance=instance, profiler=profiler
         )
 
+        with profiling.stage(profiler=profiler, name="fit_masked_dataset"):
+            return fit_masked_dataset(
+                masked_dataset=self.masked_imaging, model_data=model_data
+            )
+
     def visualize(self, instance, during_analysis):
 
+        with profiling.stage(profiler=self.telemetry, name="visualization"):
+            self.visualize_instance(
+                instance=instance, during_analysis=during_analysis
+            )
+
+    def visualize_instance(self, instance, during_analysis):
+
+        if self.visualizer_worker is not None:
+            self.visualizer_worker.visualize(
+                instance=instance, during_analysis=during_analysis
+            )
+            return
+
         fit = self.masked_imaging_fit_from_instance(instance=instance)
         self.visualizer.visualize_fit(
             fit=fit, gaussians=instance.gaussians, during_analysis=during_analysis
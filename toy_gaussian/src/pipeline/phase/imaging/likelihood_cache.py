@@ -0,0 +1,203 @@
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+
+def parameter_key_from_gaussian(gaussian):
+    """
+    A hashable key of a Gaussian's class and parameters, e.g. its centre, intensity and sigma.
+
+    Parameters are taken from the Gaussian's attributes which are floats or tuples of floats, such that dimensioned \
+    parameters (e.g. *dim.Length*) and their plain float equivalents give the same key.
+    """
+    parameters = []
+
+    for name, value in sorted(gaussian.__dict__.items()):
+        if isinstance(value, tuple):
+            if all(isinstance(item, (int, float)) for item in value):
+                parameters.append((name, tuple(float(item) for item in value)))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            parameters.append((name, float(value)))
+
+    return gaussian.__class__.__name__, tuple(parameters)
+
+
+def parameter_key_from_instance(instance):
+    """
+    A hashable key of every Gaussian in a model instance, which is equal for two instances whose Gaussians have the \
+    same parameters, even if they were created by different phases with different models and priors.
+    """
+    return tuple(map(parameter_key_from_gaussian, instance.gaussians))
+
+
+def digest_from_key(key):
+    """
+    A compact 16 byte digest of a parameter key, which is how figures of merit are stored in a *LikelihoodCache*.
+    """
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+
+
+def fingerprint_from_masked_imaging(masked_imaging):
+    """
+    A fingerprint of a masked imaging dataset, which changes if its image, noise map, psf, mask or sub-grid size do \
+    and therefore if the phase settings (e.g. signal_to_noise_limit, bin_up_factor) used to make it change.
+
+    A dataset without a psf is fingerprinted with a fixed marker in its place, as the bytes of *None* as an array \
+    are a pointer which changes every run.
+    """
+    fingerprint = hashlib.sha1()
+
+    for array in (
+        masked_imaging.image,
+        masked_imaging.noise_map,
+        masked_imaging.psf,
+        masked_imaging.mask,
+    ):
+        if array is None:
+            fingerprint.update(b"None")
+        else:
+            fingerprint.update(np.ascontiguousarray(array).tobytes())
+
+    fingerprint.update(str(masked_imaging.mask.sub_size).encode())
+
+    return fingerprint.hexdigest()
+
+
+class LikelihoodCache(object):
+    def __init__(self, fingerprint):
+        """
+        The figure of merit of every model instance an analysis has fitted, keyed by the parameters of the instance's \
+        Gaussians.
+
+        A cache only holds its figures of merit while its phase runs: the phase releases them once its search \
+        finishes, as the cache is kept alive by the phase's result (via its analysis) for the rest of the pipeline.
+
+        Parameters
+        ----------
+        fingerprint : str
+            The fingerprint of the masked dataset the figures of merit were computed using.
+        """
+        self.fingerprint = fingerprint
+        self.figures_of_merit = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.figures_of_merit)
+
+    def figure_of_merit_for_key(self, key):
+        """
+        The cached figure of merit of a parameter key, or *None* if the key has not been fitted.
+        """
+        figure_of_merit = self.figures_of_merit.get(digest_from_key(key=key))
+
+        if figure_of_merit is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return figure_of_merit
+
+    def add(self, key, figure_of_merit):
+        self.figures_of_merit[digest_from_key(key=key)] = figure_of_merit
+
+    def flush(self):
+        pass
+
+    @property
+    def hit_rate(self):
+
+        calls = self.hits + self.misses
+
+        if calls == 0:
+            return 0.0
+
+        return self.hits / calls
+
+    def release(self):
+        """
+        Release the figures of merit of the cache once its phase has finished, keeping its hit and miss counts.
+        """
+        self.flush()
+        self.figures_of_merit = {}
+
+
+class LikelihoodMemo(LikelihoodCache):
+
+    header = b"TGLM\x01"
+    record = struct.Struct("<16sd")
+
+    def __init__(self, fingerprint, memo_path, flush_interval=100):
+        """
+        A likelihood cache which is also stored on the hard-disk, such that a phase rerun with the same phase tag \
+        (e.g. after a crash, or by rerunning a runner script) does not recompute the likelihoods of instances it has \
+        already fitted.
+
+        Figures of merit are appended to the binary file '{memo_path}/{fingerprint}.memo' as fixed size records of a \
+        16 byte parameter digest and a float64, such that a memo is only ever reused for the same masked dataset. \
+        Records are buffered and written every *flush_interval* new figures of merit; an incomplete final record, \
+        e.g. from a crash mid-write, is ignored when the memo is loaded.
+
+        Parameters
+        ----------
+        fingerprint : str
+            The fingerprint of the masked dataset the figures of merit were computed using.
+        memo_path : str
+            The directory the memo file is stored in, which is typically in the phase's output path.
+        flush_interval : int
+            The number of new figures of merit which are buffered before being appended to the memo file.
+        """
+        super().__init__(fingerprint=fingerprint)
+
+        self.file_path = "{}/{}.memo".format(memo_path, fingerprint)
+        self.flush_interval = flush_interval
+        self.pending = []
+
+        os.makedirs(memo_path, exist_ok=True)
+
+        self.load()
+
+    def load(self):
+
+        try:
+            with open(self.file_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        if not data.startswith(self.header):
+            return
+
+        data = data[len(self.header) :]
+        number_of_records = len(data) // self.record.size
+
+        for digest, figure_of_merit in self.record.iter_unpack(
+            data[: number_of_records * self.record.size]
+        ):
+            self.figures_of_merit[digest] = figure_of_merit
+
+    def add(self, key, figure_of_merit):
+
+        digest = digest_from_key(key=key)
+
+        self.figures_of_merit[digest] = figure_of_merit
+        self.pending.append(self.record.pack(digest, figure_of_merit))
+
+        if len(self.pending) >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+
+        if not self.pending:
+            return
+
+        is_new = not os.path.exists(self.file_path)
+
+        with open(self.file_path, "ab") as f:
+            if is_new:
+                f.write(self.header)
+            f.write(b"".join(self.pending))
+
+        self.pending = []
@@ -1,6 +1,16 @@
+import pickle
+
 import autofit as af
-from toy_gaussian.src.pipeline import phase_tagging
+from toy_gaussian.src.aggregator import posterior
+from toy_gaussian.src.pipeline import (
+    binary_output,
+    phase_tagging,
+    profiling,
+    telemetry,
+)
 from toy_gaussian.src.pipeline.phase import dataset
+from toy_gaussian.src.pipeline.phase.imaging import likelihood_cache as lc
+from toy_gaussian.src.pipeline.phase.imaging import warm_start as ws
 from toy_gaussian.src.pipeline.phase.imaging.analysis import Analysis
 from toy_gaussian.src.pipeline.phase.imaging.meta_imaging_fit import MetaImagingFit
 from toy_gaussian.src.pipeline.phase.imaging.result import Result
@@ -22,6 +32,7 @@ class PhaseImaging(dataset.PhaseDataset):
         sub_size=2,
         signal_to_noise_limit=None,
         bin_up_factor=None,
+        warm_start=False,
     ):
 
         """
@@ -35,6 +46,10 @@ class PhaseImaging(dataset.PhaseDataset):
             The class of a non_linear optimizer
         sub_size: int
             The side length of the subgrid
+        warm_start: bool
+            If *True*, every prior of the model shared with the previous phase's model is replaced by a GaussianPrior \
+            centred on the previous phase's posterior, so the non-linear search starts where that posterior lies \
+            (see *warm_start.warm_started_model*).
         """
 
         phase_tag = phase_tagging.phase_tag_from_phase_settings(
@@ -53,6 +68,8 @@ class PhaseImaging(dataset.PhaseDataset):
             signal_to_noise_limit=signal_to_noise_limit,
         )
 
+        self.warm_start = warm_start
+
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
     def modify_image(self, image, results):
         """
@@ -99,15 +116,148 @@ class PhaseImaging(dataset.PhaseDataset):
         )
 
         self.output_phase_info()
+        self.output_mask_and_meta_imaging_fit(mask=mask)
+
+        likelihood_cache = self.likelihood_cache_from(masked_imaging=masked_imaging)
 
         analysis = self.Analysis(
             masked_imaging=masked_imaging,
             image_path=self.optimizer.paths.image_path,
             results=results,
+            likelihood_cache=likelihood_cache,
+            binary_output=self.binary_output_from(),
+            profiler=profiling.profiler_from(
+                path="{}/profiling".format(self.optimizer.paths.phase_output_path)
+            ),
+            telemetry=telemetry.telemetry_from(
+                phase_output_path=self.optimizer.paths.phase_output_path,
+                likelihood_cache=likelihood_cache,
+            ),
         )
 
         return analysis
 
+    def run_analysis(self, analysis):
+
+        if analysis.telemetry is not None:
+            analysis.telemetry.restart()
+
+        result = super().run_analysis(analysis)
+
+        if analysis.likelihood_cache is not None:
+            analysis.likelihood_cache.release()
+
+        if analysis.binary_output is not None:
+            analysis.binary_output.flush()
+            self.add_posterior_to_binary_output(output=analysis.binary_output)
+
+        if analysis.profiler is not None:
+            analysis.profiler.output()
+
+        if analysis.telemetry is not None:
+            analysis.telemetry.output(final=True)
+
+        return result
+
+    def binary_output_from(self):
+        """
+        Make the compact binary output of the analysis, if the binary_output general config option is on, which is \
+        written to the binary_output folder of the phase (see *binary_output.BinaryOutput*).
+        """
+        if not af.conf.instance.general.get("output", "binary_output", bool):
+            return None
+
+        header = {
+            "pipeline": self.paths.pipeline_name,
+            "phase": self.paths.phase_name,
+            "phase_tag": self.paths.phase_tag,
+            "optimizer": type(self.optimizer).__name__,
+        }
+        header.update(self.settings_columns())
+
+        return binary_output.BinaryOutput(
+            path="{}/binary_output".format(self.optimizer.paths.phase_output_path),
+            header=header,
+            flush_interval=af.conf.instance.general.get(
+                "output", "backup_interval", int
+            ),
+        )
+
+    def add_posterior_to_binary_output(self, output):
+        """
+        Add the weighted samples of the non-linear search to the binary output, if it is MultiNest and has output \
+        them.
+        """
+        optimizer_path = "{}/optimizer".format(self.optimizer.paths.phase_output_path)
+
+        try:
+            samples = posterior.memory_mapped_samples_from_optimizer_path(
+                optimizer_path=optimizer_path
+            )
+            param_names = posterior.param_names_from_optimizer_path(
+                optimizer_path=optimizer_path
+            )
+        except (IOError, ValueError):
+            return
+
+        output.add_posterior(
+            weights=samples[:, 0],
+            log_likelihoods=-0.5 * samples[:, 1],
+            parameters=samples[:, 2:],
+            param_names=param_names,
+        )
+
+    def settings_columns(self):
+
+        return {
+            "sub_size": self.meta_imaging_fit.sub_size,
+            "signal_to_noise_limit": self.meta_imaging_fit.signal_to_noise_limit,
+            "bin_up_factor": self.meta_imaging_fit.bin_up_factor,
+        }
+
+    def customize_priors(self, results):
+        """
+        Centre the priors of the model on the posterior of the previous phase if the phase is warm started.
+        """
+        if not self.warm_start or results is None or results.last is None:
+            return
+
+        self.model = ws.warm_started_model(
+            model=self.model,
+            previous_model=results.last.previous_model,
+            gaussian_tuples=results.last.gaussian_tuples,
+        )
+
+    def likelihood_cache_from(self, masked_imaging):
+        """
+        Make the likelihood cache of the analysis if the likelihood_memo general config option is on, which is also \
+        stored in the phase's output path so a rerun of the phase reuses it.
+        """
+        if not af.conf.instance.general.get("output", "likelihood_memo", bool):
+            return None
+
+        return lc.LikelihoodMemo(
+            fingerprint=lc.fingerprint_from_masked_imaging(
+                masked_imaging=masked_imaging
+            ),
+            memo_path="{}/likelihood_memo".format(
+                self.optimizer.paths.phase_output_path
+            ),
+        )
+
+    def output_mask_and_meta_imaging_fit(self, mask):
+        """
+        Pickle the mask the phase is run with and its meta imaging fit (which holds settings like its sub_size, \
+        signal_to_noise_limit and bin_up_factor) to 'mask.pickle' and 'meta_imaging_fit.pickle' in its output path, \
+        such that tools loading the phase's output (e.g. *aggregator.thumbnails*) can make the masked imaging it fitted.
+        """
+        for name, obj in (("mask", mask), ("meta_imaging_fit", self.meta_imaging_fit)):
+            with open(
+                "{}/{}.pickle".format(self.optimizer.paths.phase_output_path, name),
+                "wb",
+            ) as f:
+                pickle.dump(obj, f)
+
     def output_phase_info(self):
 
         file_phase_info = "{}/{}".format(
@@ -2,7 +2,49 @@ from toy_gaussian.src.pipeline.phase.dataset import result
 
 
 class Result(result.Result):
+    def __init__(
+        self,
+        instance,
+        figure_of_merit,
+        previous_model,
+        gaussian_tuples,
+        analysis,
+        optimizer,
+    ):
+        """
+        The result of an imaging phase.
+
+        The most likely model image is cached separately from the most likely fit, such that it remains available \
+        without recomputation after the fit is released by *drop_fit*.
+        """
+        super().__init__(
+            instance=instance,
+            figure_of_merit=figure_of_merit,
+            previous_model=previous_model,
+            gaussian_tuples=gaussian_tuples,
+            analysis=analysis,
+            optimizer=optimizer,
+        )
+
+        self._most_likely_model_image = None
+
+    def fit_from_instance(self, instance):
+        return self.analysis.masked_imaging_fit_from_instance(instance=instance)
+
     @property
-    def most_likely_fit(self):
+    def most_likely_model_image(self):
 
-        return self.analysis.masked_imaging_fit_from_instance(instance=self.instance)
+        if self._most_likely_model_image is None:
+
+            if self._most_likely_fit is not None:
+                self._most_likely_model_image = self._most_likely_fit.model_data
+            else:
+                self._most_likely_model_image = self.analysis.model_image_from_instance(
+                    instance=self.instance
+                )
+
+        return self._most_likely_model_image
+
+    @property
+    def mask(self):
+        return self.analysis.masked_imaging.mask
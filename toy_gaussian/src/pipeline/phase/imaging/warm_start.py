@@ -0,0 +1,55 @@
+import autofit as af
+
+
+def warm_started_model(model, previous_model, gaussian_tuples, sigma_factor=1.0):
+    """
+    A copy of a phase's model whose priors are centred on the posterior of the previous phase, such that the \
+    non-linear search starts its sampling where the previous phase's posterior lies instead of across its full \
+    priors.
+
+    Every prior of the model whose path (e.g. ('gaussians', '0', 'intensity')) is also a path of the previous phase's \
+    model is replaced by a GaussianPrior whose mean is the posterior mean of that parameter and whose sigma is \
+    *sigma_factor* times the sigma of its gaussian tuple, keeping the limits of the prior it replaces. Priors the \
+    previous model does not have, or whose sigma is zero, are kept.
+
+    The sigmas of a result's gaussian tuples are already the errors at the non-linear search's sigma limit (3 sigma \
+    for MultiNest), which is wide enough not to exclude solutions the previous phase's search did not resolve, so \
+    by default they are used unchanged.
+
+    Parameters
+    ----------
+    model : af.ModelMapper
+        The model of the phase being warm started.
+    previous_model : af.ModelMapper
+        The model the previous phase fitted, whose unique prior paths are ordered by prior id.
+    gaussian_tuples : [(float, float)]
+        The (mean, sigma) of every parameter of the previous phase's posterior, ordered by prior id, where sigma is \
+        the error at the search's sigma limit.
+    sigma_factor : float
+        The factor the sigma of every gaussian tuple is multiplied by to give the sigma of its new prior.
+    """
+    posterior = dict(zip(previous_model.unique_prior_paths, gaussian_tuples))
+
+    arguments = {}
+
+    for path, prior in model.path_priors_tuples:
+
+        if path not in posterior or prior in arguments:
+            continue
+
+        mean, sigma = posterior[path]
+
+        if sigma <= 0.0:
+            continue
+
+        arguments[prior] = af.GaussianPrior(
+            mean=mean,
+            sigma=sigma_factor * sigma,
+            lower_limit=prior.lower_limit,
+            upper_limit=prior.upper_limit,
+        )
+
+    if not arguments:
+        return model
+
+    return model.mapper_from_partial_prior_arguments(arguments=arguments)
@@ -0,0 +1,383 @@
+import collections
+import contextlib
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+
+import autofit as af
+
+# The context of a stage when an analysis is not profiled, which is reused so an unprofiled fit creates no objects.
+null_stage = contextlib.nullcontext()
+
+# The allocations of tracemalloc and the profilers themselves, which are excluded from the call sites of a stage.
+snapshot_filters = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+def stage(profiler, name, index=None):
+    """
+    The context timing a stage of a fit (e.g. the model image of one Gaussian) if the fit is profiled.
+
+    Parameters
+    ----------
+    profiler : Profiler or None
+        The profiler of the analysis, which is *None* if it is not profiled.
+    name : str
+        The name of the stage, e.g. 'in_1d_binned'.
+    index : int or None
+        The index of the Gaussian a stage is of, which is appended to its name (e.g. 'profile_image.gaussians_0').
+    """
+    if profiler is None:
+        return null_stage
+
+    if index is not None:
+        name = "{}.gaussians_{}".format(name, index)
+
+    if isinstance(profiler, MemoryProfiler):
+        return StageMemory(profiler=profiler, name=name)
+
+    return StageTimer(profiler=profiler, name=name)
+
+
+class StageTimer(object):
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add(name=self.name, seconds=time.perf_counter() - self.start)
+
+
+class StageMemory(object):
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.profiler.enter_stage()
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self.start
+        self.profiler.exit_stage(name=self.name, seconds=seconds)
+
+
+class Profiler(object):
+    def __init__(self, path, output_interval=10, cprofile_interval=0):
+        """
+        Times the stages of every fit of an analysis (e.g. the model image of every Gaussian, binning it up and \
+        computing its figure of merit), aggregating the calls and time of every stage across a run.
+
+        The totals are written to '{path}/profiling.json' every *output_interval* fits (the backup_interval of the \
+        general config) and when the phase finishes. If *cprofile_interval* is above zero, every cprofile_interval'th \
+        fit is also profiled with cProfile, whose stats are written to '{path}/cprofile/fit_{call}.prof' and can be \
+        read with the *pstats* module or a viewer like snakeviz.
+
+        Parameters
+        ----------
+        path : str
+            The directory the profiling output is written to.
+        output_interval : int
+            The number of fits between each output of the totals.
+        cprofile_interval : int
+            The number of fits between each fit profiled with cProfile, where 0 turns cProfile off.
+        """
+        self.path = path
+        self.output_interval = output_interval
+        self.cprofile_interval = cprofile_interval
+
+        self.calls = collections.defaultdict(int)
+        self.seconds = collections.defaultdict(float)
+
+        self.total_fits = 0
+
+    def add(self, name, seconds):
+
+        self.calls[name] += 1
+        self.seconds[name] += seconds
+
+    @contextlib.contextmanager
+    def fit(self):
+        """
+        The context of one fit, which times the whole fit as the stage 'fit', profiles it with cProfile if it is a \
+        cprofile_interval'th fit and outputs the totals every output_interval fits.
+        """
+        self.total_fits += 1
+
+        profile = None
+
+        if self.cprofile_interval > 0 and self.total_fits % self.cprofile_interval == 0:
+            profile = cProfile.Profile()
+            profile.enable()
+
+        try:
+            with stage(profiler=self, name="fit"):
+                yield
+        finally:
+
+            if profile is not None:
+                profile.disable()
+                self.output_cprofile(profile=profile)
+
+            if self.output_interval > 0 and self.total_fits % self.output_interval == 0:
+                self.output()
+
+    def output_cprofile(self, profile):
+
+        cprofile_path = "{}/cprofile".format(self.path)
+        os.makedirs(cprofile_path, exist_ok=True)
+        profile.dump_stats("{}/fit_{}.prof".format(cprofile_path, self.total_fits))
+
+    @property
+    def summary(self):
+        """
+        The calls, total time and mean time of every stage, and the fraction of the total time of every fit spent in \
+        each stage.
+        """
+        fit_seconds = self.seconds.get("fit", 0.0)
+
+        return {
+            "total_fits": self.total_fits,
+            "stages": {
+                name: {
+                    "calls": self.calls[name],
+                    "seconds": seconds,
+                    "mean_seconds": seconds / self.calls[name],
+                    "fraction_of_fit": seconds / fit_seconds
+                    if fit_seconds > 0.0
+                    else None,
+                }
+                for name, seconds in sorted(self.seconds.items())
+            },
+        }
+
+    def output(self):
+        """
+        Write the totals of every stage to 'profiling.json', replacing the previous output atomically.
+        """
+        os.makedirs(self.path, exist_ok=True)
+
+        temporary_path = "{}/profiling.json.{}.tmp".format(self.path, os.getpid())
+
+        with open(temporary_path, "w") as f:
+            json.dump(self.summary, f, indent=4)
+
+        os.replace(temporary_path, "{}/profiling.json".format(self.path))
+
+
+class MemoryProfiler(Profiler):
+    def __init__(
+        self,
+        path,
+        output_interval=10,
+        cprofile_interval=0,
+        snapshot_interval=10,
+        total_call_sites=10,
+    ):
+        """
+        A profiler which also traces the memory allocated by every stage of a fit using *tracemalloc*, to show how \
+        the memory of a fit scales with the sub-grid size and mask.
+
+        For every stage the peak memory allocated above that in use when the stage started (which includes \
+        intermediate arrays freed before it finishes, e.g. the radii of a Gaussian's grid) and the net memory it \
+        leaves allocated (e.g. its model image) are recorded. Peaks within a stage require Python 3.9's \
+        *tracemalloc.reset_peak*, without which a stage's peak is the peak of the fit so far.
+
+        Every *snapshot_interval*'th fit, tracemalloc snapshots are instead taken at the start and end of every \
+        stage, and the memory left allocated by every line of code (the call site) is added to the totals of the \
+        stage. The *total_call_sites* call sites of every stage allocating the most memory per call are output. The \
+        snapshots themselves take memory, so the peaks of these fits are not recorded.
+
+        Memory is only traced during fits, as tracing slows down Python code by a factor of a few (which also slows \
+        down the stages timed by the profiler).
+
+        Parameters
+        ----------
+        snapshot_interval : int
+            The number of fits between each fit whose allocations are traced by call site, where 0 turns this off.
+        total_call_sites : int
+            The number of call sites of every stage which are output.
+        """
+        super().__init__(
+            path=path,
+            output_interval=output_interval,
+            cprofile_interval=cprofile_interval,
+        )
+
+        self.snapshot_interval = snapshot_interval
+        self.total_call_sites = total_call_sites
+
+        self.memory_calls = collections.defaultdict(int)
+        self.max_peak_bytes = collections.defaultdict(int)
+        self.peak_bytes = collections.defaultdict(int)
+        self.net_bytes = collections.defaultdict(int)
+
+        self.snapshot_calls = collections.defaultdict(int)
+        self.call_site_bytes = collections.defaultdict(
+            lambda: collections.defaultdict(int)
+        )
+
+        self.stages = []
+        self.is_snapshot_fit = False
+
+    @contextlib.contextmanager
+    def fit(self):
+
+        is_tracing = tracemalloc.is_tracing()
+
+        if not is_tracing:
+            tracemalloc.start()
+
+        self.is_snapshot_fit = (
+            self.snapshot_interval > 0
+            and (self.total_fits + 1) % self.snapshot_interval == 0
+        )
+
+        try:
+            with super().fit():
+                yield
+        finally:
+
+            self.stages = []
+
+            if not is_tracing:
+                tracemalloc.stop()
+
+    def snapshot(self):
+
+        return tracemalloc.take_snapshot().filter_traces(snapshot_filters)
+
+    def enter_stage(self):
+        """
+        Start tracing the memory of a stage, whose peak is traced separately from that of the stages it is within.
+        """
+        snapshot = self.snapshot() if self.is_snapshot_fit else None
+
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+
+        for stage_memory in self.stages:
+            stage_memory[1] = max(stage_memory[1], peak_bytes)
+
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+        self.stages.append([current_bytes, current_bytes, snapshot])
+
+    def exit_stage(self, name, seconds):
+
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        start_bytes, stage_peak_bytes, snapshot = self.stages.pop()
+
+        peak_bytes = max(peak_bytes, stage_peak_bytes)
+
+        for stage_memory in self.stages:
+            stage_memory[1] = max(stage_memory[1], peak_bytes)
+
+        self.add(name=name, seconds=seconds)
+
+        if snapshot is None:
+
+            self.memory_calls[name] += 1
+            self.max_peak_bytes[name] = max(
+                self.max_peak_bytes[name], peak_bytes - start_bytes
+            )
+            self.peak_bytes[name] += peak_bytes - start_bytes
+            self.net_bytes[name] += current_bytes - start_bytes
+
+            return
+
+        self.snapshot_calls[name] += 1
+
+        for statistic in self.snapshot().compare_to(snapshot, "lineno"):
+            if statistic.size_diff > 0:
+                self.call_site_bytes[name][
+                    str(statistic.traceback[0])
+                ] += statistic.size_diff
+
+    def call_sites_of_stage(self, name):
+        """
+        The call sites allocating the most memory per call of a stage, as a dictionary of the call site (its file \
+        and line number) and the mean bytes it leaves allocated every call.
+        """
+        call_site_bytes = sorted(
+            self.call_site_bytes[name].items(), key=lambda item: item[1], reverse=True
+        )[: self.total_call_sites]
+
+        return {
+            call_site: total_bytes / self.snapshot_calls[name]
+            for call_site, total_bytes in call_site_bytes
+        }
+
+    @property
+    def summary(self):
+        """
+        The summary of every stage of a *Profiler*, with the mean and maximum peak bytes, the mean net bytes and the \
+        call sites of every stage.
+        """
+        summary = super().summary
+
+        for name, stage_summary in summary["stages"].items():
+
+            if self.memory_calls[name] > 0:
+                stage_summary["mean_peak_bytes"] = (
+                    self.peak_bytes[name] / self.memory_calls[name]
+                )
+                stage_summary["max_peak_bytes"] = self.max_peak_bytes[name]
+                stage_summary["mean_net_bytes"] = (
+                    self.net_bytes[name] / self.memory_calls[name]
+                )
+
+            if self.snapshot_calls[name] > 0:
+                stage_summary["call_sites"] = self.call_sites_of_stage(name=name)
+
+        return summary
+
+
+def profiler_from(path):
+    """
+    The profiler of an analysis if the profile_stages or profile_memory option of the general config's profiling \
+    section is on, which outputs to *path* every backup_interval fits.
+    """
+    profile_stages = af.conf.instance.general.get("profiling", "profile_stages", bool)
+    profile_memory = af.conf.instance.general.get("profiling", "profile_memory", bool)
+
+    if not profile_stages and not profile_memory:
+        return None
+
+    output_interval = af.conf.instance.general.get("output", "backup_interval", int)
+    cprofile_interval = af.conf.instance.general.get(
+        "profiling", "cprofile_interval", int
+    )
+
+    if profile_memory:
+        return MemoryProfiler(
+            path=path,
+            output_interval=output_interval,
+            cprofile_interval=cprofile_interval,
+            snapshot_interval=af.conf.instance.general.get(
+                "profiling", "memory_snapshot_interval", int
+            ),
+        )
+
+    return Profiler(
+        path=path,
+        output_interval=output_interval,
+        cprofile_interval=cprofile_interval,
+    )
@@ -0,0 +1,182 @@
+import collections
+import datetime
+import json
+import os
+import sys
+import time
+
+import autofit as af
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def peak_rss_bytes():
+    """
+    The peak resident set size of this process in bytes, or *None* where it cannot be read (e.g. on Windows).
+    """
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    if sys.platform == "darwin":
+        return peak_rss
+
+    return peak_rss * 1024
+
+
+class Telemetry(object):
+    def __init__(self, file_path, output_interval=30.0, likelihood_cache=None):
+        """
+        The throughput of the non-linear search of a phase, written as a stream of JSON-lines records to a file next \
+        to the phase's output.log every *output_interval* seconds and when the phase finishes.
+
+        Every record holds the likelihood evaluations per second over the phase and since the last record, the \
+        fraction of the elapsed time spent in the likelihood, visualization, I/O (the binary output and likelihood \
+        memo) and the non-linear search itself (the remainder), the peak RSS of the process and the hit rate of the \
+        analysis's likelihood cache. The analysis times each of these as a stage (see *profiling.stage*).
+
+        Parameters
+        ----------
+        file_path : str
+            The JSON-lines file records are appended to.
+        output_interval : float
+            The number of seconds between records.
+        likelihood_cache : LikelihoodCache or None
+            The likelihood cache of the analysis, whose hit rate is recorded.
+        """
+        self.file_path = file_path
+        self.output_interval = output_interval
+        self.likelihood_cache = likelihood_cache
+
+        self.seconds = collections.defaultdict(float)
+        self.evaluations = 0
+
+        self.start = None
+        self.last_output = None
+        self.last_evaluations = 0
+
+        self.restart()
+
+    def restart(self):
+        """
+        Restart the telemetry when the non-linear search starts, so setting up the phase is not counted as time spent \
+        by the search.
+        """
+        self.seconds.clear()
+        self.evaluations = 0
+
+        self.start = time.perf_counter()
+        self.last_output = self.start
+        self.last_evaluations = 0
+
+    def add(self, name, seconds):
+
+        self.seconds[name] += seconds
+
+        if name == "likelihood":
+            self.evaluations += 1
+
+        if time.perf_counter() - self.last_output >= self.output_interval:
+            self.output()
+
+    def fractions(self, elapsed_seconds):
+        """
+        The fraction of the elapsed time spent in every kind of work. I/O happens during a fit, so it is subtracted \
+        from the time of the likelihood.
+        """
+        if elapsed_seconds <= 0.0:
+            return {}
+
+        likelihood = self.seconds["likelihood"] - self.seconds["io"]
+        visualization = self.seconds["visualization"]
+        io = self.seconds["io"]
+
+        return {
+            "likelihood": likelihood / elapsed_seconds,
+            "visualization": visualization / elapsed_seconds,
+            "io": io / elapsed_seconds,
+            "sampler": max(
+                0.0, 1.0 - (likelihood + visualization + io) / elapsed_seconds
+            ),
+        }
+
+    def record(self, final=False):
+
+        now = time.perf_counter()
+
+        elapsed_seconds = now - self.start
+        interval_seconds = now - self.last_output
+
+        record = {
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            "final": final,
+            "elapsed_seconds": elapsed_seconds,
+            "evaluations": self.evaluations,
+            "evaluations_per_second": self.evaluations / elapsed_seconds
+            if elapsed_seconds > 0.0
+            else None,
+            "interval_evaluations_per_second": (
+                self.evaluations - self.last_evaluations
+            )
+            / interval_seconds
+            if interval_seconds > 0.0
+            else None,
+            "fractions": self.fractions(elapsed_seconds=elapsed_seconds),
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+
+        if self.likelihood_cache is not None:
+            record["cache_hits"] = self.likelihood_cache.hits
+            record["cache_misses"] = self.likelihood_cache.misses
+            record["cache_hit_rate"] = self.likelihood_cache.hit_rate
+
+        return record
+
+    def output(self, final=False):
+        """
+        Append a record to the telemetry file, which is flushed so a running phase can be followed with e.g. \
+        'tail -f'.
+        """
+        record = self.record(final=final)
+
+        with open(self.file_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+        self.last_output = time.perf_counter()
+        self.last_evaluations = self.evaluations
+
+
+def telemetry_file_path_from(phase_output_path):
+    """
+    The telemetry file of a phase, 'telemetry.jsonl' in the folder of its output.log (the log_file general config \
+    option).
+    """
+    log_file = af.conf.instance.general.get("output", "log_file", str).replace(
+        " ", ""
+    )
+    log_path = os.path.dirname("{}/{}".format(phase_output_path, log_file))
+
+    os.makedirs(log_path, exist_ok=True)
+
+    return "{}/telemetry.jsonl".format(log_path)
+
+
+def telemetry_from(phase_output_path, likelihood_cache=None):
+    """
+    The telemetry of a phase's analysis if the telemetry general config option is on.
+    """
+    if not af.conf.instance.general.get("output", "telemetry", bool):
+        return None
+
+    return Telemetry(
+        file_path=telemetry_file_path_from(phase_output_path=phase_output_path),
+        output_interval=af.conf.instance.general.get(
+            "output", "telemetry_interval", float
+        ),
+        likelihood_cache=likelihood_cache,
+    )
@@ -1,3 +1,7 @@
+import hashlib
+
+import numpy as np
+
 import autoarray as aa
 import autofit as af
 from autoarray.plot import mat_objs
@@ -5,12 +9,61 @@ from toy_gaussian.src.plot import gaussian_plotters
 from autoarray.plot import fit_imaging_plots, fit_interferometer_plots, inversion_plots
 
 
-def setting(section, name):
-    return af.conf.instance.visualize_plots.get(section, name, bool)
+class PlotSettings(object):
+    def __init__(self, config):
+        """
+        A snapshot of the visualize plots config, which reads every plot setting once and is shared by the \
+        visualizers of every phase (and grid search cell) in a process.
+
+        Parameters
+        ----------
+        config : af.conf.Config
+            The config instance the plot settings are read from.
+        """
+        self.config = config
+        self.settings = {}
+
+    def get(self, section, name):
+        """
+        Whether the plot *name* in the *section* of the visualize plots config is on.
+        """
+        key = (section, name)
+
+        if key not in self.settings:
+            self.settings[key] = self.config.visualize_plots.get(section, name, bool)
+
+        return self.settings[key]
+
+
+_plot_settings = None
 
 
-def plot_setting(section, name):
-    return setting(section, name)
+def plot_settings():
+    """
+    The plot settings snapshot of the current config instance, which is only made again if the config instance \
+    changes (e.g. when a runner or test sets a new config path).
+    """
+    global _plot_settings
+
+    if _plot_settings is None or _plot_settings.config is not af.conf.instance:
+        _plot_settings = PlotSettings(config=af.conf.instance)
+
+    return _plot_settings
+
+
+def fingerprint_from_fit(fit, gaussians):
+    """
+    A fingerprint of the inputs of a fit's figures, which changes if its model data or the parameters of the \
+    Gaussians which it fitted do, such that figures of the same best-fit are not rendered again.
+    """
+    fingerprint = hashlib.sha1()
+
+    fingerprint.update(np.ascontiguousarray(fit.model_data).tobytes())
+    fingerprint.update(
+        repr([sorted(gaussian.__dict__.items()) for gaussian in gaussians]).encode()
+    )
+
+    return fingerprint.hexdigest()
 
 
 class AbstractVisualizer:
@@ -24,67 +77,95 @@ class AbstractVisualizer:
         )
         self.include = gaussian_plotters.Include()
 
+        self.plot_settings = plot_settings()
+
+        self.asynchronous = af.conf.instance.visualize_general.get(
+            "general", "asynchronous", bool
+        )
+
 
 class PhaseDatasetVisualizer(AbstractVisualizer):
     def __init__(self, masked_dataset, image_path):
         super().__init__(image_path)
         self.masked_dataset = masked_dataset
 
-        self.plot_subplot_dataset = plot_setting("dataset", "subplot_dataset")
-        self.plot_dataset_data = plot_setting("dataset", "data")
-        self.plot_dataset_noise_map = plot_setting("dataset", "noise_map")
-        self.plot_dataset_psf = plot_setting("dataset", "psf")
+        self.fit_fingerprint = None
+        self.fit_dataset_visualized = False
+
+        settings = self.plot_settings
+
+        self.plot_subplot_dataset = settings.get("dataset", "subplot_dataset")
+        self.plot_dataset_data = settings.get("dataset", "data")
+        self.plot_dataset_noise_map = settings.get("dataset", "noise_map")
+        self.plot_dataset_psf = settings.get("dataset", "psf")
 
-        self.plot_dataset_signal_to_noise_map = plot_setting(
+        self.plot_dataset_signal_to_noise_map = settings.get(
             "dataset", "signal_to_noise_map"
         )
-        self.plot_dataset_absolute_signal_to_noise_map = plot_setting(
+        self.plot_dataset_absolute_signal_to_noise_map = settings.get(
             "dataset", "absolute_signal_to_noise_map"
         )
-        self.plot_dataset_potential_chi_squared_map = plot_setting(
+        self.plot_dataset_potential_chi_squared_map = settings.get(
             "dataset", "potential_chi_squared_map"
         )
 
-        self.plot_fit_all_at_end_png = plot_setting("fit", "all_at_end_png")
-        self.plot_fit_all_at_end_fits = plot_setting("fit", "all_at_end_fits")
-        self.plot_subplot_fit = plot_setting("fit", "subplot_fit")
+        self.plot_fit_all_at_end_png = settings.get("fit", "all_at_end_png")
+        self.plot_fit_all_at_end_fits = settings.get("fit", "all_at_end_fits")
+        self.plot_subplot_fit = settings.get("fit", "subplot_fit")
 
-        self.plot_fit_data = plot_setting("fit", "data")
-        self.plot_fit_noise_map = plot_setting("fit", "noise_map")
-        self.plot_fit_signal_to_noise_map = plot_setting("fit", "signal_to_noise_map")
-        self.plot_fit_model_data = plot_setting("fit", "model_data")
-        self.plot_fit_residual_map = plot_setting("fit", "residual_map")
-        self.plot_fit_normalized_residual_map = plot_setting(
+        self.plot_fit_data = settings.get("fit", "data")
+        self.plot_fit_noise_map = settings.get("fit", "noise_map")
+        self.plot_fit_signal_to_noise_map = settings.get("fit", "signal_to_noise_map")
+        self.plot_fit_model_data = settings.get("fit", "model_data")
+        self.plot_fit_residual_map = settings.get("fit", "residual_map")
+        self.plot_fit_normalized_residual_map = settings.get(
             "fit", "normalized_residual_map"
         )
-        self.plot_fit_chi_squared_map = plot_setting("fit", "chi_squared_map")
+        self.plot_fit_chi_squared_map = settings.get("fit", "chi_squared_map")
 
-        self.plot_subplot_inversion = plot_setting("inversion", "subplot_inversion")
-        self.plot_inversion_reconstructed_image = plot_setting(
+        self.plot_subplot_inversion = settings.get("inversion", "subplot_inversion")
+        self.plot_inversion_reconstructed_image = settings.get(
             "inversion", "reconstructed_image"
         )
 
-        self.plot_inversion_reconstruction = plot_setting("inversion", "reconstruction")
+        self.plot_inversion_reconstruction = settings.get("inversion", "reconstruction")
 
-        self.plot_inversion_errors = plot_setting("inversion", "errors")
+        self.plot_inversion_errors = settings.get("inversion", "errors")
 
-        self.plot_inversion_residual_map = plot_setting("inversion", "residual_map")
-        self.plot_inversion_normalized_residual_map = plot_setting(
+        self.plot_inversion_residual_map = settings.get("inversion", "residual_map")
+        self.plot_inversion_normalized_residual_map = settings.get(
             "inversion", "normalized_residual_map"
         )
-        self.plot_inversion_chi_squared_map = plot_setting(
+        self.plot_inversion_chi_squared_map = settings.get(
             "inversion", "chi_squared_map"
         )
-        self.plot_inversion_regularization_weights = plot_setting(
+        self.plot_inversion_regularization_weights = settings.get(
             "inversion", "regularization_weight_map"
         )
-        self.plot_inversion_interpolated_reconstruction = plot_setting(
+        self.plot_inversion_interpolated_reconstruction = settings.get(
             "inversion", "interpolated_reconstruction"
         )
-        self.plot_inversion_interpolated_errors = plot_setting(
+        self.plot_inversion_interpolated_errors = settings.get(
             "inversion", "interpolated_errors"
         )
 
+    def fit_is_unchanged(self, fit, gaussians):
+        """
+        Whether a fit is the same as the fit last visualized, in which case its figures are already output and \
+        visualization during the analysis is skipped.
+
+        The data, noise-map and signal-to-noise map of a fit are the same for every fit of the masked dataset, so \
+        during the analysis these figures are only output by the first fit visualized. The final visualization \
+        (during_analysis=False) outputs every figure.
+        """
+        fingerprint = fingerprint_from_fit(fit=fit, gaussians=gaussians)
+
+        if fingerprint == self.fit_fingerprint:
+            return True
+
+        self.fit_fingerprint = fingerprint
+        return False
+
 
 class PhaseImagingVisualizer(PhaseDatasetVisualizer):
     def __init__(self, masked_dataset, image_path, results=None):
@@ -92,7 +173,9 @@ class PhaseImagingVisualizer(PhaseDatasetVisualizer):
             masked_dataset=masked_dataset, image_path=image_path
         )
 
-        self.plot_dataset_psf = plot_setting("dataset", "psf")
+        settings = self.plot_settings
+
+        self.plot_dataset_psf = settings.get("dataset", "psf")
 
         self.visualize_imaging()
 
@@ -133,6 +216,12 @@ class PhaseImagingVisualizer(PhaseDatasetVisualizer):
 
     def visualize_fit(self, fit, gaussians, during_analysis):
 
+        if self.fit_is_unchanged(fit=fit, gaussians=gaussians) and during_analysis:
+            return
+
+        plot_fit_dataset = not self.fit_dataset_visualized or not during_analysis
+        self.fit_dataset_visualized = True
+
         plotter = self.plotter.plotter_with_new_output(
             path=self.plotter.output.path + "fit_imaging/"
         )
@@ -144,9 +233,10 @@ class PhaseImagingVisualizer(PhaseDatasetVisualizer):
 
         fit_imaging_plots.individuals(
             fit=fit,
-            plot_image=self.plot_fit_data,
-            plot_noise_map=self.plot_fit_noise_map,
-            plot_signal_to_noise_map=self.plot_fit_signal_to_noise_map,
+            plot_image=self.plot_fit_data and plot_fit_dataset,
+            plot_noise_map=self.plot_fit_noise_map and plot_fit_dataset,
+            plot_signal_to_noise_map=self.plot_fit_signal_to_noise_map
+            and plot_fit_dataset,
             plot_model_image=self.plot_fit_model_data,
             plot_residual_map=self.plot_fit_residual_map,
             plot_chi_squared_map=self.plot_fit_chi_squared_map,
@@ -279,8 +369,10 @@ class PhaseInterferometerVisualizer(PhaseDatasetVisualizer):
             masked_dataset=masked_dataset, image_path=image_path
         )
 
-        self.plot_dataset_uv_wavelengths = plot_setting("dataset", "uv_wavelengths")
-        self.plot_dataset_primary_beam = plot_setting("dataset", "primary_beam")
+        settings = self.plot_settings
+
+        self.plot_dataset_uv_wavelengths = settings.get("dataset", "uv_wavelengths")
+        self.plot_dataset_primary_beam = settings.get("dataset", "primary_beam")
 
         self.visualize_interferometer()
 
@@ -313,6 +405,12 @@ class PhaseInterferometerVisualizer(PhaseDatasetVisualizer):
 
     def visualize_fit(self, fit, gaussians, during_analysis):
 
+        if self.fit_is_unchanged(fit=fit, gaussians=gaussians) and during_analysis:
+            return
+
+        plot_fit_dataset = not self.fit_dataset_visualized or not during_analysis
+        self.fit_dataset_visualized = True
+
         plotter = self.plotter.plotter_with_new_output(
             path=self.plotter.output.path + "fit_interferometer/"
         )
@@ -324,9 +422,10 @@ class PhaseInterferometerVisualizer(PhaseDatasetVisualizer):
 
         fit_interferometer_plots.individuals(
             fit=fit,
-            plot_visibilities=self.plot_fit_data,
-            plot_noise_map=self.plot_fit_noise_map,
-            plot_signal_to_noise_map=self.plot_fit_signal_to_noise_map,
+            plot_visibilities=self.plot_fit_data and plot_fit_dataset,
+            plot_noise_map=self.plot_fit_noise_map and plot_fit_dataset,
+            plot_signal_to_noise_map=self.plot_fit_signal_to_noise_map
+            and plot_fit_dataset,
             plot_model_visibilities=self.plot_fit_model_data,
             plot_residual_map=self.plot_fit_residual_map,
             plot_chi_squared_map=self.plot_fit_chi_squared_map,
@@ -0,0 +1,162 @@
+import logging
+import multiprocessing
+
+logger = logging.getLogger(__name__)
+
+
+class FrameSlot(object):
+    def __init__(self, manager):
+        """
+        A slot holding the latest frame put in it, shared between the sampling process and a visualizer worker.
+
+        Putting a frame always replaces the frame in the slot, such that the newest frame is never lost if the worker \
+        has not yet taken the previous one. The frame is stored in a dictionary of a *multiprocessing.Manager*, which \
+        is set under a lock, with an event signalling the worker that the slot has changed.
+
+        Parameters
+        ----------
+        manager : multiprocessing.managers.SyncManager
+            The manager holding the slot's dictionary.
+        """
+        self.lock = multiprocessing.Lock()
+        self.ready = multiprocessing.Event()
+        self.slot = manager.dict()
+
+    def put(self, frame):
+
+        with self.lock:
+            self.slot["frame"] = frame
+            self.ready.set()
+
+    def stop(self):
+        """
+        Signal the worker to stop once it has taken the frame in the slot.
+        """
+        with self.lock:
+            self.slot["stop"] = True
+            self.ready.set()
+
+    def get(self):
+        """
+        Wait for the slot to change and take its frame.
+
+        Returns
+        -------
+        (tuple or None, bool)
+            The frame in the slot, which is *None* if it has already been taken, and whether the worker should stop.
+        """
+        self.ready.wait()
+
+        with self.lock:
+            frame = self.slot.pop("frame", None)
+            stop = self.slot.get("stop", False)
+            self.ready.clear()
+
+        return frame, stop
+
+
+def visualize_from_slot(analysis, frames):
+    """
+    The loop of a visualizer worker process, which fits and visualizes the latest frame put in its slot until it is \
+    stopped.
+
+    Parameters
+    ----------
+    analysis : Analysis
+        A copy of the phase's analysis, which computes the fit of every frame's instance and visualizes it.
+    frames : FrameSlot
+        The slot of the latest (instance, during_analysis) frame.
+    """
+    while True:
+
+        frame, stop = frames.get()
+
+        if frame is not None:
+
+            instance, during_analysis = frame
+
+            try:
+                fit = analysis.masked_imaging_fit_from_instance(instance=instance)
+                analysis.visualizer.visualize_fit(
+                    fit=fit,
+                    gaussians=instance.gaussians,
+                    during_analysis=during_analysis,
+                )
+            except Exception:
+                logger.exception("The visualizer worker failed to visualize a fit")
+
+        if stop:
+            break
+
+
+class VisualizerWorker(object):
+    def __init__(self, analysis):
+        """
+        Visualizes the fits of an analysis in a separate process, such that rendering figures never blocks the \
+        non-linear search.
+
+        A frame is a pickled snapshot of the instance to visualize, from which the worker's copy of the analysis \
+        recomputes the fit, so neither the fit nor its arrays are computed or copied in the sampling process. Frames \
+        are put in a *FrameSlot* holding one frame: if the worker falls behind, a stale frame still waiting is \
+        replaced by the newest one.
+
+        The final visualization (during_analysis=False) is the last frame put in the slot, so it is never replaced, \
+        and is waited for, so that every figure is output when the phase finishes.
+
+        Parameters
+        ----------
+        analysis : Analysis
+            The analysis whose fits are visualized, which is copied to the worker process when it starts.
+        """
+        self.analysis = analysis
+        self.manager = None
+        self.frames = None
+        self.process = None
+
+    def start(self):
+
+        self.manager = multiprocessing.Manager()
+        self.frames = FrameSlot(manager=self.manager)
+        self.process = multiprocessing.Process(
+            target=visualize_from_slot, args=(self.analysis, self.frames), daemon=True
+        )
+        self.process.start()
+
+    def visualize(self, instance, during_analysis):
+
+        if self.process is None or not self.process.is_alive():
+            self.stop()
+            self.start()
+
+        self.frames.put((instance, during_analysis))
+
+        if not during_analysis:
+            self.stop()
+
+    def stop(self):
+        """
+        Wait for the worker to visualize the frame in its slot and end its process.
+        """
+        if self.process is None:
+            return
+
+        self.frames.stop()
+        self.process.join()
+        self.manager.shutdown()
+
+        self.process = None
+        self.manager = None
+        self.frames = None
+
+
+def visualizer_worker_from(analysis):
+    """
+    The visualizer worker of an analysis, if the visualize general config option asynchronous is on and the process \
+    is allowed to start child processes (worker processes of a pool, e.g. a parallel grid search, are not).
+    """
+    asynchronous = analysis.visualizer.asynchronous
+
+    if not asynchronous or multiprocessing.current_process().daemon:
+        return None
+
+    return VisualizerWorker(analysis=analysis)
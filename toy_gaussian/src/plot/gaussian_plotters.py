@@ -1,6 +1,6 @@
 import autofit as af
 from autoarray.plot import plotters
-from toy_gaussian.src.plot import mat_objs
+from toy_gaussian.src.plot import mat_objs, raster
 from autoarray.operators.inversion import mappers
 
 from functools import wraps
@@ -79,6 +79,7 @@ class GaussianPlotter(plotters.AbstractPlotter):
         include_origin=False,
         include_border=False,
         bypass_output=False,
+        raster=False,
     ):
         """Plot an array of data_type as a figure.
 
@@ -163,6 +164,9 @@ class GaussianPlotter(plotters.AbstractPlotter):
             'show' - display on computer screen.
             'png' - output to hard-disk as a png.
             'fits' - output to hard-disk as a fits file.'
+        raster : bool
+            If *True* and nothing is plotted over the array, the png is output directly from the array via a colormap \
+            lookup table instead of a matplotlib figure, which is much faster (e.g. for bulk thumbnails).
 
         Returns
         --------
@@ -191,6 +195,19 @@ class GaussianPlotter(plotters.AbstractPlotter):
 
         array = array.zoomed_around_mask(buffer=buffer)
 
+        if raster and self.output_raster_possible(
+            mask=mask,
+            positions=positions,
+            grid=grid,
+            lines=lines,
+            gaussian_centres=gaussian_centres,
+            include_origin=include_origin,
+            include_border=include_border,
+            bypass_output=bypass_output,
+        ):
+            self.output_raster(array=array)
+            return
+
         super(GaussianPlotter, self).plot_array(
             array=array,
             mask=mask,
@@ -210,6 +227,44 @@ class GaussianPlotter(plotters.AbstractPlotter):
         if not isinstance(self, SubPlotter) and not bypass_output:
             self.figure.close()
 
+    def output_raster_possible(
+        self,
+        mask,
+        positions,
+        grid,
+        lines,
+        gaussian_centres,
+        include_origin,
+        include_border,
+        bypass_output,
+    ):
+        """
+        Whether an array can be output as a raster png, which requires that it is not annotated (e.g. with a mask, \
+        grid or Gaussian centres), is output to a png and is not part of a subplot.
+        """
+        annotations = (mask, positions, grid, lines, gaussian_centres)
+
+        return (
+            all(annotation is None for annotation in annotations)
+            and not include_origin
+            and not include_border
+            and not bypass_output
+            and not isinstance(self, SubPlotter)
+            and self.output.format == "png"
+            and self.cmap.norm in ("linear", "log")
+        )
+
+    def output_raster(self, array):
+
+        raster.output_array_2d_to_png(
+            array_2d=array.in_2d_binned,
+            file_path="{}{}.png".format(self.output.path, self.output.filename),
+            cmap=self.cmap.cmap,
+            norm=self.cmap.norm,
+            norm_min=self.cmap.norm_min,
+            norm_max=self.cmap.norm_max,
+        )
+
     def plot_grid(
         self,
         grid,
@@ -668,6 +723,7 @@ def plot_array(
     gaussian_centres=None,
     include=None,
     plotter=None,
+    raster=False,
 ):
 
     if include is None:
@@ -684,6 +740,7 @@ def plot_array(
         grid=grid,
         include_origin=include.origin,
         include_border=include.border,
+        raster=raster,
     )
 
 
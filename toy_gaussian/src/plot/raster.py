@@ -0,0 +1,155 @@
+import os
+import struct
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+png_signature = b"\x89PNG\r\n\x1a\n"
+
+
+@lru_cache(maxsize=None)
+def colormap_lookup_table(cmap, size=256):
+    """
+    The RGB colors of a matplotlib colormap sampled at *size* evenly spaced values, as an array of shape (size, 3) \
+    of uint8s.
+
+    The lookup table of each colormap is computed once per process, after which no matplotlib objects are used to \
+    color an array.
+    """
+    from matplotlib import pyplot as plt
+
+    colors = plt.get_cmap(cmap)(np.linspace(0.0, 1.0, size))[:, :3]
+
+    return np.round(colors * 255.0).astype("uint8")
+
+
+def indexes_from_array_2d(
+    array_2d, size=256, norm="linear", norm_min=None, norm_max=None
+):
+    """
+    The colormap lookup table index of every value of a 2D array, using the same linear or log normalization as the \
+    matplotlib plotters.
+
+    Parameters
+    ----------
+    array_2d : ndarray
+        The 2D array of values which is colored.
+    size : int
+        The number of colors in the lookup table.
+    norm : str
+        The normalization of the colormap, 'linear' or 'log'.
+    norm_min : float or None
+        The value mapped to the first color, which is the array's minimum value if *None*.
+    norm_max : float or None
+        The value mapped to the last color, which is the array's maximum value if *None*.
+    """
+    values = np.asarray(array_2d, dtype="float64")
+
+    norm_min = np.min(values) if norm_min is None else norm_min
+    norm_max = np.max(values) if norm_max is None else norm_max
+
+    if norm == "log":
+        norm_min = max(norm_min, 1.0e-4)
+        norm_max = max(norm_max, norm_min)
+        values = np.log10(np.clip(values, norm_min, norm_max))
+        norm_min, norm_max = np.log10(norm_min), np.log10(norm_max)
+
+    if norm_max == norm_min:
+        return np.zeros(values.shape, dtype="intp")
+
+    scaled = (values - norm_min) * ((size - 1) / (norm_max - norm_min))
+
+    return np.clip(np.round(scaled), 0, size - 1).astype("intp")
+
+
+def rgb_from_array_2d(
+    array_2d, cmap="jet", norm="linear", norm_min=None, norm_max=None, scale=1
+):
+    """
+    Color a 2D array using a colormap lookup table, giving an RGB image of shape (rows * scale, columns * scale, 3).
+
+    Parameters
+    ----------
+    scale : int
+        The number of image pixels each array pixel is enlarged to along each axis (nearest neighbour).
+    """
+    lookup_table = colormap_lookup_table(cmap=cmap)
+
+    rgb = lookup_table[
+        indexes_from_array_2d(
+            array_2d=array_2d,
+            size=lookup_table.shape[0],
+            norm=norm,
+            norm_min=norm_min,
+            norm_max=norm_max,
+        )
+    ]
+
+    if scale > 1:
+        rgb = np.repeat(np.repeat(rgb, scale, axis=0), scale, axis=1)
+
+    return rgb
+
+
+def png_chunk(chunk_type, data):
+
+    return (
+        struct.pack(">I", len(data))
+        + chunk_type
+        + data
+        + struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF)
+    )
+
+
+def png_from_rgb(rgb, compression_level=6):
+    """
+    The bytes of an 8-bit RGB png of an array of shape (rows, columns, 3), which are written directly using zlib \
+    rather than via a matplotlib figure.
+    """
+    rows, columns = rgb.shape[0], rgb.shape[1]
+
+    scanlines = np.zeros((rows, columns * 3 + 1), dtype="uint8")
+    scanlines[:, 1:] = np.ascontiguousarray(rgb, dtype="uint8").reshape(rows, -1)
+
+    header = struct.pack(">IIBBBBB", columns, rows, 8, 2, 0, 0, 0)
+
+    return (
+        png_signature
+        + png_chunk(b"IHDR", header)
+        + png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), compression_level))
+        + png_chunk(b"IEND", b"")
+    )
+
+
+def output_array_2d_to_png(
+    array_2d,
+    file_path,
+    cmap="jet",
+    norm="linear",
+    norm_min=None,
+    norm_max=None,
+    scale=1,
+):
+    """
+    Output a 2D array to the hard-disk as a png, colored using a colormap lookup table.
+
+    This raster output has no axes, colorbar, title or overlays, so it is suited to quick look images and bulk \
+    thumbnails (e.g. of every fit loaded by the aggregator) rather than publication figures.
+    """
+    directory = os.path.dirname(file_path)
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    rgb = rgb_from_array_2d(
+        array_2d=array_2d,
+        cmap=cmap,
+        norm=norm,
+        norm_min=norm_min,
+        norm_max=norm_max,
+        scale=scale,
+    )
+
+    with open(file_path, "wb") as f:
+        f.write(png_from_rgb(rgb=rgb))
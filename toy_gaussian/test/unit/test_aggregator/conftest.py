@@ -0,0 +1,45 @@
+import autofit as af
+import pytest
+
+
+class MockOutput(object):
+    def __init__(self, most_likely_model_instance=None):
+        self.most_likely_model_instance = most_likely_model_instance
+
+
+class MockPhaseOutput(object):
+    def __init__(
+        self,
+        directory=None,
+        dataset=None,
+        most_likely_model_instance=None,
+        model_results=None,
+    ):
+        self.directory = directory
+        self.dataset = dataset
+        self.output = MockOutput(most_likely_model_instance=most_likely_model_instance)
+        self.model_results = model_results
+
+
+@pytest.fixture(name="phase_output_from")
+def make_phase_output_from():
+    def phase_output_from(
+        directory=None,
+        dataset=None,
+        gaussians=None,
+        most_likely_model_instance=None,
+        model_results=None,
+    ):
+
+        if gaussians is not None:
+            most_likely_model_instance = af.ModelInstance()
+            most_likely_model_instance.gaussians = gaussians
+
+        return MockPhaseOutput(
+            directory=directory,
+            dataset=dataset,
+            most_likely_model_instance=most_likely_model_instance,
+            model_results=model_results,
+        )
+
+    return phase_output_from
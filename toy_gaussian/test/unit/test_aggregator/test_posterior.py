@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pytest
+
+from toy_gaussian.src.aggregator import posterior
+
+
+def make_phase_output(phase_output_from, path, param_names, samples):
+
+    optimizer_path = "{}/optimizer".format(path)
+    os.makedirs(optimizer_path, exist_ok=True)
+
+    with open("{}/multinest.paramnames".format(optimizer_path), "w") as f:
+        for param_name in param_names:
+            f.write("{} {}\n".format(param_name, param_name))
+
+    np.savetxt("{}/multinest.txt".format(optimizer_path), samples)
+
+    return phase_output_from(directory=path)
+
+
+class TestWeightedQuantiles:
+    def test__equal_weights__median_is_middle_value(self):
+
+        quantiles = posterior.weighted_quantiles(
+            values=np.array([[3.0, 10.0], [1.0, 30.0], [2.0, 20.0]]),
+            weights=np.ones(3),
+            quantiles=[0.5],
+        )
+
+        assert quantiles == pytest.approx(np.array([[2.0], [20.0]]))
+
+    def test__weights_shift_median(self):
+
+        quantiles = posterior.weighted_quantiles(
+            values=np.array([[1.0], [2.0], [3.0]]),
+            weights=np.array([0.0, 0.0, 1.0]),
+            quantiles=[0.5],
+        )
+
+        assert quantiles == pytest.approx(np.array([[3.0]]))
+
+
+class TestPosteriorSummaries:
+    def test__summaries_of_population_of_fits(self, phase_output_from, tmpdir):
+
+        phase_output_0 = make_phase_output(
+            phase_output_from=phase_output_from,
+            path="{}/phase_0".format(tmpdir),
+            param_names=["centre_0", "sigma"],
+            samples=np.array(
+                [[1.0, 0.0, 0.0, 1.0], [1.0, 0.0, 1.0, 2.0], [1.0, 0.0, 2.0, 3.0]]
+            ),
+        )
+
+        phase_output_1 = make_phase_output(
+            phase_output_from=phase_output_from,
+            path="{}/phase_1".format(tmpdir),
+            param_names=["centre_0"],
+            samples=np.array([[1.0, 0.0, 5.0], [1.0, 0.0, 6.0], [1.0, 0.0, 7.0]]),
+        )
+
+        summaries = posterior.posterior_summaries(
+            phase_outputs=[phase_output_0, phase_output_1]
+        )
+
+        assert summaries["centre_0"].shape == (2, 3)
+        assert summaries["centre_0"][:, 1] == pytest.approx(np.array([1.0, 6.0]))
+        assert summaries["centre_0"][0, 0] < 1.0 < summaries["centre_0"][0, 2]
+        assert summaries["sigma"][0, 1] == pytest.approx(2.0)
+        assert np.isnan(summaries["sigma"][1]).all()
+
+        assert os.path.exists(
+            "{}/phase_0/optimizer/multinest_samples.npy".format(tmpdir)
+        )
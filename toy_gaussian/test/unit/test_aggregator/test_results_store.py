@@ -0,0 +1,159 @@
+import os
+
+import numpy as np
+
+import toy_gaussian as toy
+from toy_gaussian.src.aggregator import results_store as rs
+
+
+class TestColumns:
+    def test__columns_from_gaussians(self):
+
+        gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.5), intensity=1.0, sigma=2.0),
+            toy.SphericalGaussian(centre=(1.0, 1.5), intensity=3.0, sigma=4.0),
+        ]
+
+        columns = rs.columns_from_gaussians(gaussians=gaussians)
+
+        assert columns["gaussians_0_centre_0"] == 0.0
+        assert columns["gaussians_0_centre_1"] == 0.5
+        assert columns["gaussians_0_intensity"] == 1.0
+        assert columns["gaussians_1_centre_1"] == 1.5
+        assert columns["gaussians_1_sigma"] == 4.0
+
+    def test__column_dimensions_from_gaussians(self):
+
+        gaussians = [
+            toy.EllipticalGaussian(
+                centre=(0.0, 0.5), axis_ratio=0.5, intensity=1.0, sigma=2.0
+            )
+        ]
+
+        column_dimensions = rs.column_dimensions_from_gaussians(gaussians=gaussians)
+
+        assert column_dimensions["gaussians_0_centre_0"] == ("Length", "arcsec")
+        assert column_dimensions["gaussians_0_centre_1"] == ("Length", "arcsec")
+        assert column_dimensions["gaussians_0_sigma"] == ("Length", "arcsec")
+        assert column_dimensions["gaussians_0_intensity"] == ("Luminosity", "eps")
+        assert "gaussians_0_axis_ratio" not in column_dimensions
+
+
+class TestTable:
+    def test__rows_with_different_columns__are_merged(self):
+
+        table = rs.table_from_rows(
+            rows=[
+                {"directory": "a", "figure_of_merit": 1.0, "sub_size": 2},
+                {"directory": "bb", "figure_of_merit": 2.0, "phase_tag": "tag"},
+            ]
+        )
+
+        assert table.dtype["directory"] == np.dtype("U2")
+        assert (table["figure_of_merit"] == np.array([1.0, 2.0])).all()
+        assert table["sub_size"][0] == 2.0
+        assert np.isnan(table["sub_size"][1])
+        assert list(table["phase_tag"]) == ["", "tag"]
+
+        row = rs.rows_from_table(table=table)[1]
+
+        assert row["directory"] == "bb"
+        assert row["figure_of_merit"] == 2.0
+        assert np.isnan(row["sub_size"])
+        assert row["phase_tag"] == "tag"
+
+
+class TestResultsStore:
+    def test__rows_are_added_replaced_and_filtered(self, tmpdir):
+
+        store = rs.ResultsStore(path=str(tmpdir))
+
+        assert len(store.filter(phase="phase_1")) == 0
+
+        store.add_row(
+            row={
+                "pipeline": "p",
+                "phase": "phase_1",
+                "directory": "d1",
+                "figure_of_merit": 1.0,
+            }
+        )
+        store.add_row(
+            row={
+                "pipeline": "p",
+                "phase": "phase_2",
+                "directory": "d2",
+                "figure_of_merit": 2.0,
+            }
+        )
+        store.add_row(
+            row={
+                "pipeline": "p",
+                "phase": "phase_1",
+                "directory": "d1",
+                "figure_of_merit": 3.0,
+            }
+        )
+
+        table = store.load()
+
+        assert len(table) == 2
+        assert list(store.filter(phase="phase_1")["figure_of_merit"]) == [3.0]
+        assert list(store.filter(pipeline="p")["directory"]) == ["d2", "d1"]
+
+    def test__rows_are_appended_without_rewriting_store(self, tmpdir):
+
+        store = rs.ResultsStore(path=str(tmpdir))
+
+        store.add_row(row={"directory": "d1", "figure_of_merit": 1.0})
+
+        with open(store.file_path) as f:
+            first_record = f.read()
+
+        store.add_row(row={"directory": "d2", "figure_of_merit": 2.0})
+
+        with open(store.file_path) as f:
+            records = f.read()
+
+        assert records.startswith(first_record)
+        assert len(records.splitlines()) == 2
+
+        with open(store.file_path, "a") as f:
+            f.write('{"directory": "d3", "figure_')
+
+        assert list(store.load()["directory"]) == ["d1", "d2"]
+
+    def test__records_are_compacted_into_memory_mapped_table(self, tmpdir):
+
+        store = rs.ResultsStore(path=str(tmpdir))
+
+        store.add_row(row={"directory": "d1", "phase": "phase_1", "sub_size": 2})
+
+        table = store.load()
+
+        assert isinstance(table, np.memmap)
+        assert list(table["directory"]) == ["d1"]
+
+        store.add_row(row={"directory": "d2", "phase": "phase_long_name"})
+        store.add_row(row={"directory": "d1", "phase": "phase_1", "sub_size": 4})
+
+        table = store.load()
+
+        assert list(table["directory"]) == ["d2", "d1"]
+        assert list(table["phase"]) == ["phase_long_name", "phase_1"]
+        assert np.isnan(table["sub_size"][0])
+        assert table["sub_size"][1] == 4.0
+
+        with open(store.offset_path) as f:
+            assert int(f.read()) == os.path.getsize(store.file_path)
+
+        assert list(np.load(store.table_path)["directory"]) == ["d2", "d1"]
+
+    def test__filter_on_missing_column__returns_no_rows(self, tmpdir):
+
+        store = rs.ResultsStore(path=str(tmpdir))
+
+        store.add_row(row={"directory": "d1", "figure_of_merit": 1.0})
+
+        assert len(store.filter(sub_size=2)) == 0
+        assert len(store.filter(directory="d1", sub_size=2)) == 0
@@ -0,0 +1,136 @@
+import threading
+
+import autofit as af
+
+import toy_gaussian as toy
+from toy_gaussian.src.aggregator import stream
+from toy_gaussian.src.model import serialization
+
+
+class MockCachingPhaseOutput(object):
+    def __init__(self, directory):
+
+        self.directory = directory
+        self._PhaseOutput__model = None
+
+    @property
+    def model(self):
+        if self._PhaseOutput__model is None:
+            self._PhaseOutput__model = "model_{}".format(self.directory)
+        return self._PhaseOutput__model
+
+
+def make_phase_outputs(phase_output_from, total_phase_outputs):
+
+    return [
+        phase_output_from(
+            directory="phase_{}".format(index),
+            most_likely_model_instance="instance_{}".format(index),
+            model_results="results_{}".format(index),
+        )
+        for index in range(total_phase_outputs)
+    ]
+
+
+class TestStream:
+    def test__values_are_yielded_in_order(self, phase_output_from):
+
+        phase_outputs = make_phase_outputs(
+            phase_output_from=phase_output_from, total_phase_outputs=10
+        )
+
+        assert list(
+            stream.most_likely_model_instances(phase_outputs=phase_outputs, prefetch=3)
+        ) == ["instance_{}".format(index) for index in range(10)]
+
+        assert list(stream.model_results(phase_outputs=phase_outputs)) == [
+            "results_{}".format(index) for index in range(10)
+        ]
+
+    def test__no_more_than_prefetch_phases_are_loaded_ahead(self, phase_output_from):
+
+        loaded = []
+        lock = threading.Lock()
+
+        def load(phase_output):
+            with lock:
+                loaded.append(phase_output.directory)
+            return phase_output.directory
+
+        phase_outputs = iter(
+            make_phase_outputs(
+                phase_output_from=phase_output_from, total_phase_outputs=100
+            )
+        )
+
+        prefetch = 2
+
+        values = stream.stream(
+            phase_outputs=phase_outputs, load=load, prefetch=prefetch
+        )
+
+        assert next(values) == "phase_0"
+        assert len(loaded) <= prefetch + 1
+
+        assert next(values) == "phase_1"
+        assert len(loaded) <= prefetch + 2
+
+        values.close()
+
+        assert len(loaded) <= prefetch + 2
+
+    def test__prefetch_0__phases_loaded_when_yielded(self, phase_output_from):
+
+        phase_outputs = make_phase_outputs(
+            phase_output_from=phase_output_from, total_phase_outputs=3
+        )
+
+        values = stream.model_results(phase_outputs=phase_outputs, prefetch=0)
+
+        assert next(values) == "results_0"
+        assert list(values) == ["results_1", "results_2"]
+
+    def test__unpickled_model_is_not_cached_on_phase_output(self):
+
+        phase_outputs = [
+            MockCachingPhaseOutput(directory="phase_{}".format(index))
+            for index in range(3)
+        ]
+
+        values = stream.stream(
+            phase_outputs=phase_outputs,
+            load=lambda phase_output: phase_output.model,
+            prefetch=1,
+        )
+
+        assert list(values) == ["model_phase_0", "model_phase_1", "model_phase_2"]
+        assert all(
+            phase_output._PhaseOutput__model is None for phase_output in phase_outputs
+        )
+
+    def test__instances_loaded_from_json_if_phase_wrote_it(
+        self, phase_output_from, tmpdir
+    ):
+
+        pickled_gaussian = toy.SphericalGaussian(intensity=1.0)
+
+        phase_output_with_json = phase_output_from(
+            directory=str(tmpdir), gaussians=[pickled_gaussian]
+        )
+        phase_output_without_json = phase_output_from(
+            directory="{}/missing".format(tmpdir), gaussians=[pickled_gaussian]
+        )
+
+        instance = af.ModelInstance()
+        instance.gaussians = [toy.SphericalGaussian(intensity=2.0)]
+
+        serialization.output_instance(
+            instance=instance, file_path="{}/instance.json".format(tmpdir)
+        )
+
+        instance_with_json, instance_without_json = stream.most_likely_model_instances(
+            phase_outputs=[phase_output_with_json, phase_output_without_json]
+        )
+
+        assert instance_with_json.gaussians[0].intensity == 2.0
+        assert instance_without_json.gaussians[0] is pickled_gaussian
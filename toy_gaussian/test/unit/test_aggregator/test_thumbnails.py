@@ -0,0 +1,103 @@
+import csv
+
+import autofit as af
+import numpy as np
+import pytest
+
+import toy_gaussian as toy
+from toy_gaussian.src.aggregator import thumbnails
+from toy_gaussian.src.plot import raster
+from toy_gaussian.test.mock import mock_pipeline
+
+
+class TestContactSheet:
+    def test__tiles_are_arranged_row_by_row_and_padded(self):
+
+        tiles = [
+            np.full((2, 3, 3), 1, dtype="uint8"),
+            np.full((2, 3, 3), 2, dtype="uint8"),
+            np.full((4, 3, 3), 3, dtype="uint8"),
+        ]
+
+        contact_sheet, positions = thumbnails.contact_sheet_from_tiles(
+            tiles=tiles, columns=2, padding=1
+        )
+
+        assert contact_sheet.shape == (11, 9, 3)
+        assert positions == [(0, 0), (0, 1), (1, 0)]
+        assert (contact_sheet[1:3, 1:4] == 1).all()
+        assert (contact_sheet[1:3, 5:8] == 2).all()
+        assert (contact_sheet[6:10, 1:4] == 3).all()
+        assert (contact_sheet[0] == 0).all()
+
+
+class TestOutputThumbnails:
+    def test__thumbnails_contact_sheet_and_index_are_output(
+        self, imaging_7x7, mask_7x7, gaussians, phase_output_from, tmpdir
+    ):
+
+        phase = toy.PhaseImaging(
+            optimizer_class=mock_pipeline.MockNLO,
+            phase_name="test_phase_thumbnails",
+            sub_size=1,
+        )
+        phase.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        directory = phase.optimizer.paths.phase_output_path
+
+        phase_outputs = [
+            phase_output_from(
+                directory=directory, dataset=imaging_7x7, gaussians=gaussians
+            )
+            for _ in range(3)
+        ]
+
+        output_path = str(tmpdir)
+
+        thumbnails.output_thumbnails(
+            phase_outputs=phase_outputs, output_path=output_path, scale=2
+        )
+
+        with open(
+            "{}/thumbnails/00002_residual_map.png".format(output_path), "rb"
+        ) as f:
+            assert f.read(8) == raster.png_signature
+
+        with open("{}/contact_sheet.png".format(output_path), "rb") as f:
+            assert f.read(8) == raster.png_signature
+
+        with open("{}/index.csv".format(output_path)) as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ["index", "row", "column", "chi_squared", "directory"]
+        assert [row[4] for row in rows[1:]] == [directory] * 3
+        assert rows[1][3] == rows[2][3]
+
+    def test__fit_uses_mask_and_settings_of_phase(
+        self, imaging_7x7, mask_7x7, gaussians, phase_output_from
+    ):
+
+        phase = toy.PhaseImaging(
+            optimizer_class=mock_pipeline.MockNLO,
+            phase_name="test_phase_thumbnails",
+            sub_size=2,
+            signal_to_noise_limit=1.0,
+        )
+        analysis = phase.make_analysis(dataset=imaging_7x7, mask=mask_7x7)
+
+        instance = af.ModelInstance()
+        instance.gaussians = gaussians
+
+        fit = thumbnails.fit_from_phase_output(
+            phase_output=phase_output_from(
+                directory=phase.optimizer.paths.phase_output_path,
+                dataset=imaging_7x7,
+                gaussians=gaussians,
+            )
+        )
+
+        analysis_fit = analysis.masked_imaging_fit_from_instance(instance=instance)
+
+        assert (fit.mask == analysis.masked_imaging.mask).all()
+        assert fit.mask.sub_size == 2
+        assert fit.chi_squared == pytest.approx(analysis_fit.chi_squared)
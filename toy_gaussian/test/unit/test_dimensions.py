@@ -1,4 +1,5 @@
 from toy_gaussian.src import exc
+import numpy as np
 import pytest
 
 import toy_gaussian as toy
@@ -92,6 +93,108 @@ class MockDimensionsProfile(toy.dim.DimensionsProfile):
         self.length = length
 
 
+class MockUnannotatedDimensionsProfile(MockDimensionsProfile):
+    def __init__(self, position=None, param_float=None, length=None, luminosity=None):
+
+        super(MockUnannotatedDimensionsProfile, self).__init__(
+            position=position,
+            param_float=param_float,
+            length=length,
+            luminosity=luminosity,
+        )
+
+
+class TestDimensionsMetadata(object):
+    def test__dimensioned_attributes_from_annotations__including_tuple_positions(
+        self
+    ):
+
+        metadata = toy.dim.metadata_from_class(cls=MockDimensionsProfile)
+
+        assert metadata.constructor_args == (
+            "self",
+            "position",
+            "param_float",
+            "length",
+            "luminosity",
+        )
+        assert metadata.length_attributes == [
+            ("position", 0),
+            ("position", 1),
+            ("length", None),
+        ]
+        assert metadata.luminosity_attributes == [("luminosity", None)]
+
+        assert toy.dim.metadata_from_class(cls=MockDimensionsProfile) is metadata
+        assert metadata.unannotated_args == ()
+
+    def test__unannotated_constructor__dimensioned_attributes_from_instance_values(
+        self
+    ):
+
+        metadata = toy.dim.metadata_from_class(cls=MockUnannotatedDimensionsProfile)
+
+        assert metadata.length_attributes == []
+        assert metadata.unannotated_args == (
+            "position",
+            "param_float",
+            "length",
+            "luminosity",
+        )
+
+        profile = MockUnannotatedDimensionsProfile(
+            position=(toy.dim.Length(1.0, "arcsec"), 2.0),
+            param_float=2.0,
+            length=toy.dim.Length(value=3.0, unit_length="arcsec"),
+            luminosity=toy.dim.Luminosity(value=4.0, unit_luminosity="eps"),
+        )
+
+        assert profile.dimensions_metadata.length_attributes == [
+            ("position", 0),
+            ("length", None),
+        ]
+        assert profile.dimensions_metadata.luminosity_attributes == [
+            ("luminosity", None)
+        ]
+
+        assert profile.unit_length == "arcsec"
+        assert profile.unit_luminosity == "eps"
+
+        profile_kpc = profile.new_object_with_units_converted(
+            unit_length="kpc",
+            unit_luminosity="counts",
+            kpc_per_arcsec=2.0,
+            exposure_time=10.0,
+        )
+
+        assert isinstance(profile_kpc, MockUnannotatedDimensionsProfile)
+        assert profile_kpc.position == (2.0, 2.0)
+        assert profile_kpc.position[0].unit == "kpc"
+        assert profile_kpc.param_float == 2.0
+        assert profile_kpc.length == 6.0
+        assert profile_kpc.length.unit == "kpc"
+        assert profile_kpc.luminosity == 40.0
+        assert profile_kpc.luminosity.unit == "counts"
+        assert profile_kpc.unit_length == "kpc"
+
+    def test__gaussian_metadata__read_through_map_types(self):
+
+        metadata = toy.dim.metadata_from_class(cls=toy.EllipticalGaussian)
+
+        assert "sigma" in metadata.constructor_args
+        assert metadata.length_attributes == [
+            ("centre", 0),
+            ("centre", 1),
+            ("sigma", None),
+        ]
+        assert metadata.luminosity_attributes == [("intensity", None)]
+
+        gaussian = toy.EllipticalGaussian(centre=(1.0, 2.0), intensity=3.0, sigma=4.0)
+
+        assert gaussian.unit_length == "arcsec"
+        assert gaussian.unit_luminosity == "eps"
+
+
 class TestDimensionsProfile(object):
     class TestUnitProperties(object):
         def test__extracts_length_correctly__raises_error_if_different_lengths_input(
@@ -322,3 +425,82 @@ class TestDimensionsProfile(object):
 
             with pytest.raises(exc.UnitsException):
                 profile_counts.new_object_with_units_converted(unit_luminosity="eps")
+
+
+class TestColumnsWithUnitsConverted(object):
+    def test__length_and_luminosity_columns__converted_with_per_row_factors(self):
+
+        columns = {
+            "sigma": np.array([1.0, 2.0, 3.0]),
+            "intensity": np.array([4.0, 5.0, 6.0]),
+            "axis_ratio": np.array([0.1, 0.2, 0.3]),
+        }
+
+        column_dimensions = {
+            "sigma": ("Length", "arcsec"),
+            "intensity": ("Luminosity", "eps"),
+        }
+
+        converted = toy.dim.columns_with_units_converted(
+            columns=columns,
+            column_dimensions=column_dimensions,
+            unit_length="kpc",
+            unit_luminosity="counts",
+            kpc_per_arcsec=np.array([1.0, 2.0, 3.0]),
+            exposure_time=10.0,
+        )
+
+        assert (converted["sigma"] == np.array([1.0, 4.0, 9.0])).all()
+        assert (converted["intensity"] == np.array([40.0, 50.0, 60.0])).all()
+        assert (converted["axis_ratio"] == columns["axis_ratio"]).all()
+
+        converted = toy.dim.columns_with_units_converted(
+            columns=columns, column_dimensions=column_dimensions, unit_length="arcsec"
+        )
+
+        assert (converted["sigma"] == columns["sigma"]).all()
+        assert (converted["intensity"] == columns["intensity"]).all()
+
+    def test__structured_array__same_as_profile_conversion(self):
+
+        profile = MockDimensionsProfile(
+            position=(toy.dim.Length(1.0, "arcsec"), toy.dim.Length(2.0, "arcsec")),
+            param_float=2.0,
+            length=toy.dim.Length(value=3.0, unit_length="arcsec"),
+            luminosity=toy.dim.Luminosity(value=4.0, unit_luminosity="eps"),
+        )
+
+        table = np.zeros(1, dtype=[("length", "f8"), ("luminosity", "f8")])
+        table["length"] = profile.length
+        table["luminosity"] = profile.luminosity
+
+        converted = toy.dim.columns_with_units_converted(
+            columns=table,
+            column_dimensions={
+                "length": ("Length", "arcsec"),
+                "luminosity": ("Luminosity", "eps"),
+            },
+            unit_length="kpc",
+            unit_luminosity="counts",
+            kpc_per_arcsec=[2.0],
+            exposure_time=[0.5],
+        )
+
+        profile = profile.new_object_with_units_converted(
+            unit_length="kpc",
+            unit_luminosity="counts",
+            kpc_per_arcsec=2.0,
+            exposure_time=0.5,
+        )
+
+        assert converted["length"][0] == profile.length
+        assert converted["luminosity"][0] == profile.luminosity
+
+    def test__conversion_factor_missing__raises_error(self):
+
+        with pytest.raises(exc.UnitsException):
+            toy.dim.columns_with_units_converted(
+                columns={"sigma": np.array([1.0])},
+                column_dimensions={"sigma": ("Length", "arcsec")},
+                unit_length="kpc",
+            )
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import toy_gaussian as toy
+
+
+def modules_imported_by(code):
+
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n{}\nprint(' '.join(sorted(sys.modules)))".format(code),
+        ]
+    )
+
+    return output.decode().split()
+
+
+class TestLazyImports:
+    def test__import__does_not_import_attributes(self):
+
+        modules = modules_imported_by(code="import toy_gaussian")
+
+        assert "toy_gaussian.src.model.gaussians" not in modules
+        assert "toy_gaussian.src.plot" not in modules
+        assert "matplotlib" not in modules
+
+    def test__gaussians__do_not_import_plotting(self):
+
+        modules = modules_imported_by(
+            code="import toy_gaussian as toy\ntoy.SphericalGaussian()"
+        )
+
+        assert "toy_gaussian.src.model.gaussians" in modules
+        assert "toy_gaussian.src.plot" not in modules
+        assert "toy_gaussian.src.pipeline.phase.imaging.phase" not in modules
+
+    def test__attributes__imported_when_used(self):
+
+        from toy_gaussian.src.model import gaussians
+
+        assert toy.SphericalGaussian is gaussians.SphericalGaussian
+        assert "SphericalGaussian" in dir(toy)
+
+        assert set(toy.__all__) <= set(dir(toy))
+
+        with pytest.raises(AttributeError):
+            toy.not_an_attribute
@@ -0,0 +1,90 @@
+import numpy as np
+
+import autofit as af
+import toy_gaussian as toy
+from toy_gaussian.src.model import fast_gaussians, geometry_profiles
+from toy_gaussian.src.pipeline.phase.imaging.analysis import Analysis
+
+
+class MockGaussian(toy.SphericalGaussian):
+    pass
+
+
+class TestFastGaussian:
+    def test__profile_image_identical_to_gaussian(self, sub_grid_7x7):
+
+        gaussian = toy.EllipticalGaussian(
+            centre=(0.1, -0.2), axis_ratio=0.6, phi=30.0, intensity=2.0, sigma=0.4
+        )
+
+        fast_gaussian = fast_gaussians.FastGaussian.from_gaussian(gaussian=gaussian)
+
+        assert type(fast_gaussian.intensity) is float
+        assert type(fast_gaussian.sigma) is float
+
+        assert (
+            fast_gaussian.profile_image_from_grid(grid=sub_grid_7x7)
+            == gaussian.profile_image_from_grid(grid=sub_grid_7x7)
+        ).all()
+
+        gaussian = toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+
+        fast_gaussian = fast_gaussians.FastGaussian.from_gaussian(gaussian=gaussian)
+
+        assert fast_gaussian.is_spherical is True
+        assert (
+            fast_gaussian.profile_image_from_grid(grid=sub_grid_7x7)
+            == gaussian.profile_image_from_grid(grid=sub_grid_7x7)
+        ).all()
+
+    def test__unsupported_class__no_fast_gaussians(self, gaussians):
+
+        assert len(fast_gaussians.fast_gaussians_from_gaussians(gaussians)) == 2
+
+        assert (
+            fast_gaussians.FastGaussian.from_gaussian(gaussian=MockGaussian()) is None
+        )
+        assert (
+            fast_gaussians.fast_gaussians_from_gaussians(gaussians + [MockGaussian()])
+            is None
+        )
+
+    def test__analysis_model_image_identical_to_gaussians(
+        self, masked_imaging_7x7, gaussians
+    ):
+
+        analysis = Analysis(masked_imaging=masked_imaging_7x7)
+
+        instance = af.ModelInstance()
+        instance.gaussians = gaussians
+
+        model_image = sum(
+            [
+                gaussian.profile_image_from_grid(masked_imaging_7x7.grid)
+                for gaussian in gaussians
+            ]
+        ).in_1d_binned
+
+        assert (
+            analysis.model_image_from_instance(instance=instance) == model_image
+        ).all()
+
+
+class TestRadialMinimum:
+    def test__radial_minimum_read_once_per_class(self):
+
+        geometry_profiles.radial_minimums.clear()
+
+        assert (
+            geometry_profiles.radial_minimum_from_class_name(
+                class_name="SphericalGaussian"
+            )
+            == 1e-8
+        )
+        assert len(geometry_profiles.radial_minimums) == 1
+
+        geometry_profiles.radial_minimum_from_class_name(class_name="SphericalGaussian")
+
+        assert len(geometry_profiles.radial_minimums) == 1
+
+        assert np.isclose(list(geometry_profiles.radial_minimums.values())[0], 1e-8)
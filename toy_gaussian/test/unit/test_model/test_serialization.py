@@ -0,0 +1,128 @@
+import autofit as af
+import pytest
+
+import toy_gaussian as toy
+from toy_gaussian.src import dimensions as dim
+from toy_gaussian.src import exc
+from toy_gaussian.src.model import serialization
+
+
+class UnregisteredGaussian(toy.SphericalGaussian):
+    pass
+
+
+class TestInstance:
+    def test__instance_round_trip__parameters_and_units_are_kept(self, tmpdir):
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            toy.EllipticalGaussian(
+                centre=(0.1, 0.2), axis_ratio=0.8, phi=45.0, intensity=2.0, sigma=0.5
+            ),
+            toy.SphericalGaussian(
+                centre=(1.0, 2.0),
+                intensity=dim.Luminosity(3.0, unit_luminosity="counts"),
+                sigma=1.0,
+            ),
+        ]
+
+        instance_dict = serialization.dict_from_instance(instance=instance)
+
+        assert instance_dict["vector"] == [0.1, 0.2, 0.8, 45.0, 2.0, 0.5] + [
+            1.0,
+            2.0,
+            3.0,
+            1.0,
+        ]
+        assert "pickle" not in instance_dict["gaussians"][0]
+
+        file_path = "{}/instance.json".format(tmpdir)
+
+        serialization.output_instance(instance=instance, file_path=file_path)
+
+        loaded = serialization.load_instance(file_path=file_path)
+
+        assert isinstance(loaded.gaussians[0], toy.EllipticalGaussian)
+        assert loaded.gaussians[0].centre == (0.1, 0.2)
+        assert loaded.gaussians[0].phi == 45.0
+        assert loaded.gaussians[0].sigma == 0.5
+        assert loaded.gaussians[0].sigma.unit_length == "arcsec"
+
+        assert type(loaded.gaussians[1]) is toy.SphericalGaussian
+        assert loaded.gaussians[1].intensity == 3.0
+        assert loaded.gaussians[1].intensity.unit_luminosity == "counts"
+
+    def test__unregistered_class__is_pickled(self):
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            UnregisteredGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=2.0),
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=3.0, sigma=4.0),
+        ]
+
+        instance_dict = serialization.dict_from_instance(instance=instance)
+
+        assert "pickle" in instance_dict["gaussians"][0]
+        assert instance_dict["vector"] == [0.0, 0.0, 3.0, 4.0]
+
+        loaded = serialization.instance_from_dict(instance_dict=instance_dict)
+
+        assert isinstance(loaded.gaussians[0], UnregisteredGaussian)
+        assert loaded.gaussians[0].sigma == 2.0
+        assert loaded.gaussians[1].sigma == 4.0
+
+
+class TestGaussianModels:
+    def test__models_round_trip__priors_constants_and_links_are_kept(self, tmpdir):
+
+        gaussian_0 = af.PriorModel(toy.SphericalGaussian)
+        gaussian_0.sigma = af.GaussianPrior(mean=1.0, sigma=0.5)
+        gaussian_0.intensity = 2.0
+
+        gaussian_1 = af.PriorModel(toy.EllipticalGaussian)
+        gaussian_1.centre = gaussian_0.centre
+
+        file_path = "{}/model.json".format(tmpdir)
+
+        serialization.output_gaussian_models(
+            gaussian_models=[gaussian_0, gaussian_1], file_path=file_path
+        )
+
+        loaded_0, loaded_1 = serialization.load_gaussian_models(file_path=file_path)
+
+        assert loaded_0.cls is toy.SphericalGaussian
+        assert loaded_1.cls is toy.EllipticalGaussian
+
+        assert loaded_0.prior_count == gaussian_0.prior_count
+        assert loaded_1.prior_count == gaussian_1.prior_count
+
+        assert loaded_0.sigma.mean == pytest.approx(1.0)
+        assert loaded_0.sigma.sigma == pytest.approx(0.5)
+        assert loaded_0.intensity == 2.0
+        assert loaded_0.centre.centre_0 is loaded_1.centre.centre_0
+
+
+class TestVersion:
+    def test__unknown_version__is_rejected(self, tmpdir):
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=2.0)
+        ]
+
+        instance_dict = serialization.dict_from_instance(instance=instance)
+        instance_dict["version"] = serialization.version + 1
+
+        with pytest.raises(exc.SerializationException):
+            serialization.instance_from_dict(instance_dict=instance_dict)
+
+        models_dict = serialization.dict_from_gaussian_models(
+            gaussian_models=[af.PriorModel(toy.SphericalGaussian)]
+        )
+
+        serialization.gaussian_models_from_dict(models_dict=models_dict)
+
+        del models_dict["version"]
+
+        with pytest.raises(exc.SerializationException):
+            serialization.gaussian_models_from_dict(models_dict=models_dict)
@@ -0,0 +1,183 @@
+import pickle
+
+import autoarray as aa
+import autofit as af
+import numpy as np
+import toy_gaussian as toy
+from toy_gaussian.src.pipeline.phase.imaging.analysis import Analysis
+from toy_gaussian.src.pipeline.phase.imaging import likelihood_cache as lc
+
+
+class MockMaskedImaging(object):
+    def __init__(self, image, noise_map, psf, mask):
+
+        self.image = image
+        self.noise_map = noise_map
+        self.psf = psf
+        self.mask = mask
+
+
+class TestParameterKey:
+    def test__same_parameters__same_key__different_parameters__different_key(self):
+
+        instance_0 = af.ModelInstance()
+        instance_0.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+        ]
+
+        instance_1 = af.ModelInstance()
+        instance_1.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+        ]
+
+        assert lc.parameter_key_from_instance(
+            instance=instance_0
+        ) == lc.parameter_key_from_instance(instance=instance_1)
+
+        instance_1.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.6)
+        ]
+
+        assert lc.parameter_key_from_instance(
+            instance=instance_0
+        ) != lc.parameter_key_from_instance(instance=instance_1)
+
+        instance_1.gaussians = [
+            toy.EllipticalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+        ]
+
+        assert lc.parameter_key_from_instance(
+            instance=instance_0
+        ) != lc.parameter_key_from_instance(instance=instance_1)
+
+
+class TestLikelihoodCache:
+    def test__hits_and_misses_are_counted(self):
+
+        cache = lc.LikelihoodCache(fingerprint="a")
+
+        assert cache.figure_of_merit_for_key(key=(1,)) is None
+
+        cache.add(key=(1,), figure_of_merit=2.0)
+
+        assert cache.figure_of_merit_for_key(key=(1,)) == 2.0
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test__release__clears_figures_of_merit_but_keeps_counts(self):
+
+        cache = lc.LikelihoodCache(fingerprint="a")
+        cache.add(key=(1,), figure_of_merit=2.0)
+        cache.figure_of_merit_for_key(key=(1,))
+
+        cache.release()
+
+        assert len(cache) == 0
+        assert cache.hits == 1
+
+    def test__fingerprint__changes_with_masked_imaging(
+        self, masked_imaging_7x7, imaging_7x7, mask_7x7_1_pix
+    ):
+
+        fingerprint = lc.fingerprint_from_masked_imaging(
+            masked_imaging=masked_imaging_7x7
+        )
+
+        assert fingerprint == lc.fingerprint_from_masked_imaging(
+            masked_imaging=masked_imaging_7x7
+        )
+
+        masked_imaging = aa.masked.imaging(imaging=imaging_7x7, mask=mask_7x7_1_pix)
+
+        assert fingerprint != lc.fingerprint_from_masked_imaging(
+            masked_imaging=masked_imaging
+        )
+
+    def test__fingerprint__masked_imaging_without_psf(self, masked_imaging_7x7):
+
+        def masked_imaging_without_psf(psf=None):
+            return MockMaskedImaging(
+                image=np.copy(masked_imaging_7x7.image),
+                noise_map=np.copy(masked_imaging_7x7.noise_map),
+                psf=psf,
+                mask=masked_imaging_7x7.mask,
+            )
+
+        fingerprint = lc.fingerprint_from_masked_imaging(
+            masked_imaging=masked_imaging_without_psf()
+        )
+
+        assert fingerprint == lc.fingerprint_from_masked_imaging(
+            masked_imaging=masked_imaging_without_psf()
+        )
+        assert fingerprint != lc.fingerprint_from_masked_imaging(
+            masked_imaging=masked_imaging_without_psf(psf=np.ones((3, 3)))
+        )
+
+
+class TestLikelihoodMemo:
+    def test__figures_of_merit_flushed_to_file_and_loaded_by_new_memo(self, tmpdir):
+
+        memo_path = str(tmpdir)
+
+        memo = lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path, flush_interval=2)
+        memo.add(key=(1,), figure_of_merit=2.0)
+
+        assert len(lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path)) == 0
+
+        memo.add(key=(2,), figure_of_merit=3.0)
+
+        loaded_memo = lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path)
+
+        assert loaded_memo.figure_of_merit_for_key(key=(1,)) == 2.0
+        assert loaded_memo.figure_of_merit_for_key(key=(2,)) == 3.0
+
+        memo.add(key=(3,), figure_of_merit=4.0)
+        memo.flush()
+
+        loaded_memo = lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path)
+
+        assert loaded_memo.figure_of_merit_for_key(key=(3,)) == 4.0
+
+        assert len(lc.LikelihoodMemo(fingerprint="b", memo_path=memo_path)) == 0
+
+    def test__incomplete_final_record_is_ignored(self, tmpdir):
+
+        memo_path = str(tmpdir)
+
+        memo = lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path)
+        memo.add(key=(1,), figure_of_merit=2.0)
+        memo.flush()
+
+        with open(memo.file_path, "ab") as f:
+            f.write(b"\x00" * 5)
+
+        loaded_memo = lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path)
+
+        assert len(loaded_memo) == 1
+        assert loaded_memo.figure_of_merit_for_key(key=(1,)) == 2.0
+
+    def test__release__flushes_pending_figures_of_merit(self, tmpdir):
+
+        memo_path = str(tmpdir)
+
+        memo = lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path)
+        memo.add(key=(1,), figure_of_merit=2.0)
+        memo.release()
+
+        assert len(memo) == 0
+
+        loaded_memo = lc.LikelihoodMemo(fingerprint="a", memo_path=memo_path)
+
+        assert loaded_memo.figure_of_merit_for_key(key=(1,)) == 2.0
+
+    def test__memo_is_not_pickled_with_analysis(self, masked_imaging_7x7, tmpdir):
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            likelihood_cache=lc.LikelihoodMemo(fingerprint="a", memo_path=str(tmpdir)),
+        )
+
+        assert pickle.loads(pickle.dumps(analysis)).likelihood_cache is None
+        assert analysis.likelihood_cache is not None
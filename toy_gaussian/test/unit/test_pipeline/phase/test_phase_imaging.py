@@ -83,6 +83,28 @@ class TestPhase(object):
         assert isinstance(result.instance.gaussians[0], toy.SphericalGaussian)
         assert isinstance(result.instance.gaussians[1], toy.SphericalGaussian)
 
+    def test__result__most_likely_fit_computed_once_and_can_be_dropped(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = toy.PhaseImaging(
+            optimizer_class=mock_pipeline.MockNLO,
+            gaussians=[toy.SphericalGaussian],
+            phase_name="test_phase_test_fit",
+        )
+
+        result = phase_imaging_7x7.run(dataset=imaging_7x7, mask=mask_7x7)
+
+        most_likely_fit = result.most_likely_fit
+
+        assert result.most_likely_fit is most_likely_fit
+        assert (result.most_likely_model_image == most_likely_fit.model_data).all()
+        assert (result.mask == most_likely_fit.mask).all()
+
+        result.drop_fit()
+
+        assert result.most_likely_fit is not most_likely_fit
+        assert result.most_likely_fit.likelihood == most_likely_fit.likelihood
+
     def test_modify_image(self, imaging_7x7, mask_7x7):
         class MyPhase(toy.PhaseImaging):
             def modify_image(self, image, results):
@@ -218,3 +240,42 @@ class TestPhase(object):
         )
 
         assert fit.likelihood == fit_figure_of_merit
+
+    def test__warm_start__priors_centred_on_previous_phase_posterior(self):
+
+        previous_model = af.ModelMapper()
+        previous_model.gaussians = [af.PriorModel(cls=toy.SphericalGaussian)]
+
+        results = af.ResultsCollection()
+        result = mock_pipeline.MockResult(
+            instance=None, figure_of_merit=None, model=previous_model
+        )
+        result.gaussian_tuples = [(0.1, 0.01), (0.2, 0.02), (0.3, 0.03), (0.4, 0.0)]
+        results.add("phase", result)
+
+        phase_imaging_7x7 = toy.PhaseImaging(
+            gaussians=[af.PriorModel(cls=toy.SphericalGaussian)],
+            phase_name="test_phase",
+            warm_start=True,
+        )
+
+        phase_imaging_7x7.customize_priors(results=results)
+
+        gaussian = phase_imaging_7x7.model.gaussians[0]
+
+        assert gaussian.centre.centre_0.mean == 0.1
+        assert gaussian.centre.centre_1.mean == 0.2
+        assert gaussian.intensity.mean == 0.3
+        assert gaussian.intensity.sigma == pytest.approx(0.03)
+        assert not isinstance(gaussian.sigma, af.GaussianPrior)
+
+        phase_imaging_7x7 = toy.PhaseImaging(
+            gaussians=[af.PriorModel(cls=toy.SphericalGaussian)],
+            phase_name="test_phase",
+        )
+
+        phase_imaging_7x7.customize_priors(results=results)
+
+        assert not isinstance(
+            phase_imaging_7x7.model.gaussians[0].intensity, af.GaussianPrior
+        )
@@ -0,0 +1,166 @@
+import autofit as af
+import numpy as np
+import pytest
+
+import toy_gaussian as toy
+from toy_gaussian.src.pipeline import binary_output as bo
+from toy_gaussian.src.pipeline.phase.imaging import likelihood_cache as lc
+from toy_gaussian.src.pipeline.phase.imaging.analysis import Analysis
+
+
+class TestBinaryOutput:
+    def test__samples_are_flushed_at_interval_and_loaded(self, tmpdir):
+
+        path = "{}/binary_output".format(tmpdir)
+
+        output = bo.BinaryOutput(
+            path=path, header={"phase": "phase_1", "sub_size": 2}, flush_interval=2
+        )
+
+        output.add_sample(log_likelihood=1.0, columns={"a": 2.0, "b": 3.0})
+
+        header, samples = bo.load(path=path)
+
+        assert header["phase"] == "phase_1"
+        assert header["evaluated_columns"] == ["log_likelihood", "a", "b"]
+        assert samples["EVAL"].shape == (0, 0)
+
+        output.add_sample(log_likelihood=4.0, columns={"b": 6.0, "a": 5.0})
+
+        header, samples = bo.load(path=path)
+
+        assert (samples["EVAL"] == np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])).all()
+
+        output.add_posterior(
+            weights=np.array([0.5, 0.5]),
+            log_likelihoods=np.array([1.0, 4.0]),
+            parameters=np.array([[2.0], [5.0]]),
+            param_names=["a"],
+        )
+
+        header, samples = bo.load(path=path)
+
+        assert header["posterior_columns"] == ["weight", "log_likelihood", "a"]
+        assert (samples["POST"] == np.array([[0.5, 1.0, 2.0], [0.5, 4.0, 5.0]])).all()
+
+    def test__posterior_of_rerun_phase_replaces_existing_posterior(self, tmpdir):
+
+        path = "{}/binary_output".format(tmpdir)
+
+        output = bo.BinaryOutput(path=path, header={}, flush_interval=1)
+        output.add_sample(log_likelihood=1.0, columns={"a": 2.0})
+        output.add_posterior(
+            weights=np.array([1.0]),
+            log_likelihoods=np.array([1.0]),
+            parameters=np.array([[2.0]]),
+            param_names=["a"],
+        )
+
+        output = bo.BinaryOutput(path=path, header={}, flush_interval=1)
+        output.add_sample(log_likelihood=3.0, columns={"a": 4.0})
+        output.add_posterior(
+            weights=np.array([0.5, 0.5]),
+            log_likelihoods=np.array([1.0, 3.0]),
+            parameters=np.array([[2.0, 0.0], [4.0, 0.0]]),
+            param_names=["a", "b"],
+        )
+
+        header, samples = bo.load(path=path)
+
+        assert header["posterior_columns"] == ["weight", "log_likelihood", "a", "b"]
+        assert (samples["EVAL"] == np.array([[1.0, 2.0], [3.0, 4.0]])).all()
+        assert (
+            samples["POST"] == np.array([[0.5, 1.0, 2.0, 0.0], [0.5, 3.0, 4.0, 0.0]])
+        ).all()
+
+        with open(output.samples_path, "rb") as f:
+            kinds = [kind for kind, _, _, _, _ in bo.chunks_from_data(data=f.read())]
+
+        assert kinds == [bo.evaluated_kind, bo.evaluated_kind, bo.posterior_kind]
+
+    def test__incomplete_final_chunk_is_ignored__resumed_output_truncates_it(
+        self, tmpdir
+    ):
+
+        path = "{}/binary_output".format(tmpdir)
+
+        output = bo.BinaryOutput(path=path, header={}, flush_interval=1)
+        output.add_sample(log_likelihood=1.0, columns={"a": 2.0})
+
+        with open(output.samples_path, "ab") as f:
+            f.write(bo.chunk_header.pack(bo.evaluated_kind, 1, 2) + b"\x00" * 3)
+
+        header, samples = bo.load(path=path)
+
+        assert (samples["EVAL"] == np.array([[1.0, 2.0]])).all()
+
+        output = bo.BinaryOutput(
+            path=path, header={"phase": "phase_1"}, flush_interval=1
+        )
+
+        assert output.header["evaluated_columns"] == ["log_likelihood", "a"]
+
+        output.add_sample(log_likelihood=3.0, columns={"a": 4.0})
+
+        header, samples = bo.load(path=path)
+
+        assert (samples["EVAL"] == np.array([[1.0, 2.0], [3.0, 4.0]])).all()
+
+
+class TestAnalysis:
+    def test__fit_adds_sample_to_binary_output(self, masked_imaging_7x7, tmpdir):
+
+        path = "{}/binary_output".format(tmpdir)
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            binary_output=bo.BinaryOutput(path=path, header={}, flush_interval=1),
+        )
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+        ]
+
+        figure_of_merit = analysis.fit(instance=instance)
+
+        header, samples = bo.load(path=path)
+
+        assert header["evaluated_columns"][0] == "log_likelihood"
+        assert "gaussians_0_sigma" in header["evaluated_columns"]
+        assert samples["EVAL"][0, 0] == pytest.approx(figure_of_merit)
+
+    def test__binary_output_is_not_pickled(self, masked_imaging_7x7, tmpdir):
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            binary_output=bo.BinaryOutput(path=str(tmpdir), header={}),
+        )
+
+        assert analysis.__getstate__()["binary_output"] is None
+
+    def test__cache_hits_are_added_as_evaluated_samples(
+        self, masked_imaging_7x7, tmpdir
+    ):
+
+        path = "{}/binary_output".format(tmpdir)
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            likelihood_cache=lc.LikelihoodCache(fingerprint="fingerprint"),
+            binary_output=bo.BinaryOutput(path=path, header={}, flush_interval=1),
+        )
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+        ]
+
+        figure_of_merit = analysis.fit(instance=instance)
+        analysis.fit(instance=instance)
+
+        header, samples = bo.load(path=path)
+
+        assert analysis.likelihood_cache.hits == 1
+        assert samples["EVAL"].shape[0] == 2
+        assert samples["EVAL"][1, 0] == pytest.approx(figure_of_merit)
@@ -0,0 +1,403 @@
+import itertools
+import json
+
+import autofit as af
+import numpy as np
+import pytest
+
+import toy_gaussian as toy
+from toy_gaussian.src import exc
+from toy_gaussian.src.pipeline import grid_search
+from toy_gaussian.test.mock import mock_pipeline
+
+
+def make_cells(labels):
+    return [
+        grid_search.Cell(index=index, label=label, values=[], model=None, optimizer=None)
+        for index, label in enumerate(labels)
+    ]
+
+
+class MockArray(np.ndarray):
+    pass
+
+
+class MockAnalysis(object):
+    def __init__(self, image, grid):
+
+        self.image = image
+        self.grid = grid
+
+    def fit(self, instance):
+        return float(np.sum(self.image)) * instance
+
+
+class MockModel(object):
+    def __init__(self, value):
+        self.value = value
+
+    def instance_from_prior_medians(self):
+        return self.value
+
+    def name_for_prior(self, prior):
+        return prior.name
+
+
+class MockResult(object):
+    def __init__(self, figure_of_merit):
+        self.figure_of_merit = figure_of_merit
+
+
+class MockOptimizer(object):
+    def __init__(self):
+        self.max_iter = None
+        self.max_iters = []
+
+    def fit(self, analysis, model):
+        self.max_iters.append(self.max_iter)
+        return MockResult(figure_of_merit=analysis.fit(instance=model.value))
+
+
+class MockPrior(object):
+    def __init__(self, name, lower_limit, width):
+        self.name = name
+        self.lower_limit = lower_limit
+        self.width = width
+
+
+class MockPaths(object):
+    def __init__(self, phase_output_path):
+        self.phase_output_path = phase_output_path
+
+
+class MockGridSearch(grid_search.GridSearch):
+    def __init__(self, cells, phase_output_path, parallel=False, pruning=None):
+
+        self.cells = cells
+        self.paths = MockPaths(phase_output_path=phase_output_path)
+        self.parallel = parallel
+        self.number_of_cores = 2
+        self.pruning = pruning
+
+    def cells_from(self, model, grid_priors):
+        return self.cells
+
+
+class MockCellOptimizer(af.NonLinearOptimizer):
+    def __init__(self, paths):
+
+        super().__init__(paths=paths)
+
+        self.max_iter = None
+        self.max_iters = []
+
+    def fit(self, analysis, model):
+
+        self.max_iters.append(self.max_iter)
+
+        instance = model.instance_from_prior_medians()
+
+        result = mock_pipeline.MockResult(
+            instance=instance, figure_of_merit=analysis.fit(instance), model=model
+        )
+        result.max_iters = list(self.max_iters)
+
+        return result
+
+
+def make_grid_phase(pruning=None):
+    class GridPhase(
+        toy.as_grid_search(phase_class=toy.PhaseImaging, pruning=pruning)
+    ):
+        @property
+        def grid_priors(self):
+            return [self.model.gaussians.gaussian_0.centre_0]
+
+    gaussian_0 = af.PriorModel(toy.SphericalGaussian)
+    gaussian_0.centre.centre_0 = af.UniformPrior(lower_limit=-0.25, upper_limit=1.75)
+
+    return GridPhase(
+        phase_name="test_grid_phase",
+        gaussians=af.CollectionPriorModel(gaussian_0=gaussian_0),
+        optimizer_class=MockCellOptimizer,
+        number_of_steps=4,
+    )
+
+
+def make_mock_cells(values):
+    return [
+        grid_search.Cell(
+            index=index,
+            label="cell_{}".format(index),
+            values=[0.25 * index],
+            model=MockModel(value=value),
+            optimizer=MockOptimizer(),
+        )
+        for index, value in enumerate(values)
+    ]
+
+
+def make_analysis():
+
+    grid = np.arange(6.0).reshape(3, 2).view(MockArray)
+    grid.pixel_scales = (0.1, 0.1)
+
+    return MockAnalysis(image=np.ones(4), grid=grid)
+
+
+class TestCellOrder:
+    def test__no_timings__order_is_unchanged(self):
+
+        cells = make_cells(labels=["a", "b", "c"])
+
+        cells = grid_search.cell_order_from_timings(cells=cells, timings={})
+
+        assert [cell.label for cell in cells] == ["a", "b", "c"]
+
+    def test__slowest_timed_cells_are_first__untimed_cells_last(self):
+
+        cells = make_cells(labels=["a", "b", "c", "d"])
+
+        cells = grid_search.cell_order_from_timings(
+            cells=cells, timings={"a": 1.0, "c": 5.0, "d": 3.0}
+        )
+
+        assert [cell.label for cell in cells] == ["c", "d", "a", "b"]
+
+
+class TestTimingsWithEstimates:
+    def test__untimed_cells_are_estimated__scaled_by_timed_cells(self):
+
+        cells = make_cells(labels=["a", "b", "c"])
+
+        timings = grid_search.timings_with_estimates(
+            cells=cells, timings={}, estimates={"a": 1.0, "b": 3.0, "c": 2.0}
+        )
+
+        assert timings == {"a": 1.0, "b": 3.0, "c": 2.0}
+
+        timings = grid_search.timings_with_estimates(
+            cells=cells, timings={"a": 10.0}, estimates={"a": 1.0, "b": 3.0, "c": 2.0}
+        )
+
+        assert timings == {"a": 10.0, "b": 30.0, "c": 20.0}
+        assert [
+            cell.label
+            for cell in grid_search.cell_order_from_timings(cells=cells, timings=timings)
+        ] == ["b", "c", "a"]
+
+
+class TestSharedAnalysis:
+    def test__arrays_are_read_only_views_of_shared_memory(self):
+
+        analysis = make_analysis()
+
+        with grid_search.SharedAnalysis(analysis=analysis) as shared_analysis:
+
+            block = shared_analysis.shared_memory
+
+            shared = grid_search.analysis_from_shared_memory(
+                block=block, offset=shared_analysis.offset, size=shared_analysis.size
+            )
+
+            assert (shared.image == analysis.image).all()
+            assert (shared.grid == analysis.grid).all()
+            assert isinstance(shared.grid, MockArray)
+            assert shared.grid.pixel_scales == (0.1, 0.1)
+
+            buffer = np.frombuffer(block.buf, dtype=np.uint8)
+
+            assert np.shares_memory(shared.image, buffer)
+            assert np.shares_memory(shared.grid, buffer)
+            assert not shared.image.flags.writeable
+
+            del shared, buffer
+
+    def test__size_of_pickle_excludes_array_data(self):
+
+        analysis = MockAnalysis(image=np.ones(100000), grid=np.ones(10))
+
+        with grid_search.SharedAnalysis(analysis=analysis) as shared_analysis:
+
+            assert shared_analysis.size < 1000
+            assert shared_analysis.offset >= 100000 * 8
+
+
+class TestPerformCells:
+    def test__sequential__results_and_timings_of_every_cell(self, tmpdir):
+
+        cells = make_mock_cells(values=[1.0, 2.0, 3.0])
+        search = MockGridSearch(cells=cells, phase_output_path=str(tmpdir))
+
+        timings = {}
+        results = search.perform_cells(
+            cells=cells, analysis=make_analysis(), timings=timings
+        )
+
+        assert {index: result.figure_of_merit for index, result in results.items()} == {
+            0: 4.0,
+            1: 8.0,
+            2: 12.0,
+        }
+        assert sorted(timings) == ["cell_0", "cell_1", "cell_2"]
+
+    def test__parallel__cells_fitted_in_workers_with_shared_analysis(self, tmpdir):
+
+        cells = make_mock_cells(values=[1.0, 2.0, 3.0, 4.0])
+        search = MockGridSearch(cells=cells, phase_output_path=str(tmpdir), parallel=True)
+
+        timings = {}
+        results = search.perform_cells(
+            cells=cells,
+            analysis=make_analysis(),
+            timings=timings,
+            previous_timings={"cell_0": 1.0},
+        )
+
+        assert {index: result.figure_of_merit for index, result in results.items()} == {
+            0: 4.0,
+            1: 8.0,
+            2: 12.0,
+            3: 16.0,
+        }
+        assert sorted(timings) == ["cell_0", "cell_1", "cell_2", "cell_3"]
+
+
+class TestAvailableCores:
+    def test__never_more_than_requested_and_at_least_one(self):
+
+        assert 1 <= grid_search.available_cores(number_of_cores=2) <= 2
+        assert grid_search.available_cores(number_of_cores=1) == 1
+
+
+class TestSuccessiveHalving:
+    def test__number_kept__reduced_by_factor_but_never_below_survivors(self):
+
+        pruning = grid_search.SuccessiveHalving(reduction_factor=2, number_of_survivors=1)
+
+        assert pruning.number_kept(number_of_cells=100) == 50
+        assert pruning.number_kept(number_of_cells=3) == 1
+        assert pruning.number_kept(number_of_cells=1) == 1
+
+        pruning = grid_search.SuccessiveHalving(reduction_factor=3, number_of_survivors=4)
+
+        assert pruning.number_kept(number_of_cells=100) == 33
+        assert pruning.number_kept(number_of_cells=9) == 4
+
+    def test__reduction_factor_below_2__raises_exception(self):
+
+        with pytest.raises(exc.PhaseException):
+            grid_search.SuccessiveHalving(reduction_factor=1)
+
+
+class TestFitPruned:
+    def test__survivors_of_every_round__pruned_results_and_table(
+        self, tmpdir, monkeypatch
+    ):
+
+        clock = itertools.count()
+        monkeypatch.setattr(grid_search.time, "time", lambda: float(next(clock)))
+
+        cells = make_mock_cells(values=[1.0, 4.0, 2.0, 3.0])
+
+        search = MockGridSearch(
+            cells=cells,
+            phase_output_path=str(tmpdir),
+            pruning=grid_search.SuccessiveHalving(
+                initial_max_iter=10, reduction_factor=2, number_of_survivors=1
+            ),
+        )
+
+        result = search.fit(
+            model=MockModel(value=None),
+            analysis=make_analysis(),
+            grid_priors=[MockPrior(name="centre_0", lower_limit=0.0, width=4.0)],
+        )
+
+        assert [cell.optimizer.max_iters for cell in cells] == [
+            [10],
+            [10, 20, 0],
+            [10],
+            [10, 20],
+        ]
+
+        assert result.pruned == [True, False, True, True]
+        assert [cell_result.pruned for cell_result in result.results] == [
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert [cell_result.figure_of_merit for cell_result in result.results] == [
+            4.0,
+            16.0,
+            8.0,
+            12.0,
+        ]
+
+        with open("{}/results".format(tmpdir)) as f:
+            rows = [line.split(", ") for line in f.read().splitlines()]
+
+        assert rows[0] == ["centre_0", "figure_of_merit", "pruned"]
+        assert [row[-1] for row in rows[1:]] == ["True", "False", "True", "True"]
+
+    def test__timings_of_every_round_are_summed(self, tmpdir, monkeypatch):
+
+        clock = itertools.count()
+        monkeypatch.setattr(grid_search.time, "time", lambda: float(next(clock)))
+
+        search = MockGridSearch(
+            cells=make_mock_cells(values=[1.0, 4.0, 2.0, 3.0]),
+            phase_output_path=str(tmpdir),
+            pruning=grid_search.SuccessiveHalving(
+                initial_max_iter=10, reduction_factor=2, number_of_survivors=1
+            ),
+        )
+
+        search.fit(
+            model=MockModel(value=None),
+            analysis=make_analysis(),
+            grid_priors=[MockPrior(name="centre_0", lower_limit=0.0, width=4.0)],
+        )
+
+        with open(search.timings_path) as f:
+            timings = json.load(f)
+
+        assert timings == {"cell_0": 1.0, "cell_1": 3.0, "cell_2": 1.0, "cell_3": 2.0}
+
+
+class TestAsGridSearch:
+    def test__phase_run__grid_search_fits_every_cell(self, imaging_7x7, mask_7x7):
+
+        phase = make_grid_phase()
+
+        assert isinstance(phase.optimizer, grid_search.GridSearch)
+        assert phase.optimizer.number_of_steps == 4
+
+        result = phase.run(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert len(result.results) == 4
+        assert result.lists == [[0.0], [0.25], [0.5], [0.75]]
+        assert all(cell_result.max_iters == [None] for cell_result in result.results)
+
+    def test__phase_run__pruned_by_successive_halving(self, imaging_7x7, mask_7x7):
+
+        phase = make_grid_phase(
+            pruning=grid_search.SuccessiveHalving(
+                initial_max_iter=10, reduction_factor=2, number_of_survivors=1
+            )
+        )
+
+        result = phase.run(dataset=imaging_7x7, mask=mask_7x7)
+
+        assert result.lists == [[0.0], [0.25], [0.5], [0.75]]
+        assert result.physical_lower_limits_lists == [[-0.25], [0.25], [0.75], [1.25]]
+        assert sorted(cell_result.max_iters for cell_result in result.results) == [
+            [10],
+            [10],
+            [10, 20],
+            [10, 20, 0],
+        ]
+        assert result.pruned.count(False) == 1
+        assert result.best_result.max_iters == [10, 20, 0]
+        assert result.best_result.pruned is False
@@ -0,0 +1,186 @@
+import json
+import os
+import pstats
+import tracemalloc
+
+import autofit as af
+import pytest
+
+import toy_gaussian as toy
+from toy_gaussian.src.pipeline import profiling
+from toy_gaussian.src.pipeline.phase.imaging.analysis import Analysis
+
+
+def load_summary(path):
+
+    with open("{}/profiling.json".format(path)) as f:
+        return json.load(f)
+
+
+class TestProfiler:
+    def test__stage_without_profiler_is_shared_null_context(self):
+
+        assert profiling.stage(profiler=None, name="a") is profiling.null_stage
+        assert profiling.stage(profiler=None, name="a", index=1) is profiling.null_stage
+
+    def test__stages_are_summed_and_output_at_interval(self, tmpdir):
+
+        path = "{}/profiling".format(tmpdir)
+
+        profiler = profiling.Profiler(path=path, output_interval=2)
+
+        with profiler.fit():
+            with profiling.stage(profiler=profiler, name="profile_image", index=0):
+                pass
+
+        assert not os.path.exists(path)
+
+        with profiler.fit():
+            with profiling.stage(profiler=profiler, name="profile_image", index=0):
+                pass
+            with profiling.stage(profiler=profiler, name="profile_image", index=1):
+                pass
+
+        summary = load_summary(path=path)
+
+        assert summary["total_fits"] == 2
+        assert summary["stages"]["fit"]["calls"] == 2
+        assert summary["stages"]["profile_image.gaussians_0"]["calls"] == 2
+        assert summary["stages"]["profile_image.gaussians_1"]["calls"] == 1
+        assert 0.0 <= summary["stages"]["profile_image.gaussians_1"][
+            "fraction_of_fit"
+        ] <= 1.0
+        assert os.listdir(path) == ["profiling.json"]
+
+    def test__every_nth_fit_is_profiled_with_cprofile(self, tmpdir):
+
+        path = "{}/profiling".format(tmpdir)
+
+        profiler = profiling.Profiler(path=path, output_interval=0, cprofile_interval=2)
+
+        for _ in range(4):
+            with profiler.fit():
+                sum(range(100))
+
+        assert sorted(os.listdir("{}/cprofile".format(path))) == [
+            "fit_2.prof",
+            "fit_4.prof",
+        ]
+
+        pstats.Stats("{}/cprofile/fit_2.prof".format(path))
+
+
+class TestAnalysis:
+    def test__fit_times_every_stage_and_gaussian(self, masked_imaging_7x7, tmpdir):
+
+        path = "{}/profiling".format(tmpdir)
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            profiler=profiling.Profiler(path=path, output_interval=1),
+        )
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5),
+            toy.SphericalGaussian(centre=(0.1, 0.1), intensity=2.0, sigma=1.0),
+        ]
+
+        figure_of_merit = analysis.fit(instance=instance)
+
+        assert figure_of_merit == pytest.approx(
+            Analysis(masked_imaging=masked_imaging_7x7).fit(instance=instance)
+        )
+
+        stages = load_summary(path=path)["stages"]
+
+        assert sorted(stages) == [
+            "figure_of_merit",
+            "fit",
+            "fit_masked_dataset",
+            "in_1d_binned",
+            "profile_image.gaussians_0",
+            "profile_image.gaussians_1",
+        ]
+        assert all(stage["calls"] == 1 for stage in stages.values())
+
+    def test__profiler_is_not_pickled(self, masked_imaging_7x7, tmpdir):
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            profiler=profiling.Profiler(path=str(tmpdir)),
+        )
+
+        assert analysis.__getstate__()["profiler"] is None
+
+
+class TestMemoryProfiler:
+    def test__peak_and_net_bytes_of_stages(self, tmpdir):
+
+        path = "{}/profiling".format(tmpdir)
+
+        profiler = profiling.MemoryProfiler(
+            path=path, output_interval=2, snapshot_interval=0
+        )
+
+        kept = []
+
+        for _ in range(2):
+            with profiler.fit():
+                with profiling.stage(profiler=profiler, name="profile_image", index=0):
+                    freed = bytearray(1000000)
+                    del freed
+                    kept.append(bytearray(100000))
+
+        stage = load_summary(path=path)["stages"]["profile_image.gaussians_0"]
+
+        assert stage["calls"] == 2
+        assert stage["mean_peak_bytes"] >= 1000000
+        assert 100000 <= stage["mean_net_bytes"] < 1000000
+        assert "call_sites" not in stage
+
+    def test__call_sites_of_stages_every_nth_fit(self, tmpdir):
+
+        path = "{}/profiling".format(tmpdir)
+
+        profiler = profiling.MemoryProfiler(
+            path=path, output_interval=2, snapshot_interval=2
+        )
+
+        kept = []
+
+        for _ in range(2):
+            with profiler.fit():
+                with profiling.stage(profiler=profiler, name="profile_image", index=0):
+                    kept.append(bytearray(100000))
+
+        stage = load_summary(path=path)["stages"]["profile_image.gaussians_0"]
+
+        call_site, mean_bytes = list(stage["call_sites"].items())[0]
+
+        assert call_site.startswith(__file__)
+        assert mean_bytes >= 100000
+        assert stage["mean_net_bytes"] >= 100000
+
+    def test__fit_is_traced_by_memory_profiler(self, masked_imaging_7x7, tmpdir):
+
+        path = "{}/profiling".format(tmpdir)
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            profiler=profiling.MemoryProfiler(
+                path=path, output_interval=1, snapshot_interval=1
+            ),
+        )
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+        ]
+
+        analysis.fit(instance=instance)
+
+        stages = load_summary(path=path)["stages"]
+
+        assert "call_sites" in stages["profile_image.gaussians_0"]
+        assert not tracemalloc.is_tracing()
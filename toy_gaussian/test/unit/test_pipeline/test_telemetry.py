@@ -0,0 +1,90 @@
+import json
+
+import autofit as af
+
+import toy_gaussian as toy
+from toy_gaussian.src.pipeline import telemetry as tel
+from toy_gaussian.src.pipeline.phase.imaging import likelihood_cache as lc
+from toy_gaussian.src.pipeline.phase.imaging.analysis import Analysis
+
+
+def load_records(file_path):
+
+    with open(file_path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestTelemetry:
+    def test__records_are_appended_at_interval(self, tmpdir):
+
+        file_path = "{}/telemetry.jsonl".format(tmpdir)
+
+        telemetry = tel.Telemetry(file_path=file_path, output_interval=0.0)
+
+        telemetry.add(name="likelihood", seconds=0.0)
+        telemetry.add(name="visualization", seconds=0.0)
+        telemetry.output(final=True)
+
+        records = load_records(file_path=file_path)
+
+        assert len(records) == 3
+        assert [record["evaluations"] for record in records] == [1, 1, 1]
+        assert records[-1]["final"] is True
+        assert set(records[-1]["fractions"]) == {
+            "likelihood",
+            "visualization",
+            "io",
+            "sampler",
+        }
+        assert "cache_hit_rate" not in records[-1]
+
+    def test__fractions__io_is_subtracted_from_likelihood(self, tmpdir):
+
+        telemetry = tel.Telemetry(file_path="{}/telemetry.jsonl".format(tmpdir))
+
+        telemetry.seconds["likelihood"] = 6.0
+        telemetry.seconds["io"] = 2.0
+        telemetry.seconds["visualization"] = 1.0
+
+        fractions = telemetry.fractions(elapsed_seconds=10.0)
+
+        assert fractions["likelihood"] == 0.4
+        assert fractions["io"] == 0.2
+        assert fractions["visualization"] == 0.1
+        assert abs(fractions["sampler"] - 0.3) < 1.0e-8
+
+
+class TestAnalysis:
+    def test__fit_and_cache_hits_are_recorded(self, masked_imaging_7x7, tmpdir):
+
+        file_path = "{}/telemetry.jsonl".format(tmpdir)
+
+        likelihood_cache = lc.LikelihoodCache(fingerprint="fingerprint")
+
+        analysis = Analysis(
+            masked_imaging=masked_imaging_7x7,
+            likelihood_cache=likelihood_cache,
+            telemetry=tel.Telemetry(
+                file_path=file_path,
+                output_interval=1.0e8,
+                likelihood_cache=likelihood_cache,
+            ),
+        )
+
+        instance = af.ModelInstance()
+        instance.gaussians = [
+            toy.SphericalGaussian(centre=(0.0, 0.0), intensity=1.0, sigma=0.5)
+        ]
+
+        analysis.fit(instance=instance)
+        analysis.fit(instance=instance)
+
+        analysis.telemetry.output(final=True)
+
+        record = load_records(file_path=file_path)[0]
+
+        assert record["evaluations"] == 2
+        assert record["cache_hits"] == 1
+        assert record["cache_misses"] == 1
+        assert record["cache_hit_rate"] == 0.5
+        assert analysis.__getstate__()["telemetry"] is None
@@ -23,6 +23,34 @@ def set_config_path():
     )
 
 
+class TestPlotSettings:
+    def test__settings_are_shared_by_visualizers_until_config_changes(
+        self, masked_imaging_7x7, plot_path
+    ):
+
+        visualizer_0 = vis.PhaseImagingVisualizer(
+            masked_dataset=masked_imaging_7x7, image_path=plot_path
+        )
+        visualizer_1 = vis.PhaseImagingVisualizer(
+            masked_dataset=masked_imaging_7x7, image_path=plot_path
+        )
+
+        assert visualizer_0.plot_settings is visualizer_1.plot_settings
+        assert visualizer_0.plot_settings.get("dataset", "psf") is True
+        assert visualizer_0.plot_settings.get("dataset", "noise_map") is False
+        assert ("dataset", "psf") in visualizer_0.plot_settings.settings
+
+        conf.instance = conf.Config(
+            path.join(directory, "../test_files/plot"), path.join(directory, "output")
+        )
+
+        visualizer_2 = vis.PhaseImagingVisualizer(
+            masked_dataset=masked_imaging_7x7, image_path=plot_path
+        )
+
+        assert visualizer_2.plot_settings is not visualizer_0.plot_settings
+
+
 class TestPhaseImagingVisualizer:
     def test__visualizes_imaging_using_configs(
         self, masked_imaging_7x7, include_all, plot_path, plot_patch
@@ -81,6 +109,53 @@ class TestPhaseImagingVisualizer:
 
         assert image.shape == (5, 5)
 
+    def test__unchanged_fit_during_analysis__is_not_visualized_again(
+        self,
+        masked_imaging_7x7,
+        fit_imaging_7x7,
+        gaussians,
+        include_all,
+        plot_path,
+        plot_patch,
+    ):
+
+        visualizer = vis.PhaseImagingVisualizer(
+            masked_dataset=masked_imaging_7x7, image_path=plot_path
+        )
+
+        visualizer.visualize_fit(
+            fit=fit_imaging_7x7, gaussians=gaussians, during_analysis=True
+        )
+
+        assert plot_path + "fit_imaging/image.png" in plot_patch.paths
+        assert plot_path + "fit_imaging/model_image.png" in plot_patch.paths
+
+        plot_patch.paths = []
+
+        visualizer.visualize_fit(
+            fit=fit_imaging_7x7, gaussians=gaussians, during_analysis=True
+        )
+
+        assert plot_patch.paths == []
+
+        visualizer.fit_fingerprint = None
+
+        visualizer.visualize_fit(
+            fit=fit_imaging_7x7, gaussians=gaussians, during_analysis=True
+        )
+
+        assert plot_path + "fit_imaging/image.png" not in plot_patch.paths
+        assert plot_path + "fit_imaging/model_image.png" in plot_patch.paths
+
+        plot_patch.paths = []
+
+        visualizer.visualize_fit(
+            fit=fit_imaging_7x7, gaussians=gaussians, during_analysis=False
+        )
+
+        assert plot_path + "fit_imaging/image.png" in plot_patch.paths
+        assert plot_path + "fit_imaging/model_image.png" in plot_patch.paths
+
 
 class TestPhaseInterferometerVisualizer:
     def test__visualizes_interferometer_using_configs(
@@ -0,0 +1,93 @@
+import multiprocessing
+
+from toy_gaussian.src.pipeline import visualizer_worker as vw
+
+
+class MockInstance(object):
+    def __init__(self, value):
+
+        self.value = value
+        self.gaussians = []
+
+
+class MockVisualizer(object):
+    def __init__(self, path):
+
+        self.path = path
+
+    def visualize_fit(self, fit, gaussians, during_analysis):
+
+        with open("{}/frames".format(self.path), "a") as f:
+            f.write("{} {}\n".format(fit, during_analysis))
+
+
+class MockAnalysis(object):
+    def __init__(self, path):
+
+        self.visualizer = MockVisualizer(path=path)
+
+    def masked_imaging_fit_from_instance(self, instance):
+        return instance.value
+
+
+def load_frames(path):
+
+    with open("{}/frames".format(path)) as f:
+        return [line.split() for line in f]
+
+
+class TestFrameSlot:
+    def test__put__replaces_frame_not_yet_taken(self):
+
+        with multiprocessing.Manager() as manager:
+
+            frames = vw.FrameSlot(manager=manager)
+
+            frames.put((1, True))
+            frames.put((2, True))
+
+            assert frames.get() == ((2, True), False)
+
+            frames.put((3, False))
+            frames.stop()
+
+            assert frames.get() == ((3, False), True)
+
+            frames.stop()
+
+            assert frames.get() == (None, True)
+
+
+class TestVisualizerWorker:
+    def test__final_frame_is_visualized_and_stops_worker(self, tmpdir):
+
+        path = str(tmpdir)
+
+        worker = vw.VisualizerWorker(analysis=MockAnalysis(path=path))
+
+        for value in range(5):
+            worker.visualize(instance=MockInstance(value=value), during_analysis=True)
+
+        worker.visualize(instance=MockInstance(value=5), during_analysis=False)
+
+        assert worker.process is None
+        assert worker.frames is None
+
+        frames = load_frames(path=path)
+
+        assert frames[-1] == ["5", "False"]
+        assert all(during_analysis == "True" for _, during_analysis in frames[:-1])
+        assert [int(value) for value, _ in frames] == sorted(
+            int(value) for value, _ in frames
+        )
+
+    def test__worker_restarted_after_being_stopped(self, tmpdir):
+
+        path = str(tmpdir)
+
+        worker = vw.VisualizerWorker(analysis=MockAnalysis(path=path))
+
+        worker.visualize(instance=MockInstance(value=0), during_analysis=False)
+        worker.visualize(instance=MockInstance(value=1), during_analysis=False)
+
+        assert load_frames(path=path) == [["0", "False"], ["1", "False"]]
@@ -152,6 +152,32 @@ class TestGaussianPlotterPlots:
 
         assert arr.shape == (13, 13)
 
+    def test__plot_array__raster__outputs_png_without_matplotlib_unless_annotated(
+        self, plot_path, plot_patch
+    ):
+
+        plot_path = plot_path + "/raster/"
+
+        if os.path.exists(plot_path):
+            shutil.rmtree(plot_path)
+
+        array = aa.array.ones(shape_2d=(31, 31), pixel_scales=(1.0, 1.0), sub_size=2)
+
+        plotter = aplt.Plotter(
+            output=aplt.Output(path=plot_path, filename="array", format="png")
+        )
+
+        plotter.plot_array(array=array, raster=True)
+
+        assert plot_patch.paths == []
+
+        with open(plot_path + "array.png", "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+        plotter.plot_array(array=array, gaussian_centres=[(1.0, 1.0)], raster=True)
+
+        assert plot_path + "array.png" in plot_patch.paths
+
     def test__plot_grid__works_with_all_extras_included(self, plot_path, plot_patch):
         grid = aa.grid.uniform(shape_2d=(11, 11), pixel_scales=1.0)
         color_array = np.linspace(start=0.0, stop=1.0, num=grid.shape_1d)
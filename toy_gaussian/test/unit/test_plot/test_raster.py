@@ -0,0 +1,91 @@
+import struct
+import zlib
+
+import numpy as np
+
+from toy_gaussian.src.plot import raster
+
+
+class TestColormapLookupTable:
+    def test__lookup_table_spans_colormap(self):
+
+        lookup_table = raster.colormap_lookup_table(cmap="gray")
+
+        assert lookup_table.shape == (256, 3)
+        assert lookup_table.dtype == np.uint8
+        assert (lookup_table[0] == np.array([0, 0, 0])).all()
+        assert (lookup_table[-1] == np.array([255, 255, 255])).all()
+
+
+class TestIndexes:
+    def test__linear_norm__array_min_and_max_map_to_first_and_last_colors(self):
+
+        indexes = raster.indexes_from_array_2d(
+            array_2d=np.array([[0.0, 1.0], [2.0, 4.0]]), size=5
+        )
+
+        assert (indexes == np.array([[0, 1], [2, 4]])).all()
+
+    def test__norm_min_and_max__clip_values(self):
+
+        indexes = raster.indexes_from_array_2d(
+            array_2d=np.array([[-1.0, 1.0], [2.0, 10.0]]),
+            size=5,
+            norm_min=0.0,
+            norm_max=4.0,
+        )
+
+        assert (indexes == np.array([[0, 1], [2, 4]])).all()
+
+    def test__log_norm(self):
+
+        indexes = raster.indexes_from_array_2d(
+            array_2d=np.array([[1.0, 10.0, 100.0]]), size=3, norm="log"
+        )
+
+        assert (indexes == np.array([[0, 1, 2]])).all()
+
+    def test__uniform_array__maps_to_first_color(self):
+
+        indexes = raster.indexes_from_array_2d(array_2d=np.ones((2, 2)), size=5)
+
+        assert (indexes == np.zeros((2, 2))).all()
+
+
+class TestPng:
+    def test__png_header_and_pixels(self):
+
+        rgb = raster.rgb_from_array_2d(
+            array_2d=np.array([[0.0, 1.0], [1.0, 0.0]]), cmap="gray", scale=2
+        )
+
+        assert rgb.shape == (4, 4, 3)
+
+        png = raster.png_from_rgb(rgb=rgb)
+
+        assert png[:8] == raster.png_signature
+
+        length, chunk_type = struct.unpack(">I4s", png[8:16])
+        columns, rows, bit_depth, color_type = struct.unpack(">IIBB", png[16:26])
+
+        assert chunk_type == b"IHDR"
+        assert (columns, rows, bit_depth, color_type) == (4, 4, 8, 2)
+
+        idat_start = 8 + 12 + length
+        idat_length = struct.unpack(">I", png[idat_start : idat_start + 4])[0]
+        scanlines = np.frombuffer(
+            zlib.decompress(png[idat_start + 8 : idat_start + 8 + idat_length]),
+            dtype="uint8",
+        ).reshape(4, 13)
+
+        assert (scanlines[:, 0] == 0).all()
+        assert (scanlines[:, 1:].reshape(4, 4, 3) == rgb).all()
+
+    def test__output_array_2d_to_png(self, tmpdir):
+
+        file_path = "{}/thumbnails/array.png".format(tmpdir)
+
+        raster.output_array_2d_to_png(array_2d=np.ones((3, 3)), file_path=file_path)
+
+        with open(file_path, "rb") as f:
+            assert f.read(8) == raster.png_signature
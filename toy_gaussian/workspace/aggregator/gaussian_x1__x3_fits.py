@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import autofit as af
+import toy_gaussian as toy
 
 # The aggregator allows us to load a set of results which were generated by running the same pipeline and phase.
 
@@ -101,3 +102,27 @@ print(results)
 # We can also grab an instance of the dataset that was passed down the pipeline
 instance = aggregator[0].dataset
 print(instance.data)
+
+# Every list above holds the results of every fit in memory, and is only returned once every fit has been loaded. For
+# an output folder of thousands of fits, we can instead stream the results one fit at a time. The next few fits are
+# loaded from the hard-disk by background threads whilst we use the current one, so the first result is available
+# immediately and memory use does not grow with the number of fits.
+
+phase_outputs = aggregator.filter(pipeline=pipeline_name, phase=phase_name)
+
+for most_likely_model_instance in toy.aggregator.stream.most_likely_model_instances(
+    phase_outputs=phase_outputs, prefetch=4
+):
+    print(most_likely_model_instance)
+
+# The most probable model of every fit above is computed one fit at a time. To summarize the posteriors of a large
+# population of fits, we can compute the median and credible interval of every parameter of every fit in parallel.
+# This gives one array per parameter, of shape (total_fits, 3), with the lower limit, median and upper limit of the
+# parameter in each fit.
+
+posterior_summaries = toy.aggregator.posterior.posterior_summaries(
+    phase_outputs=phase_outputs, credible_interval=0.6827, number_of_cores=4
+)
+
+for param_name, summary in posterior_summaries.items():
+    print(param_name, summary[:, 1])
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import autofit as af
+import toy_gaussian as toy
+
+# In 'aggregator/gaussian_x1__x3_fits.py' we loaded the results of a set of fits with the aggregator and printed them.
+# Printing results is fine for a few fits, but to review a batch of hundreds of fits we want to see them. This script
+# renders thumbnails of the image, most likely model image and residual map of every fit and combines them into one
+# contact sheet.
+
+# To begin, we setup the path to the toy_gaussian_workspace and our output folder.
+workspace_path = Path(__file__).parent.parent
+output_path = workspace_path / "output/"
+
+# Now we'll ue this path to explicitly set the config path and output path.
+af.conf.instance = af.conf.Config(
+    config_path=str(workspace_path / "config"), output_path=str(output_path)
+)
+
+# As before, we load the results of the pipeline's final phase with the aggregator.
+
+output_folder = "gaussian_x1__x3_fits/"
+pipeline_name = "pipeline_main__x1_gaussian"
+phase_name = "phase_1__x1_gaussian_final"
+
+aggregator = af.Aggregator(directory=str(output_path / output_folder))
+
+phase_outputs = aggregator.filter(pipeline=pipeline_name, phase=phase_name)
+
+# The thumbnails are rendered by worker processes, each of which loads a fit's dataset and most likely model from the
+# hard-disk and writes its pngs directly from the arrays (without making matplotlib figures). Lets use 4 cores.
+
+toy.aggregator.output_thumbnails(
+    phase_outputs=phase_outputs,
+    output_path=str(output_path / output_folder / "thumbnails"),
+    number_of_cores=4,
+)
+
+# The output folder now contains:
+
+# - 'contact_sheet.png', a tile of every fit's image, model image and residual map.
+# - 'index.csv', which gives the row and column of every fit's tile, its chi-squared and the directory of its phase.
+# - 'thumbnails', which contains every fit's thumbnails as separate pngs.
+
+# Sorting 'index.csv' by chi-squared is a quick way to find the fits on the contact sheet which went wrong.
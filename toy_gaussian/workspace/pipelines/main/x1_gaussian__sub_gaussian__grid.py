@@ -22,6 +22,7 @@ def make_pipeline(
     bin_up_factor=None,
     optimizer_class=af.MultiNest,
     parallel=False,
+    pruning=None,
 ):
     ### SETUP PIPELINE AND PHASE NAMES, TAGS AND PATHS ###
 
@@ -45,7 +46,14 @@ def make_pipeline(
 
     # 1) Set our priors on the Gaussian's (y,x) centre such that we assume the image is centred around the Gaussian.
 
-    class GridPhase(af.as_grid_search(phase_class=toy.PhaseImaging, parallel=parallel)):
+    # If a SuccessiveHalving object is passed as pruning, every cell of the grid is first fitted with a short budget
+    # and only the best cells are fitted to full convergence.
+
+    class GridPhase(
+        toy.as_grid_search(
+            phase_class=toy.PhaseImaging, parallel=parallel, pruning=pruning
+        )
+    ):
         @property
         def grid_priors(self):
             return [